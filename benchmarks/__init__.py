@@ -0,0 +1 @@
+"""Benchmarks for graphql-codegen; run a module with `python -m benchmarks.<name>`."""
@@ -0,0 +1,121 @@
+"""Time and memory of building the IR and the template data from it.
+
+    python -m benchmarks.ir [TYPE_COUNT]
+
+The schema is parsed once up front; the timed steps are decoding it from the
+parse cache encoding (pure IR construction) and collect_types. As a baseline,
+the same encoding is also decoded into pydantic models mirroring the IR, which
+is what the IR was before it became slotted dataclasses.
+"""
+
+import marshal
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from pydantic import BaseModel
+
+from graphql_codegen.config import CodegenConfig
+from graphql_codegen.generator import collect_types
+from graphql_codegen.parser import parse_schema
+from graphql_codegen.schema_cache import decode_schema_info, encode_schema_info
+
+from .synthetic import SchemaShape, make_synthetic_schema
+
+# Seven fields per type: about 100k fields
+TYPE_COUNT = 14_000
+SHAPE = {"fields_per_type": 5}  # plus the two inherited interface fields
+
+
+class DirectiveModel(BaseModel):
+    name: str
+    args: Dict[str, Any]
+
+
+class FieldModel(BaseModel):
+    name: str
+    type_name: str
+    is_list: bool = False
+    is_required: bool = False
+    directives: List[DirectiveModel] = []
+
+
+class TypeModel(BaseModel):
+    name: str
+    fields: List[FieldModel] = []
+    directives: List[DirectiveModel] = []
+    kind: str = "object"
+    interfaces: List[str] = []
+    union_types: List[str] = []
+
+
+def decode_pydantic(data: bytes) -> List[TypeModel]:
+    """decode_schema_info's types, built as pydantic models instead."""
+    _, types, _, _ = marshal.loads(data)
+    return [
+        TypeModel(
+            name=name,
+            kind=kind,
+            fields=[
+                FieldModel(
+                    name=f_name,
+                    type_name=type_name,
+                    is_list=is_list,
+                    is_required=is_required,
+                    directives=_directives(f_directives),
+                )
+                for f_name, type_name, is_list, is_required, f_directives in fields
+            ],
+            directives=_directives(directives),
+            interfaces=interfaces,
+            union_types=union_types,
+        )
+        for name, kind, fields, directives, interfaces, union_types in types
+    ]
+
+
+def _directives(encoded: List[Any]) -> List[DirectiveModel]:
+    return [DirectiveModel(name=n, args=a) for n, a in encoded]
+
+
+def measure(build: Callable[[], Any]) -> Tuple[float, float]:
+    """Best-of-three seconds, and MiB still allocated by one more result."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = build()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return best, retained / 2**20
+
+
+def main(type_count: int = TYPE_COUNT):
+    config = CodegenConfig(
+        package="bench", runtime_package="bench.runtime", codegen_version="0.1"
+    )
+    encoded = encode_schema_info(
+        parse_schema(
+            make_synthetic_schema(SchemaShape(types=type_count, **SHAPE)),
+            validate=False,
+        )
+    )
+    schema_info = decode_schema_info(encoded)
+    field_count = sum(len(t.fields) for t in schema_info.types)
+    print(f"{type_count} types, {field_count} fields")
+
+    for label, build in [
+        ("build SchemaInfo", lambda: decode_schema_info(encoded)),
+        ("build pydantic IR", lambda: decode_pydantic(encoded)),
+        ("collect_types", lambda: collect_types(schema_info, config)),
+    ]:
+        seconds, mib = measure(build)
+        print(f"{label:>18}: {seconds:.3f} s, {mib:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,48 @@
+"""Compare the validating parse with fast_parse on synthetic schemas.
+
+python -m benchmarks.parse [TYPE_COUNT ...]
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from graphql_codegen.parser import parse_schema
+
+from .synthetic import SchemaShape, make_synthetic_schema
+
+SIZES = [1_000, 5_000, 20_000]
+
+
+def measure(parse: Callable[[], object]) -> Tuple[float, float]:
+    """Best-of-three seconds, and peak traced MiB of one more run."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        parse()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    parse()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak / 2**20
+
+
+def main(sizes=SIZES):
+    print(
+        f"{'types':>8} {'validate s':>11} {'fast s':>8} {'speedup':>8} "
+        f"{'validate MiB':>13} {'fast MiB':>9}"
+    )
+    for size in sizes:
+        text = make_synthetic_schema(SchemaShape(types=size))
+        slow_s, slow_mb = measure(lambda: parse_schema(text))
+        fast_s, fast_mb = measure(lambda: parse_schema(text, validate=False))
+        print(
+            f"{size:>8} {slow_s:>11.3f} {fast_s:>8.3f} {slow_s / fast_s:>7.1f}x "
+            f"{slow_mb:>13.1f} {fast_mb:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
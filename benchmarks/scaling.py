@@ -0,0 +1,176 @@
+"""Time each generation phase across schema sizes and record the results.
+
+    python -m benchmarks.scaling [--sizes 1000 5000 20000] [--fields 8] ...
+    python -m benchmarks.scaling --compare benchmarks/results/OLD.json
+
+Each size runs a full uncached generate_from_directory on a seeded synthetic
+schema, and the phases from GenerationResult.timings are summed into parse,
+collect, render and write. Peak memory comes from one more run under
+tracemalloc. The growth column is the exponent between consecutive sizes:
+about 1 is linear, about 2 quadratic.
+
+Results are written as JSON to benchmarks/results/ (or --output) so that runs
+can be compared over time with --compare.
+"""
+
+import argparse
+import dataclasses
+import json
+import math
+import platform
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from graphql_codegen import __version__
+from graphql_codegen.config import CodegenConfig
+from graphql_codegen.generator import generate_from_directory
+
+from .synthetic import SchemaShape, make_synthetic_schema
+
+SIZES = [1_000, 5_000, 20_000]
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Phase names from graphql_codegen.timings, by the bucket they count towards
+BUCKETS = {
+    "parse": ("build_schema", "parse_schema_info", "fast_parse"),
+    "collect": ("collect_types",),
+    "render": ("fingerprint_types", "render_type_blocks", "render "),
+    "write": ("write ",),
+}
+COLUMNS = [*BUCKETS, "total"]
+
+
+def run_once(schema_dir: Path, config: CodegenConfig) -> Dict[str, float]:
+    """Seconds per bucket, and in total, of one uncached generation."""
+    start = time.perf_counter()
+    result = generate_from_directory(schema_dir, override_config=config)
+    total = time.perf_counter() - start
+    if not result.success:
+        raise RuntimeError(result.error)
+    seconds = {"total": total}
+    for bucket, prefixes in BUCKETS.items():
+        seconds[bucket] = sum(
+            p.wall_ms / 1000 for p in result.timings if p.name.startswith(prefixes)
+        )
+    return seconds
+
+
+def measure(shape: SchemaShape, repeat: int, fast_parse: bool) -> Dict[str, Any]:
+    """Best-of-repeat seconds per bucket, plus peak traced MiB, for one shape."""
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_dir = Path(tmp) / "schema"
+        schema_dir.mkdir()
+        (schema_dir / "schema.graphql").write_text(make_synthetic_schema(shape))
+        config = CodegenConfig(
+            package="bench",
+            runtime_package="bench.runtime",
+            codegen_version="0.1",
+            scalars={"DateTime": "datetime.datetime"},
+            cache=False,
+            fast_parse=fast_parse,
+        )
+
+        runs = [run_once(schema_dir, config) for _ in range(repeat)]
+        best = {column: min(run[column] for run in runs) for column in COLUMNS}
+
+        tracemalloc.start()
+        run_once(schema_dir, config)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"types": shape.types, **best, "peak_mib": peak / 2**20}
+
+
+def growth(rows: List[Dict[str, Any]], i: int, column: str) -> str:
+    """Exponent k in time ~ types**k between row i-1 and row i."""
+    if i == 0:
+        return ""
+    before, after = rows[i - 1], rows[i]
+    if before[column] <= 0 or after[column] <= 0:
+        return ""
+    k = math.log(after[column] / before[column]) / math.log(
+        after["types"] / before["types"]
+    )
+    return f"^{k:.2f}"
+
+
+def print_curves(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'types':>8}" + "".join(f"{c + ' s':>17}" for c in COLUMNS) + "   peak MiB")
+    for i, row in enumerate(rows):
+        cells = "".join(f"{row[c]:>10.3f}{growth(rows, i, c):>7}" for c in COLUMNS)
+        print(f"{row['types']:>8}{cells}{row['peak_mib']:>11.1f}")
+
+
+def print_comparison(rows: List[Dict[str, Any]], baseline: Dict[str, Any]) -> None:
+    """Ratio of each measurement to the baseline run's at the same size."""
+    before = {row["types"]: row for row in baseline["rows"]}
+    print(f"\nvs {baseline['created']} (codegen {baseline['codegen_version']}):")
+    for row in rows:
+        old = before.get(row["types"])
+        if old is None:
+            continue
+        ratios = "  ".join(
+            f"{c} {row[c] / old[c]:.2f}x" for c in [*COLUMNS, "peak_mib"] if old.get(c)
+        )
+        print(f"{row['types']:>8}  {ratios}")
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    defaults = SchemaShape()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.scaling", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--fields", type=int, default=defaults.fields_per_type)
+    parser.add_argument("--interface-depth", type=int, default=defaults.interface_depth)
+    parser.add_argument("--union-width", type=int, default=defaults.union_width)
+    parser.add_argument("--enums", type=int, default=defaults.enums)
+    parser.add_argument(
+        "--directive-density", type=float, default=defaults.directive_density
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--fast-parse", action="store_true")
+    parser.add_argument("--output", type=Path, help="JSON file for the results")
+    parser.add_argument("--compare", type=Path, help="earlier results to compare")
+    args = parser.parse_args(argv)
+
+    rows = []
+    for size in args.sizes:
+        shape = SchemaShape(
+            types=size,
+            fields_per_type=args.fields,
+            interface_depth=args.interface_depth,
+            union_width=args.union_width,
+            enums=args.enums,
+            directive_density=args.directive_density,
+            seed=args.seed,
+        )
+        rows.append(measure(shape, args.repeat, args.fast_parse))
+    print_curves(rows)
+
+    created = time.strftime("%Y-%m-%dT%H:%M:%S")
+    report = {
+        "created": created,
+        "codegen_version": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "shape": {**dataclasses.asdict(shape), "types": args.sizes},
+        "fast_parse": args.fast_parse,
+        "repeat": args.repeat,
+        "rows": rows,
+    }
+    output = args.output or RESULTS_DIR / f"scaling-{created.replace(':', '')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        print_comparison(rows, json.loads(args.compare.read_text()))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Time schema_lines slicing of a large base_schema file.
+
+    python -m benchmarks.slicing [SIZE_MB]
+
+Reports building the line index once, then slices served from the in-memory
+index and from the on-disk index (as a fresh process would see it).
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from graphql_codegen.cache import DiskCache
+from graphql_codegen.line_index import _line_offsets
+from graphql_codegen.parser import extract_schema_lines
+
+from .synthetic import SchemaShape, make_synthetic_schema
+
+SIZE_MB = 500
+
+
+def timed(label: str, path: Path, spec: str, cache: DiskCache) -> None:
+    start = time.perf_counter()
+    text = extract_schema_lines(path, spec, cache)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>24}: {elapsed * 1000:9.2f} ms ({len(text)} chars)")
+
+
+def main(size_mb: int = SIZE_MB):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "schema.graphql"
+        block = make_synthetic_schema(SchemaShape(types=1_000)).encode()
+        with open(path, "wb") as f:
+            for _ in range(-(-size_mb * 2**20 // len(block))):
+                f.write(block)
+        line_count = path.read_bytes().count(b"\n")
+        print(f"{path.stat().st_size / 2**20:.0f} MiB, {line_count} lines")
+
+        cache = DiskCache(Path(tmp) / "cache", 2**31)
+        middle = line_count // 2
+        timed("first slice (index)", path, "1-60", cache)
+        timed("slice, index in memory", path, f"{middle}-{middle + 60}", cache)
+        _line_offsets.cache_clear()
+        timed("slice, index on disk", path, f"{line_count - 60}-{line_count}", cache)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
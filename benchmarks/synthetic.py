@@ -0,0 +1,83 @@
+"""Synthetic SDL of any size, shaped like the schemas in test/inputs."""
+
+import random
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass(frozen=True)
+class SchemaShape:
+    """Knobs of make_synthetic_schema; the same shape and seed give the same SDL."""
+
+    types: int = 1_000
+    fields_per_type: int = 8
+    interface_depth: int = 2  # interfaces in each inheritance chain
+    union_width: int = 3  # members per union, one union per 50 types (0 = none)
+    enums: int = 10
+    directive_density: float = 0.2  # share of types and fields with a directive
+    seed: int = 0
+
+
+SCALARS = ["ID", "String", "Int", "Float", "Boolean", "DateTime"]
+
+
+def make_synthetic_schema(shape: SchemaShape) -> str:
+    """Seeded random SDL of the given shape, valid for build_schema.
+
+    Objects implement one of up to ten interface chains, so every interface
+    field they inherit is redeclared. Other fields pick a scalar, enum or
+    object type at random, sometimes as a list, sometimes required.
+    """
+    rng = random.Random(shape.seed)
+    parts: List[str] = [
+        "directive @compute(fn: String!) on FIELD_DEFINITION",
+        "directive @expand(into: String!) on OBJECT | FIELD_DEFINITION",
+        "scalar DateTime",
+    ]
+    for i in range(shape.enums):
+        values = " ".join(f"V{i}_{v}" for v in range(rng.randint(2, 6)))
+        parts.append(f"enum Enum{i} {{ {values} }}")
+
+    chains = []
+    for c in range(min(10, shape.types) if shape.interface_depth else 0):
+        chain = [f"Iface{c}_{d}" for d in range(shape.interface_depth)]
+        for d, name in enumerate(chain):
+            # Most derived first, so the generated classes have a valid MRO
+            implements = f" implements {' & '.join(chain[d - 1 :: -1])}" if d else ""
+            fields = "".join(f"\n  iface{e}: String" for e in range(d + 1))
+            parts.append(f"interface {name}{implements} {{{fields}\n}}")
+        chains.append(chain)
+
+    enum_names = [f"Enum{i}" for i in range(shape.enums)]
+    for i in range(shape.types):
+        chain = chains[i % len(chains)] if chains else []
+        implements = f" implements {' & '.join(reversed(chain))}" if chain else ""
+        expand = (
+            ' @expand(into: "{}")' if rng.random() < shape.directive_density else ""
+        )
+        fields = [f"  iface{e}: String" for e in range(len(chain))]
+        for j in range(shape.fields_per_type):
+            kind = rng.random()
+            if kind < 0.5:
+                type_name = rng.choice(SCALARS)
+            elif kind < 0.7 and enum_names:
+                type_name = rng.choice(enum_names)
+            else:
+                type_name = f"Type{rng.randrange(shape.types)}"
+            if rng.random() < 0.5:
+                type_name += "!"
+            if rng.random() < 0.2:
+                type_name = f"[{type_name}]"
+            directive = ""
+            if rng.random() < shape.directive_density:
+                directive = f' @compute(fn: "fn{j}")'
+            fields.append(f"  field{j}: {type_name}{directive}")
+        body = "\n".join(fields)
+        parts.append(f"type Type{i}{implements}{expand} {{\n{body}\n}}")
+
+    if shape.union_width:
+        for u in range(max(1, shape.types // 50)):
+            width = min(shape.union_width, shape.types)
+            members = rng.sample(range(shape.types), width)
+            parts.append(f"union Union{u} = {' | '.join(f'Type{m}' for m in members)}")
+    return "\n\n".join(parts) + "\n"
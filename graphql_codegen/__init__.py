@@ -2,6 +2,21 @@
 
 __version__ = "0.1.0"
 
-from .generator import generate_from_directory
+# Public names by the module defining them, imported on first use so that
+# the CLI starts without the generator
+_EXPORTS = {
+    "generate_from_directory": "generator",
+    "generate_from_sdl": "generator",
+    "generate_many": "generator",
+    "load_package": "virtual_package",
+}
 
-__all__ = ["generate_from_directory"]
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+"""Byte-compile generated modules, so their first import does not compile them.
+
+Modes are those of `python -m compileall --invalidation-mode`. In
+"unchecked-hash" mode Python never compares a .pyc with its source, which
+suits deployments where generated code is immutable; the .pyc of a module
+is rewritten here whenever codegen rewrites the module.
+"""
+
+import importlib.util
+import os
+import py_compile
+from pathlib import Path
+from typing import Iterable, List, Set
+
+MODES = {
+    "timestamp": py_compile.PycInvalidationMode.TIMESTAMP,
+    "checked-hash": py_compile.PycInvalidationMode.CHECKED_HASH,
+    "unchecked-hash": py_compile.PycInvalidationMode.UNCHECKED_HASH,
+}
+# The .pyc flags word of each mode (PEP 552): bit 0 hash-based, bit 1 checked
+FLAGS = {"timestamp": 0, "checked-hash": 3, "unchecked-hash": 1}
+
+
+def compile_modules(
+    modules: Iterable[Path], mode: str, changed: Set[Path], jobs: int = 1
+) -> List[Path]:
+    """Compile the modules that changed or lack a current .pyc for mode.
+
+    Files are compiled in up to jobs worker processes (0 = one per CPU).
+    Returns the modules compiled.
+
+    Raises:
+        ValueError: if a module has a syntax error
+    """
+    pending = [m for m in modules if m in changed or not has_current_pyc(m, mode)]
+    workers = min(jobs or os.cpu_count() or 1, len(pending))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            list(pool.map(compile_module, pending, [mode] * len(pending)))
+    else:
+        for module in pending:
+            compile_module(module, mode)
+    return pending
+
+
+def compile_module(module: Path, mode: str) -> None:
+    """Write module's .pyc into __pycache__, as an import would."""
+    try:
+        py_compile.compile(str(module), doraise=True, invalidation_mode=MODES[mode])
+    except py_compile.PyCompileError as e:
+        # PyCompileError does not survive pickling back from a worker
+        raise ValueError(f"Failed to compile {module}: {e.msg}")
+
+
+def has_current_pyc(module: Path, mode: str) -> bool:
+    """Whether module's .pyc exists for this Python and was written in mode."""
+    try:
+        with open(importlib.util.cache_from_source(str(module)), "rb") as f:
+            header = f.read(8)
+    except FileNotFoundError:
+        return False
+    return (
+        header[:4] == importlib.util.MAGIC_NUMBER
+        and int.from_bytes(header[4:], "little") == FLAGS[mode]
+    )
@@ -0,0 +1,161 @@
+"""Persistent on-disk cache with size-capped LRU eviction."""
+
+import hashlib
+import os
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from . import __version__
+
+
+def default_cache_dir() -> Path:
+    """Cache root: $GRAPHQL_CODEGEN_CACHE_DIR, else the user cache directory."""
+    env_dir = os.environ.get("GRAPHQL_CODEGEN_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "graphql-codegen"
+
+
+def content_hash(*parts: Union[str, bytes]) -> str:
+    """Hash parts into one hex digest (length-prefixed so boundaries matter)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """__version__ plus a hash of this package's Python sources.
+
+    Cache keys include it, so code changed without a version bump (a dev
+    install, say) never reads entries written by the old code.
+    """
+    package_dir = Path(__file__).parent
+    sources = sorted(package_dir.rglob("*.py"))
+    return content_hash(
+        __version__,
+        *(
+            part
+            for path in sources
+            for part in (str(path.relative_to(package_dir)), path.read_bytes())
+        ),
+    )
+
+
+# Approximate total size of a cache's entries, kept next to them
+SIZE_FILE = ".size"
+
+
+class DiskCache:
+    """Byte store in a single directory, one file per key.
+
+    Reads and writes stamp an entry's mtime, so evicting oldest-mtime first is LRU.
+    Writes add their size to a running total instead of listing the directory,
+    which only happens to evict once that total passes max_bytes. Concurrent
+    writers may lose each other's additions; the next eviction recounts.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    # Equal by location, so caches can key in-memory memos (functools.lru_cache)
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DiskCache) and (self.root, self.max_bytes) == (
+            other.root,
+            other.max_bytes,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.root, self.max_bytes))
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.root / key
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        _touch(path)
+        return data
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """Like get, but return the entry's file for callers that map it.
+
+        Entries are replaced atomically, so an open mapping stays consistent.
+        """
+        path = self.root / key
+        try:
+            _touch(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, data: bytes) -> None:
+        self.put_many({key: data})
+
+    def put_many(self, items: Dict[str, bytes]) -> None:
+        """Store atomically so concurrent readers never see partial entries."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        for key, data in items.items():
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, self.root / key)
+            _touch(self.root / key)
+
+        size = self._read_size()
+        # Overwritten entries are counted twice, which only evicts sooner
+        size = None if size is None else size + sum(map(len, items.values()))
+        if size is None or size > self.max_bytes:
+            self.evict()
+        else:
+            self._write_size(size)
+
+    def _read_size(self) -> Optional[int]:
+        try:
+            return int((self.root / SIZE_FILE).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_size(self, size: int) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        with os.fdopen(fd, "w") as f:
+            f.write(str(size))
+        os.replace(tmp_name, self.root / SIZE_FILE)
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the total fits max_bytes.
+
+        Lists the whole directory, and records the total it leaves.
+        """
+        entries = []
+        for path in self.root.iterdir():
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._write_size(total)
+
+
+def _touch(path: Path) -> None:
+    """Stamp mtime from the precise clock; write mtimes may use a coarse one."""
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
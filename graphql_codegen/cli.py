@@ -1,60 +1,607 @@
 """Command-line interface for GraphQL Codegen."""
 
+import glob
+import io
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
 import click
 from pathlib import Path
-from .generator import generate_from_directory
 
+from . import __version__
 
-@click.command()
-@click.argument(
-    "schema_dir",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
-)
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+# The generator and its dependencies load only once a command needs them,
+# so --help, --version and runs forwarded to a server start quickly
+if TYPE_CHECKING:
+    from .config import CodegenConfig
+    from .generator import GenerationResult
+
+
+class DefaultGroup(click.Group):
+    """Group that runs `generate` when the first argument names no subcommand.
+
+    Keeps `graphql-codegen SCHEMA_DIR` working alongside the subcommands.
+    """
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        own_options = {opt for param in self.get_params(ctx) for opt in param.opts}
+        if args and args[0] not in self.commands and args[0] not in own_options:
+            args = ["generate", *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultGroup)
+@click.version_option(__version__, prog_name="graphql-codegen")
+def main():
+    """Generate Python code from GraphQL schema directories.
+
+    Running `graphql-codegen SCHEMA_DIR` is the same as `graphql-codegen generate
+    SCHEMA_DIR`.
+    """
+
+
+def schema_dir_argument(f: Callable) -> Callable:
+    return click.argument(
+        "schema_dir",
+        type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    )(f)
+
+
+def generation_options(f: Callable) -> Callable:
+    """Options overriding codegen.yaml, shared by the subcommands."""
+    options = [
+        click.option("--verbose", "-v", is_flag=True, help="Enable verbose output"),
+        click.option(
+            "--flat",
+            is_flag=True,
+            help="Generate single file instead of package structure",
+        ),
+        click.option(
+            "--no-cache", is_flag=True, help="Always parse and render from scratch"
+        ),
+        click.option(
+            "--stream", is_flag=True, help="Write output while rendering (low memory)"
+        ),
+        click.option(
+            "--no-validate",
+            is_flag=True,
+            help="Skip schema validation for a faster parse",
+        ),
+        click.option(
+            "--jobs",
+            "-j",
+            type=click.IntRange(min=0),
+            help="Render types in N worker processes (0 = one per CPU)",
+        ),
+        click.option(
+            "--bytecode",
+            type=click.Choice(["timestamp", "checked-hash", "unchecked-hash"]),
+            help="Byte-compile the generated modules, with this .pyc mode",
+        ),
+    ]
+    for option in reversed(options):
+        f = option(f)
+    return f
+
+
+def load_overridden_config(schema_dir: Path, **overrides: Any) -> "CodegenConfig":
+    """Load codegen.yaml, then apply the CLI options that were given.
+
+    Forwarded runs also pass the client's working directory as base_dir, to
+    resolve relative paths in the config against, and its default_cache_dir.
+    """
+    from .config import load_config
+
+    config = load_config(schema_dir)
+    base_dir = overrides.get("base_dir")
+    if base_dir:
+        for name in ("base_schema", "templates", "cache_dir"):
+            value = getattr(config, name)
+            if value and not Path(value).is_absolute():
+                setattr(config, name, str(Path(base_dir) / value))
+    if overrides.get("default_cache_dir") and not config.cache_dir:
+        config.cache_dir = overrides["default_cache_dir"]
+
+    if overrides.get("stdout"):
+        config.stdout = True
+    if overrides.get("flat"):
+        config.flat_output = True
+    if overrides.get("no_cache"):
+        config.cache = False
+    if overrides.get("stream"):
+        config.stream = True
+    if overrides.get("no_validate"):
+        config.fast_parse = True
+    if overrides.get("jobs") is not None:
+        config.jobs = overrides["jobs"]
+    if overrides.get("bytecode"):
+        config.bytecode = overrides["bytecode"]
+    return config
+
+
+def report(result: "GenerationResult", stdout: bool = False):
+    """Echo the outcome of a generation, raising ClickException on failure."""
+    if result.success:
+        if result.up_to_date and not stdout:
+            click.echo(
+                f"✅ Package '{result.package_name}' is up to date at: {result.output_path}"
+            )
+        elif not stdout:
+            click.echo(
+                f"✅ Generated package '{result.package_name}' at: {result.output_path}"
+            )
+    else:
+        error_msg = result.error or "Unknown error occurred"
+        click.echo(f"❌ Generation failed: {error_msg}", err=True)
+        raise click.ClickException(error_msg)
+
+
+@main.command()
+@click.argument("schema_dirs", nargs=-1, required=True)
 @click.option("--stdout", is_flag=True, help="Output to stdout instead of files")
+@generation_options
 @click.option(
-    "--flat", is_flag=True, help="Generate single file instead of package structure"
+    "--no-server", is_flag=True, help="Generate in this process even if a server runs"
 )
-def main(schema_dir: Path, verbose: bool, stdout: bool, flat: bool):
-    """Generate Python code from GraphQL schema directory.
+@click.option(
+    "--timings", is_flag=True, help="Print per-phase wall and CPU times as JSON"
+)
+@click.option(
+    "--memory",
+    is_flag=True,
+    help="Trace per-phase memory with tracemalloc (slow; implies --timings)",
+)
+@click.option(
+    "--profile",
+    "profile_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Run under cProfile and write the stats to this file",
+)
+@click.option(
+    "--depfile",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the inputs read to this Makefile-style .d file",
+)
+@click.option(
+    "--manifest",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write every generated file with its sha256 to this JSON file",
+)
+@click.pass_context
+def generate(
+    ctx: click.Context,
+    schema_dirs: Tuple[str, ...],
+    verbose: bool,
+    stdout: bool,
+    flat: bool,
+    no_cache: bool,
+    stream: bool,
+    no_validate: bool,
+    jobs: Optional[int],
+    bytecode: Optional[str],
+    no_server: bool,
+    timings: bool,
+    memory: bool,
+    profile_path: Optional[Path],
+    depfile: Optional[Path],
+    manifest: Optional[Path],
+):
+    """Generate Python code from GraphQL schema directories.
 
-    SCHEMA_DIR should contain schema.graphql and codegen.yaml files.
+    Each SCHEMA_DIR should contain schema.graphql and codegen.yaml files.
+    Quoted glob patterns such as 'schemas/*' are expanded to directories.
 
     Use --stdout to output code to stdout instead of creating files.
     Use --flat to generate a single file instead of package structure.
+    Use --no-cache to bypass the generation cache.
+    Use --jobs N to render types in parallel worker processes.
+    Use --stream to write output as it renders, keeping memory flat.
+    Use --no-validate to skip schema validation (see `graphql-codegen validate`).
+    Use --bytecode MODE to byte-compile the generated modules after writing.
+    Use --timings to print how long each phase took, as JSON on stderr.
+    Use --memory to add each phase's peak and retained memory to that report.
+    Use --profile FILE to write cProfile stats (readable with pstats or snakeviz).
+    Use --depfile FILE to list the inputs read, for make or ninja.
+    Use --manifest FILE to list the generated files with their sha256.
+
+    Several directories generate together in one batch: --jobs then sets how
+    many targets run at once, and a failing target does not stop the others.
+
+    When `graphql-codegen serve` is running, a single directory is forwarded
+    to it unless --no-server or --profile is given. --stdout and --stream runs
+    stay in this process, since the server replies only once it is done.
     """
-    try:
-        if verbose:
-            click.echo(f"Processing schema directory: {schema_dir}")
+    dirs = expand_schema_dirs(schema_dirs)
+    overrides = dict(
+        stdout=stdout,
+        flat=flat,
+        no_cache=no_cache,
+        stream=stream,
+        no_validate=no_validate,
+        jobs=jobs,
+        bytecode=bytecode,
+    )
+    if stdout and (depfile or manifest):
+        raise click.UsageError("--depfile and --manifest need files, not --stdout")
+    if len(dirs) > 1:
+        for flag, given in [
+            ("--stdout", stdout),
+            ("--timings", timings),
+            ("--memory", memory),
+            ("--profile", profile_path),
+            ("--depfile", depfile),
+            ("--manifest", manifest),
+        ]:
+            if given:
+                raise click.UsageError(f"{flag} takes a single SCHEMA_DIR")
+        ctx.exit(run_batch(dirs, verbose, overrides))
+    outputs = dict(depfile=depfile, manifest=manifest)
 
-        # Override config with CLI options
-        from .config import load_config
+    schema_dir = dirs[0]
+    if profile_path:
+        import cProfile
 
-        config = load_config(schema_dir)
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(
+                run_generation,
+                schema_dir,
+                verbose,
+                overrides,
+                timings,
+                memory,
+                **outputs,
+            )
+        finally:
+            profiler.dump_stats(profile_path)
+        return
 
-        if stdout:
-            config.stdout = True
-        if flat:
-            config.flat_output = True
+    if not (no_server or stdout or stream):
+        from .cache import default_cache_dir
+        from .server import default_socket_path, forward
 
-        result = generate_from_directory(
-            schema_dir, verbose=verbose, override_config=config
+        response = forward(
+            default_socket_path(),
+            {
+                "schema_dir": str(schema_dir.resolve()),
+                "verbose": verbose,
+                # Paths the server must not take from its own process
+                "overrides": dict(
+                    overrides,
+                    base_dir=os.getcwd(),
+                    default_cache_dir=str(default_cache_dir()),
+                ),
+                "timings": timings,
+                "memory": memory,
+                **{k: str(v.resolve()) for k, v in outputs.items() if v},
+            },
         )
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            ctx.exit(response["exit_code"])
 
-        if result.success:
-            if not stdout:
-                click.echo(
-                    f"✅ Generated package '{result.package_name}' at: {result.output_path}"
+    run_generation(schema_dir, verbose, overrides, timings, memory, **outputs)
+
+
+def expand_schema_dirs(patterns: Tuple[str, ...]) -> List[Path]:
+    """Expand glob patterns to directories, dropping duplicates."""
+    dirs: List[Path] = []
+    for pattern in patterns:
+        if any(c in pattern for c in "*?["):
+            matches = [Path(m) for m in sorted(glob.glob(pattern)) if Path(m).is_dir()]
+            if not matches:
+                raise click.BadParameter(
+                    f"No directory matches '{pattern}'.", param_hint="SCHEMA_DIRS"
                 )
+            dirs.extend(matches)
+        elif Path(pattern).is_dir():
+            dirs.append(Path(pattern))
+        else:
+            raise click.BadParameter(
+                f"Directory '{pattern}' does not exist.", param_hint="SCHEMA_DIRS"
+            )
+    return list(dict.fromkeys(dirs))
+
+
+def run_batch(dirs: List[Path], verbose: bool, overrides: Dict[str, Any]) -> int:
+    """Generate several directories together; return the exit code."""
+    from .generator import generate_many
+
+    batch = generate_many(
+        dirs,
+        verbose=verbose,
+        configure=partial(load_overridden_config, **{**overrides, "jobs": None}),
+        workers=overrides["jobs"] or 0,
+    )
+    for target in batch.targets:
+        result = target.result
+        if result.success:
+            state = "is up to date" if result.up_to_date else "generated"
+            click.echo(
+                f"✅ {target.schema_dir}: '{result.package_name}' {state} at "
+                f"{result.output_path} ({target.seconds * 1000:.0f} ms)"
+            )
         else:
-            error_msg = result.error or "Unknown error occurred"
-            click.echo(f"❌ Generation failed: {error_msg}", err=True)
-            raise click.ClickException(error_msg)
+            click.echo(f"❌ {target.schema_dir}: {result.error}", err=True)
+
+    failed = sum(not target.result.success for target in batch.targets)
+    click.echo(
+        f"{len(batch.targets) - failed} of {len(batch.targets)} targets generated "
+        f"in {batch.seconds:.2f} s"
+    )
+    return 1 if failed else 0
+
+
+def run_generation(
+    schema_dir: Path,
+    verbose: bool,
+    overrides: Dict[str, Any],
+    timings: bool = False,
+    memory: bool = False,
+    depfile: Optional[Path] = None,
+    manifest: Optional[Path] = None,
+) -> "GenerationResult":
+    """Generate one schema directory with CLI overrides and report the outcome.
+
+    On success, also write the depfile and output manifest if paths are given.
+    """
+    from .generator import generate_from_directory
+    from .timings import phase, recording
+
+    try:
+        if verbose:
+            click.echo(f"Processing schema directory: {schema_dir}")
+
+        started = time.perf_counter()
+        with recording(memory=memory):
+            # Override config with CLI options
+            with phase("load_config"):
+                config = load_overridden_config(schema_dir, **overrides)
+
+            result = generate_from_directory(
+                schema_dir, verbose=verbose, override_config=config
+            )
+        if timings or memory:
+            echo_timings(result, (time.perf_counter() - started) * 1000)
+        report(result, stdout=bool(overrides.get("stdout")))
+        if depfile or manifest:
+            write_build_files(
+                schema_dir, config, result, depfile, manifest, overrides.get("base_dir")
+            )
+        return result
 
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
         raise click.ClickException(str(e))
 
 
+def write_build_files(
+    schema_dir: Path,
+    config: "CodegenConfig",
+    result: "GenerationResult",
+    depfile: Optional[Path],
+    manifest: Optional[Path],
+    base_dir: Optional[str] = None,
+):
+    """Write the output manifest, then the depfile naming it (or the outputs).
+
+    Depfile paths are relative to base_dir, by default the working directory.
+
+    Without a manifest, outputs older than the newest input are touched, so
+    that they are up to date for make and ninja.
+    """
+    from .depfile import (
+        input_files,
+        touch_stale_targets,
+        write_depfile,
+        write_output_manifest,
+    )
+
+    if result.output_path is None:
+        return  # written to stdout
+    if manifest:
+        write_output_manifest(
+            manifest, config.package, result.output_path, result.files
+        )
+    if depfile:
+        inputs = input_files(schema_dir, config)
+        # The manifest is rewritten on every run, unlike unchanged outputs, so
+        # it makes the better target when there is one
+        if manifest:
+            targets = [manifest]
+        else:
+            targets = [result.output_path / f for f in result.files]
+            touched = touch_stale_targets(targets, inputs)
+            if config.bytecode == "timestamp":
+                from .bytecode import compile_modules
+
+                # Timestamp .pyc files record their source's mtime
+                modules = [t for t in touched if t.suffix == ".py"]
+                compile_modules(modules, "timestamp", set(modules), config.jobs)
+        write_depfile(depfile, targets, inputs, base_dir)
+
+
+def echo_timings(result: "GenerationResult", wall_ms: float):
+    """Print the phase timings of a generation as JSON on stderr."""
+    click.echo(
+        json.dumps(
+            {
+                "package": result.package_name,
+                "success": result.success,
+                "wall_ms": wall_ms,
+                "phases": [p.model_dump(exclude_none=True) for p in result.timings],
+            },
+            indent=2,
+        ),
+        err=True,
+    )
+
+
+@main.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Socket to listen on (default: $GRAPHQL_CODEGEN_SOCKET or the cache dir)",
+)
+def serve(socket_path: Optional[Path]):
+    """Serve generation requests on a Unix socket.
+
+    `graphql-codegen SCHEMA_DIR` forwards to a running server, which keeps
+    parsed schemas, templates and rendered type blocks warm across requests.
+    Requests are handled one at a time. Stop with Ctrl-C.
+    """
+    from .server import default_socket_path, serve as serve_socket
+
+    socket_path = socket_path or default_socket_path()
+    click.echo(f"🔌 Serving on {socket_path} (Ctrl-C to stop)")
+    try:
+        serve_socket(socket_path, handle_request)
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        raise click.ClickException(str(e))
+
+
+def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a forwarded generate request, capturing what it would print.
+
+    Paths in the request are absolute; the overrides carry the client's
+    working directory and cache directory.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    result = None
+    exit_code = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            result = run_generation(
+                Path(request["schema_dir"]),
+                request["verbose"],
+                request["overrides"],
+                request.get("timings", False),
+                request.get("memory", False),
+                *[
+                    Path(request[k]) if request.get(k) else None
+                    for k in ("depfile", "manifest")
+                ],
+            )
+        except click.ClickException as e:
+            e.show()
+            exit_code = e.exit_code
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "result": result.model_dump(mode="json") if result else None,
+    }
+
+
+@main.command()
+@schema_dir_argument
+def validate(schema_dir: Path):
+    """Check that the schema selected by SCHEMA_DIR's codegen.yaml is valid."""
+    from .config import load_config
+    from .parser import load_schema_text, validate_schema_text
+
+    try:
+        validate_schema_text(load_schema_text(schema_dir, load_config(schema_dir)))
+    except Exception as e:
+        raise click.ClickException(f"❌ Invalid schema: {e}")
+    click.echo(f"✅ Schema in {schema_dir} is valid")
+
+
+@main.command()
+@schema_dir_argument
+@generation_options
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.01),
+    default=0.1,
+    show_default=True,
+    help="Seconds between polls of the inputs",
+)
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=0.2,
+    show_default=True,
+    help="Seconds the inputs must be stable before regenerating",
+)
+def watch(
+    schema_dir: Path,
+    verbose: bool,
+    flat: bool,
+    no_cache: bool,
+    stream: bool,
+    no_validate: bool,
+    jobs: Optional[int],
+    bytecode: Optional[str],
+    interval: float,
+    debounce: float,
+):
+    """Regenerate whenever the inputs of SCHEMA_DIR change.
+
+    Watches schema.graphql, codegen.yaml, base_schema and the templates
+    directory. The process stays alive, so the parsed schema, templates and
+    rendered type blocks stay warm between runs. Stop with Ctrl-C.
+    """
+    from .config import CodegenConfig
+    from .generator import generate_from_directory
+    from .watch import watch as watch_inputs, watched_paths
+
+    overrides = dict(
+        flat=flat,
+        no_cache=no_cache,
+        stream=stream,
+        no_validate=no_validate,
+        jobs=jobs,
+        bytecode=bytecode,
+    )
+    paths: List[Path] = []
+
+    def get_paths() -> List[Path]:
+        # Keep the last known inputs while codegen.yaml is invalid
+        try:
+            paths[:] = watched_paths(
+                schema_dir, load_overridden_config(schema_dir, **overrides)
+            )
+        except Exception:
+            paths[:] = paths or watched_paths(
+                schema_dir, CodegenConfig.model_construct()
+            )
+        return list(paths)
+
+    def regenerate():
+        started = time.perf_counter()
+        try:
+            config = load_overridden_config(schema_dir, **overrides)
+            result = generate_from_directory(
+                schema_dir, verbose=verbose, override_config=config
+            )
+            report(result)
+        except Exception as e:
+            # Keep watching; the next save may fix it
+            click.echo(f"❌ Error: {e}", err=True)
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        changed = ", ".join(result.changed_types) or "no types"
+        click.echo(f"   {elapsed_ms:.0f} ms, changed: {changed}")
+
+    click.echo(f"👀 Watching {schema_dir} (Ctrl-C to stop)")
+    try:
+        watch_inputs(get_paths, regenerate, interval=interval, debounce=debounce)
+    except KeyboardInterrupt:
+        pass
+
+
 if __name__ == "__main__":
     main()
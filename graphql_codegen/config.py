@@ -1,9 +1,10 @@
 """Configuration parsing for codegen.yaml files."""
 
-import yaml
 from pathlib import Path
-from typing import Dict, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from .cache import DiskCache, default_cache_dir
 
 
 class CodegenConfig(BaseModel):
@@ -20,12 +21,41 @@ class CodegenConfig(BaseModel):
         False, description="Generate single file instead of package structure"
     )
     stdout: bool = Field(False, description="Output to stdout instead of files")
+    stream: bool = Field(
+        False, description="Write output while rendering, bypassing the caches"
+    )
+    sharded_models: bool = Field(
+        False, description="Split gen/models into lazily imported shard modules"
+    )
     schema_lines: Optional[str] = Field(
         None, description="Line ranges to include from schema (e.g., '1-10,15-20')"
     )
     base_schema: Optional[str] = Field(
         None, description="Path to base schema file to extract lines from"
     )
+    schema_files: Optional[str] = Field(
+        None,
+        description="Directory or glob of SDL files, relative to the schema directory",
+    )
+    roots: Optional[List[str]] = Field(
+        None, description="Generate only these types and what they reference"
+    )
+    fast_parse: bool = Field(
+        False, description="Read the SDL without validating it (faster)"
+    )
+    cache: bool = Field(True, description="Reuse results of identical generations")
+    cache_dir: Optional[str] = Field(
+        None, description="Cache directory (defaults to the user cache directory)"
+    )
+    cache_max_mb: int = Field(
+        256, description="Size cap of each cache namespace, in megabytes"
+    )
+    jobs: int = Field(
+        1, ge=0, description="Worker processes for rendering (0 = one per CPU)"
+    )
+    bytecode: Optional[Literal["timestamp", "checked-hash", "unchecked-hash"]] = Field(
+        None, description="Byte-compile generated modules, with this .pyc mode"
+    )
 
     @field_validator("package")
     @classmethod
@@ -43,9 +73,18 @@ class CodegenConfig(BaseModel):
             raise ValueError(f"Unsupported codegen version '{v}'. Expected '0.1'")
         return v
 
+    @model_validator(mode="after")
+    def validate_schema_source(self) -> "CodegenConfig":
+        """Ensure at most one way of selecting the schema is configured."""
+        if self.schema_files and self.base_schema:
+            raise ValueError("schema_files and base_schema cannot be combined")
+        return self
+
 
 def load_config(schema_dir: Path) -> CodegenConfig:
     """Load and validate codegen.yaml from schema directory."""
+    import yaml
+
     config_path = schema_dir / "codegen.yaml"
 
     if not config_path.exists():
@@ -63,6 +102,21 @@ def load_config(schema_dir: Path) -> CodegenConfig:
         raise ValueError(f"Invalid configuration in {config_path}: {e}")
 
 
+def cache_root(config: CodegenConfig) -> Optional[Path]:
+    """Directory holding every cache namespace, or None when caching is disabled."""
+    if not config.cache:
+        return None
+    return Path(config.cache_dir) if config.cache_dir else default_cache_dir()
+
+
+def open_cache(config: CodegenConfig, namespace: str) -> Optional[DiskCache]:
+    """Open one cache namespace, or None when caching is disabled."""
+    root = cache_root(config)
+    if root is None:
+        return None
+    return DiskCache(root / namespace, config.cache_max_mb * 1024 * 1024)
+
+
 def get_output_path(config: CodegenConfig, schema_dir: Path) -> Path:
     """Determine output path for generated package."""
     # Output goes to test/outputs/<package_name> for test cases
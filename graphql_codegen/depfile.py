@@ -0,0 +1,101 @@
+"""Depfiles and output manifests, so build systems can skip codegen precisely.
+
+A depfile names the inputs a generation read, in the Makefile `.d` format
+that make and ninja both read. An output manifest lists every generated file
+with its sha256, for build steps that depend on the generated code.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import CodegenConfig
+
+
+def input_files(schema_dir: Path, config: CodegenConfig) -> List[Path]:
+    """Every file the generation of schema_dir with config reads.
+
+    That is codegen.yaml, the schema (schema.graphql, the schema_files or the
+    base_schema being sliced) and the templates, both user and bundled.
+    """
+    from .schema_files import find_schema_files
+    from .templates import template_search_path
+
+    inputs = [schema_dir / "codegen.yaml"]
+    if config.schema_files:
+        inputs.extend(find_schema_files(schema_dir, config.schema_files))
+    elif config.base_schema and config.schema_lines:
+        inputs.append(Path.cwd() / config.base_schema)
+    else:
+        inputs.append(schema_dir / "schema.graphql")
+    for directory in template_search_path(config):
+        inputs.extend(sorted(Path(directory).glob("*.j2")))
+    return inputs
+
+
+def depfile_text(
+    targets: List[Path], inputs: List[Path], base_dir: Optional[str] = None
+) -> str:
+    """One make rule: targets depend on inputs, one input per line.
+
+    Paths are written relative to base_dir (default: the working directory).
+    """
+    lines = [" ".join(_escape(t, base_dir) for t in targets) + ":"]
+    lines.extend(f"  {_escape(path, base_dir)}" for path in inputs)
+    return " \\\n".join(lines) + "\n"
+
+
+def output_manifest(output_path: Path, files: List[str]) -> Dict[str, str]:
+    """sha256 of each generated file, keyed by path relative to output_path."""
+    return {
+        relative: hashlib.sha256((output_path / relative).read_bytes()).hexdigest()
+        for relative in sorted(files)
+    }
+
+
+def write_depfile(
+    path: Path,
+    targets: List[Path],
+    inputs: List[Path],
+    base_dir: Optional[str] = None,
+) -> None:
+    """Write the depfile, always: make compares its targets' mtimes to inputs."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(depfile_text(targets, inputs, base_dir))
+
+
+def touch_stale_targets(targets: List[Path], inputs: List[Path]) -> List[Path]:
+    """Bump the mtime of targets older than the newest input; return them.
+
+    Generated files whose content did not change keep their old mtime, so
+    with them as the depfile's targets make and ninja would otherwise rerun
+    codegen on every build after an input changed.
+    """
+    newest = max((p.stat().st_mtime_ns for p in inputs if p.exists()), default=0)
+    stale = [t for t in targets if t.stat().st_mtime_ns < newest]
+    for target in stale:
+        os.utime(target)
+    return stale
+
+
+def write_output_manifest(
+    path: Path, package: str, output_path: Path, files: List[str]
+) -> None:
+    """Write the output manifest, always, so it is newer than every input."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "package": package,
+        "output_path": str(output_path),
+        "files": output_manifest(output_path, files),
+    }
+    path.write_text(json.dumps(manifest, indent=2) + "\n")
+
+
+def _escape(path: Path, base_dir: Optional[str]) -> str:
+    """path as make reads it: relative to base_dir when inside it."""
+    text = os.path.relpath(path, base_dir)
+    if text.startswith(".."):
+        text = str(Path(path).resolve())
+    return text.replace(" ", "\\ ").replace("#", "\\#").replace("$", "$$")
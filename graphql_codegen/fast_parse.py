@@ -0,0 +1,234 @@
+"""Read SchemaInfo straight from the SDL syntax tree, without validation.
+
+Each document is first read into a SchemaFragment, then fragments are merged,
+so a schema split over many files can parse (and cache) each file on its own.
+"""
+
+from sys import intern
+from typing import Any, Dict, List, Tuple
+
+from graphql import GraphQLError, parse, print_ast
+from graphql.language import (
+    DirectiveDefinitionNode,
+    EnumTypeDefinitionNode,
+    EnumTypeExtensionNode,
+    InputObjectTypeDefinitionNode,
+    InputObjectTypeExtensionNode,
+    InterfaceTypeDefinitionNode,
+    InterfaceTypeExtensionNode,
+    ListTypeNode,
+    NamedTypeNode,
+    NonNullTypeNode,
+    ObjectTypeDefinitionNode,
+    ObjectTypeExtensionNode,
+    ScalarTypeDefinitionNode,
+    ScalarTypeExtensionNode,
+    TypeDefinitionNode,
+    TypeExtensionNode,
+    TypeNode,
+    UnionTypeDefinitionNode,
+    UnionTypeExtensionNode,
+)
+
+from .parser import (
+    DefinitionInfo,
+    EnumInfo,
+    FieldInfo,
+    SchemaFragment,
+    SchemaInfo,
+    TypeInfo,
+    directives_from_ast,
+)
+
+BUILTIN_SCALARS = frozenset(["Int", "Float", "String", "Boolean", "ID"])
+
+KINDS = {
+    ScalarTypeDefinitionNode: "scalar",
+    ScalarTypeExtensionNode: "scalar",
+    EnumTypeDefinitionNode: "enum",
+    EnumTypeExtensionNode: "enum",
+    InputObjectTypeDefinitionNode: "input",
+    InputObjectTypeExtensionNode: "input",
+    UnionTypeDefinitionNode: "union",
+    UnionTypeExtensionNode: "union",
+    InterfaceTypeDefinitionNode: "interface",
+    InterfaceTypeExtensionNode: "interface",
+    ObjectTypeDefinitionNode: "object",
+    ObjectTypeExtensionNode: "object",
+}
+
+
+def parse_schema_document(schema_text: str) -> SchemaInfo:
+    """Build SchemaInfo straight from the SDL document, without validation.
+
+    Skips build_schema's validation and GraphQLSchema construction, resolving
+    types by name instead. For a valid schema the result, including the
+    order of types and scalars, equals parse_schema_info(build_schema(...)).
+    Invalid schemas are not rejected; check them with validate_schema_text.
+    """
+    return merge_fragments([("schema", parse_fragment(schema_text))])
+
+
+def parse_fragment(schema_text: str) -> SchemaFragment:
+    """Read the definitions and extensions of one SDL document."""
+    try:
+        document = parse(schema_text, no_location=True)
+    except GraphQLError as e:
+        raise ValueError(f"Failed to parse GraphQL schema: {e}")
+
+    fragment = SchemaFragment()
+    for node in document.definitions:
+        if isinstance(node, (TypeDefinitionNode, TypeExtensionNode)):
+            fragment.definitions.append(definition_info(node))
+        elif isinstance(node, DirectiveDefinitionNode):
+            fragment.directive_uses.extend(
+                named_type(arg.type) for arg in node.arguments or ()
+            )
+    return fragment
+
+
+def definition_info(node: Any) -> DefinitionInfo:
+    """DefinitionInfo of a type definition or extension node."""
+    info = DefinitionInfo(
+        name=node.name.value,
+        kind=KINDS[type(node)],
+        is_extension=isinstance(node, TypeExtensionNode),
+    )
+    if info.kind == "enum":
+        info.names = [v.name.value for v in node.values or ()]
+    elif info.kind == "input":
+        info.uses = [named_type(f.type) for f in node.fields or ()]
+    elif info.kind == "union":
+        info.directives = directives_from_ast(node)
+        info.names = [m.name.value for m in node.types or ()]
+    elif info.kind != "scalar":
+        info.directives = directives_from_ast(node)
+        info.names = [i.name.value for i in node.interfaces or ()]
+        for field in node.fields or ():
+            info.uses.append(named_type(field.type))
+            info.uses.extend(named_type(arg.type) for arg in field.arguments or ())
+            field_type_name, is_list, is_required = extract_type_node_name(field.type)
+            info.fields.append(
+                FieldInfo(
+                    name=intern(field.name.value),
+                    type_name=field_type_name,
+                    is_list=is_list,
+                    is_required=is_required,
+                    directives=directives_from_ast(field),
+                )
+            )
+    return info
+
+
+def merge_fragments(fragments: List[Tuple[str, SchemaFragment]]) -> SchemaInfo:
+    """Merge (source name, fragment) pairs into one SchemaInfo.
+
+    Extensions apply to their type wherever it is defined; a type defined
+    twice raises ValueError naming both sources.
+    """
+    # Definitions by name, each followed by its extensions
+    nodes: Dict[str, List[DefinitionInfo]] = {}
+    defined_in: Dict[str, str] = {}
+    extensions: Dict[str, List[DefinitionInfo]] = {}
+    for source, fragment in fragments:
+        for definition in fragment.definitions:
+            name = definition.name
+            if definition.is_extension:
+                extensions.setdefault(name, []).append(definition)
+            elif name in defined_in:
+                raise ValueError(
+                    f"Type '{name}' is defined in both {defined_in[name]} and {source}"
+                    if defined_in[name] != source
+                    else f"Type '{name}' is defined twice in {source}"
+                )
+            else:
+                defined_in[name] = source
+                nodes[name] = [definition]
+    for name, extension_nodes in extensions.items():
+        nodes.setdefault(name, []).extend(extension_nodes)
+
+    types = []
+    enums = []
+    # Like GraphQLSchema.type_map: built-in scalars are listed where first used
+    scalars: Dict[str, None] = {}
+
+    def use(names: List[str]) -> None:
+        for name in names:
+            if name in BUILTIN_SCALARS and name not in nodes:
+                scalars.setdefault(name)
+
+    for name, type_nodes in nodes.items():
+        definition = type_nodes[0]
+        if definition.kind == "scalar":
+            scalars.setdefault(name)
+
+        elif definition.kind == "enum":
+            values = [v for n in type_nodes for v in n.names]
+            enums.append(EnumInfo(name=name, values=values))
+
+        elif definition.kind == "input":
+            for n in type_nodes:
+                use(n.uses)
+
+        elif definition.kind == "union":
+            members = [m for n in type_nodes for m in n.names]
+            types.append(
+                TypeInfo(
+                    name=name,
+                    fields=[],
+                    directives=definition.directives,
+                    kind="union",
+                    union_types=members,
+                )
+            )
+
+        else:
+            for n in type_nodes:
+                use(n.uses)
+            types.append(
+                TypeInfo(
+                    name=name,
+                    fields=[f for n in type_nodes for f in n.fields]
+                    if len(type_nodes) > 1
+                    else definition.fields,
+                    # build_schema keeps only the definition's own directives
+                    directives=definition.directives,
+                    kind=definition.kind,
+                    interfaces=[i for n in type_nodes for i in n.names],
+                )
+            )
+
+    # Then the arguments of custom and built-in (@include, @deprecated) directives
+    for _, fragment in fragments:
+        use(fragment.directive_uses)
+    scalars.setdefault("Boolean")
+    scalars.setdefault("String")
+
+    return SchemaInfo(types=types, scalars=list(scalars), enums=enums)
+
+
+def named_type(type_node: TypeNode) -> str:
+    """Name of the type a (possibly list or non-null) reference resolves to."""
+    while not isinstance(type_node, NamedTypeNode):
+        type_node = type_node.type  # type: ignore[attr-defined]
+    return type_node.name.value
+
+
+def extract_type_node_name(type_node: TypeNode) -> tuple[str, bool, bool]:
+    """extract_type_name for a type reference in the SDL document."""
+    is_required = False
+    is_list = False
+
+    if isinstance(type_node, NonNullTypeNode):
+        is_required = True
+        type_node = type_node.type
+
+    if isinstance(type_node, ListTypeNode):
+        is_list = True
+        type_node = type_node.type
+        if isinstance(type_node, NonNullTypeNode):
+            type_node = type_node.type
+
+    if isinstance(type_node, NamedTypeNode):
+        return intern(type_node.name.value), is_list, is_required
+    return intern(print_ast(type_node)), is_list, is_required
@@ -1,13 +1,54 @@
 """Main code generation orchestrator."""
 
+import dataclasses
+import filecmp
+import importlib.util
+import os
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
 from pydantic import BaseModel
 import json
-from jinja2 import Environment, FileSystemLoader
 
-from .config import load_config, get_output_path, CodegenConfig
-from .parser import load_and_parse_schema_with_config, SchemaInfo
+from .cache import DiskCache, content_hash
+from .config import load_config, get_output_path, open_cache, CodegenConfig
+from .schema_cache import parse_schema_cached, validate_schema_cached
+from .schema_files import (
+    SchemaFile,
+    join_schema_files,
+    parse_schema_files,
+    read_schema_files,
+)
+from .sharding import plan_shards
+from .subset import select_roots
+from .templates import get_template_env, templates_hash
+from .timings import PhaseTiming, phase, recording
+from .parser import (
+    load_schema_text,
+    parse_schema,
+    SchemaInfo,
+)
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+# Config fields that steer how generation runs, never what it produces
+EXECUTION_FIELDS = {"bytecode", "cache", "cache_dir", "cache_max_mb", "jobs", "stream"}
+
+# Per-type fingerprints of the last generation, written next to the output
+MANIFEST_NAME = ".codegen-manifest.json"
 
 
 # Helper function to strip hash comments from a string (typically JSON with comments)
@@ -25,7 +66,8 @@ def parse_into(value: str) -> dict:
         return {}
 
 
-class FieldInfo(BaseModel):
+@dataclasses.dataclass(slots=True)
+class FieldInfo:
     """Information about a field for template rendering."""
 
     name: str
@@ -33,7 +75,8 @@ class FieldInfo(BaseModel):
     json_schema_extra: Optional[Dict[str, Any]] = None
 
 
-class TypeInfo(BaseModel):
+@dataclasses.dataclass(slots=True)
+class TypeInfo:
     """Information about a type for template rendering."""
 
     name: str
@@ -41,8 +84,10 @@ class TypeInfo(BaseModel):
     fields: List[FieldInfo]
     expansion_spec: Optional[str] = None
     kind: str = "object"  # "object", "interface", "union"
-    union_types: List[str] = []  # For unions, the member types
-    interfaces: List[str] = []  # For interfaces, the interface names
+    # For unions, the member types
+    union_types: List[str] = dataclasses.field(default_factory=list)
+    # For interfaces, the interface names
+    interfaces: List[str] = dataclasses.field(default_factory=list)
 
 
 class GenerationResult(BaseModel):
@@ -52,6 +97,10 @@ class GenerationResult(BaseModel):
     package_name: Optional[str] = None
     output_path: Optional[Path] = None
     error: Optional[str] = None
+    up_to_date: bool = False  # cache hit and every output file already current
+    changed_types: List[str] = []  # types whose fingerprint differs from the manifest
+    files: List[str] = []  # generated files, relative to output_path
+    timings: List[PhaseTiming] = []  # phases in the order they finished
 
 
 def build_field_meta(
@@ -124,17 +173,9 @@ def collect_types(
             )
             continue
 
-        # Analyze mixins needed
-        type_has_compute_on_field = any(
-            any(d.name == "compute" for d in f.directives) for f in type_info.fields
-        )
-        type_has_expand_on_type = any(d.name == "expand" for d in type_info.directives)
-        type_has_expand_on_field = any(
-            any(d.name == "expand" for d in f.directives) for f in type_info.fields
-        )
-
-        inherits_computable = type_has_compute_on_field
-        inherits_expandable = type_has_expand_on_type or type_has_expand_on_field
+        # Mixins needed, from the directive flags computed at parse time
+        inherits_computable = type_info.has_compute
+        inherits_expandable = type_info.has_expand
 
         if inherits_computable:
             needs_computable_import = True
@@ -167,14 +208,8 @@ def collect_types(
 
         # Process fields
         fields_data = []
-        # Collect interface field names to avoid duplication
-        interface_field_names: set[str] = set()
-        for interface_name in type_info.interfaces:
-            interface_type = next(
-                (t for t in schema_info.types if t.name == interface_name), None
-            )
-            if interface_type:
-                interface_field_names.update(f.name for f in interface_type.fields)
+        # Interface field names, to avoid duplication
+        interface_field_names = schema_info.inherited_field_names[type_info.name]
 
         for field in type_info.fields:
             # Skip fields that are already defined in interfaces
@@ -190,9 +225,10 @@ def collect_types(
 
             # Handle forward references for stdout mode
             if for_stdout:
-                if field.type_name in [
-                    t.name for t in schema_info.types if t.name != type_info.name
-                ]:
+                if (
+                    field.type_name != type_info.name
+                    and field.type_name in schema_info.types_by_name
+                ):
                     python_type = python_type.replace(
                         field.type_name, f'"{field.type_name}"'
                     )
@@ -235,13 +271,186 @@ def collect_types(
     return types_data, needs_computable_import, needs_expandable_import, imports_needed
 
 
-def get_template_env() -> Environment:
-    """Get Jinja2 environment with templates."""
-    template_dir = Path(__file__).parent / "templates"
-    env = Environment(loader=FileSystemLoader(template_dir))
-    # Add custom filters
-    env.filters["repr"] = repr
-    return env
+def generation_key(schema_text: str, config: CodegenConfig) -> str:
+    """Hash everything that determines generated output."""
+    return content_hash(
+        templates_hash(config),
+        config.model_dump_json(exclude=EXECUTION_FIELDS),
+        schema_text,
+    )
+
+
+def type_fingerprints(
+    types_data: List[TypeInfo], config: CodegenConfig
+) -> Dict[str, str]:
+    """Fingerprint what each type renders from.
+
+    Fingerprints chain through base classes, so a changed interface also
+    re-renders the types that inherit from it.
+    """
+    by_name = {t.name: t for t in types_data}
+    templates_key = templates_hash(config)
+    fingerprints: Dict[str, str] = {}
+
+    def fingerprint(type_info: TypeInfo) -> str:
+        if type_info.name not in fingerprints:
+            bases = [
+                fingerprint(by_name[base])
+                for base in type_info.base_classes
+                if base in by_name
+            ]
+            fingerprints[type_info.name] = content_hash(
+                templates_key, json.dumps(dataclasses.astuple(type_info)), *bases
+            )
+        return fingerprints[type_info.name]
+
+    for type_info in types_data:
+        fingerprint(type_info)
+    return fingerprints
+
+
+def render_type_blocks(
+    types_data: List[TypeInfo], fingerprints: Dict[str, str], config: CodegenConfig
+) -> List[str]:
+    """Render one block per type, reusing cached blocks by fingerprint."""
+    cache = open_cache(config, "fragments")
+    blocks: Dict[str, str] = {}
+    pending = []
+    for type_info in types_data:
+        fingerprint = fingerprints[type_info.name]
+        if cache and fingerprint in _recent_blocks:
+            blocks[fingerprint] = _recent_blocks[fingerprint]
+            continue
+        cached = cache.get(fingerprint) if cache else None
+        if cached is None:
+            pending.append(type_info)
+        else:
+            blocks[fingerprint] = cached.decode()
+
+    workers = min(
+        config.jobs or os.cpu_count() or 1, len(pending) // MIN_BLOCKS_PER_WORKER
+    )
+    if workers > 1:
+        rendered = render_types_in_parallel(pending, config, workers)
+    else:
+        render_type = get_render_type_macro(config)
+        rendered = [str(render_type(type_info)) for type_info in pending]
+
+    fresh = {fingerprints[t.name]: block for t, block in zip(pending, rendered)}
+    blocks.update(fresh)
+    if cache and fresh:
+        cache.put_many({key: block.encode() for key, block in fresh.items()})
+    if cache:
+        if len(_recent_blocks) + len(blocks) > RECENT_BLOCKS_LIMIT:
+            _recent_blocks.clear()
+        _recent_blocks.update(blocks)
+    return [blocks[fingerprints[t.name]] for t in types_data]
+
+
+# Starting a worker costs about as much as rendering a thousand or two blocks,
+# so fewer pending blocks per worker render faster in this process
+MIN_BLOCKS_PER_WORKER = 1_000
+
+# Blocks by fingerprint, kept warm across generations in long-running processes
+_recent_blocks: Dict[str, str] = {}
+RECENT_BLOCKS_LIMIT = 100_000
+
+
+def load_schema_info(
+    schema_text: str,
+    config: CodegenConfig,
+    schema_files: Optional[List[SchemaFile]] = None,
+) -> SchemaInfo:
+    """Parse schema text, reusing the previous parse in memory or on disk.
+
+    Given the schema_files it was joined from, the files are parsed one by one
+    instead; unless config.fast_parse is set, the whole text is then validated
+    once, after the merge has reported any type defined in two files.
+    With config.roots, only the types those roots reach are kept.
+    """
+    validate = not config.fast_parse
+    cache = open_cache(config, "schema")
+    if schema_files:
+        with phase("parse_schema_files"):
+            schema_info = parse_schema_files(schema_files, cache, config.jobs)
+        if validate:
+            with phase("validate_schema"):
+                validate_schema_cached(schema_text, cache)
+    elif cache is None:
+        schema_info = parse_schema(schema_text, validate)
+    else:
+        schema_info = _parse_recent(schema_text, validate, cache)
+    if config.roots:
+        with phase("select_roots"):
+            return select_roots(schema_info, config.roots)
+    return schema_info
+
+
+@lru_cache(maxsize=1)
+def _parse_recent(schema_text: str, validate: bool, cache: DiskCache) -> SchemaInfo:
+    return parse_schema_cached(schema_text, validate, cache)
+
+
+def get_render_type_macro(config: CodegenConfig) -> Any:
+    """The render_type macro from macros.j2, callable from Python."""
+    macros = get_template_env(config).get_template("macros.j2").module
+    return getattr(macros, "render_type")
+
+
+# Set once per pool worker so each chunk reuses the compiled templates
+_worker_render_type: Any = None
+
+
+def _init_render_worker(config: CodegenConfig) -> None:
+    global _worker_render_type
+    _worker_render_type = get_render_type_macro(config)
+
+
+def _render_type_chunk(chunk: List[TypeInfo]) -> List[str]:
+    return [str(_worker_render_type(type_info)) for type_info in chunk]
+
+
+def render_types_in_parallel(
+    types_data: List[TypeInfo], config: CodegenConfig, workers: int
+) -> List[str]:
+    """Render type blocks across a pool of workers, preserving input order."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    # A few chunks per worker balances load without per-type pickling overhead
+    size = -(-len(types_data) // (workers * 4))
+    chunks = [types_data[i : i + size] for i in range(0, len(types_data), size)]
+    with ProcessPoolExecutor(
+        workers, initializer=_init_render_worker, initargs=(config,)
+    ) as pool:
+        return [
+            block for chunk in pool.map(_render_type_chunk, chunks) for block in chunk
+        ]
+
+
+def manifest_path(config: CodegenConfig) -> str:
+    """Manifest location relative to the output directory."""
+    return MANIFEST_NAME if config.flat_output else f"gen/{MANIFEST_NAME}"
+
+
+def changed_since(previous: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Names whose fingerprint is new or different."""
+    before = previous.get("types", {})
+    return [
+        name for name, value in current["types"].items() if before.get(name) != value
+    ]
+
+
+def read_manifest(path: Path) -> Dict[str, Any]:
+    """Load the manifest of the previous generation, if any.
+
+    It holds the files written ("files") and the fingerprint of each type
+    ("types").
+    """
+    try:
+        manifest = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return manifest if isinstance(manifest.get("types"), dict) else {}
 
 
 def generate_from_directory(
@@ -249,47 +458,269 @@ def generate_from_directory(
     verbose: bool = False,
     override_config: Optional[CodegenConfig] = None,
 ) -> GenerationResult:
-    """Generate Python package from GraphQL schema directory."""
+    """Generate Python package from GraphQL schema directory.
+
+    The result's timings hold the wall and CPU time of each phase, including
+    any the caller timed inside an enclosing timings.recording().
+    """
+    with recording() as phases:
+        result = _generate_from_directory(schema_dir, verbose, override_config)
+    result.timings = list(phases)
+    return result
+
+
+def _generate_from_directory(
+    schema_dir: Path, verbose: bool, override_config: Optional[CodegenConfig]
+) -> GenerationResult:
     try:
         if verbose:
             print(f"Loading configuration from {schema_dir}")
 
-        config = override_config or load_config(schema_dir)
+        config = override_config
+        if config is None:
+            with phase("load_config"):
+                config = load_config(schema_dir)
 
         if verbose:
             print(f"Configuration loaded: package={config.package}")
 
-        if verbose:
-            print("Parsing GraphQL schema")
-
-        schema_info = load_and_parse_schema_with_config(schema_dir, config)
+        if config.stdout:
+            require_flat_for_stdout(config)
 
-        if verbose:
-            print(
-                f"Found {len(schema_info.types)} types and {len(schema_info.scalars)} scalars"
+        with phase("read_schema"):
+            schema_files = (
+                read_schema_files(schema_dir, config.schema_files)
+                if config.schema_files
+                else None
             )
+            schema_text = (
+                join_schema_files(schema_files)
+                if schema_files
+                else load_schema_text(schema_dir, config)
+            )
+        if config.stream:
+            return stream_generation(
+                schema_dir, schema_text, config, verbose, schema_files
+            )
+
+        files, cache_hit = render_cached(schema_text, config, verbose, schema_files)
 
         if config.stdout:
             # Output to stdout instead of files
-            generate_stdout_output(config, schema_info, verbose)
-            return GenerationResult(success=True, package_name=config.package)
+            with phase("write stdout"):
+                write_stdout([files[flat_module_path(config)]])
+            return GenerationResult(
+                success=True, package_name=config.package, up_to_date=cache_hit
+            )
         else:
             output_path = get_output_path(config, schema_dir)
 
             if verbose:
                 print(f"Output path: {output_path}")
 
+            relative_manifest = manifest_path(config)
+            previous = read_manifest(output_path / relative_manifest)
+            manifest = json.loads(files[relative_manifest])
+            changed_types = changed_since(previous, manifest)
+
             create_package_structure(output_path, config, verbose)
-            generate_package_files(output_path, config, schema_info, verbose)
+            written = write_files(output_path, files)
+            remove_stale_files(output_path, previous, list(files), config, verbose)
+            compile_bytecode(output_path, list(files), written, config, verbose)
+
+            if verbose:
+                print(f"{len(changed_types)} of {len(manifest['types'])} types changed")
+                print(f"Wrote {len(written)} of {len(files)} files in {output_path}")
 
             return GenerationResult(
-                success=True, package_name=config.package, output_path=output_path
+                success=True,
+                package_name=config.package,
+                output_path=output_path,
+                up_to_date=cache_hit and not written,
+                changed_types=changed_types,
+                files=list(files),
             )
 
     except Exception as e:
         return GenerationResult(success=False, error=str(e))
 
 
+def generate_from_sdl(
+    sdl: str, config: CodegenConfig, cache: bool = False
+) -> Dict[str, str]:
+    """Generate in memory: each output file's text by its path in the package.
+
+    Paths are relative to the package directory, as generate_from_directory
+    would write them; virtual_package.load_package imports from the map.
+    Nothing is written to disk unless cache is set, which also uses the disk
+    caches of results and parsed schemas when config.cache allows them.
+
+    Raises:
+        ValueError: if the schema cannot be parsed or is invalid
+    """
+    if not cache:
+        config = config.model_copy(update={"cache": False})
+    return render_cached(sdl, config)[0]
+
+
+def render_cached(
+    schema_text: str,
+    config: CodegenConfig,
+    verbose: bool = False,
+    schema_files: Optional[List[SchemaFile]] = None,
+) -> Tuple[Dict[str, str], bool]:
+    """Render every output file, or fetch them from the results cache.
+
+    Returns the files and whether they came from the cache.
+    """
+    cache = open_cache(config, "results")
+    with phase("lookup_results"):
+        key = generation_key(schema_text, config)
+        cached = cache.get(key) if cache else None
+
+    if cached is not None:
+        if verbose:
+            print(f"Cache hit: {key[:12]}")
+        return json.loads(cached), True
+
+    if verbose:
+        print("Parsing GraphQL schema")
+
+    schema_info = load_schema_info(schema_text, config, schema_files)
+
+    if verbose:
+        print(
+            f"Found {len(schema_info.types)} types and {len(schema_info.scalars)} scalars"
+        )
+
+    files = render_files(config, schema_info)
+    if cache:
+        with phase("store_results"):
+            cache.put(key, json.dumps(files).encode())
+    return files, False
+
+
+class TargetReport(BaseModel):
+    """Outcome of one schema directory in a batch."""
+
+    schema_dir: Path
+    result: GenerationResult
+    seconds: float
+
+
+class BatchReport(BaseModel):
+    """Outcome of generating several schema directories together."""
+
+    targets: List[TargetReport]
+    seconds: float
+
+    @property
+    def success(self) -> bool:
+        return all(target.result.success for target in self.targets)
+
+
+def generate_many(
+    schema_dirs: List[Path],
+    verbose: bool = False,
+    configure: Callable[[Path], CodegenConfig] = load_config,
+    workers: int = 0,
+) -> BatchReport:
+    """Generate several schema directories, one report per directory.
+
+    Targets run concurrently in up to workers processes (0 = one per CPU), each
+    rendering its types serially and keeping its template environment across
+    the targets it handles; the disk caches are shared by all. configure loads
+    each directory's config and must be picklable. A failing target is
+    reported without stopping the others.
+    """
+    started = time.perf_counter()
+    workers = min(workers or os.cpu_count() or 1, len(schema_dirs))
+    if workers <= 1:
+        targets = [generate_target(d, verbose, configure) for d in schema_dirs]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            targets = list(
+                pool.map(
+                    generate_target,
+                    schema_dirs,
+                    [verbose] * len(schema_dirs),
+                    [configure] * len(schema_dirs),
+                    [True] * len(schema_dirs),
+                )
+            )
+    return BatchReport(targets=targets, seconds=time.perf_counter() - started)
+
+
+def generate_target(
+    schema_dir: Path,
+    verbose: bool,
+    configure: Callable[[Path], CodegenConfig],
+    serial: bool = False,
+) -> TargetReport:
+    """Generate one batch target, timing it and capturing any failure."""
+    started = time.perf_counter()
+    try:
+        config = configure(schema_dir)
+        if serial:
+            config.jobs = 1  # the batch already spreads targets over processes
+        result = generate_from_directory(
+            schema_dir, verbose=verbose, override_config=config
+        )
+    except Exception as e:
+        result = GenerationResult(success=False, error=str(e))
+    return TargetReport(
+        schema_dir=schema_dir, result=result, seconds=time.perf_counter() - started
+    )
+
+
+def stream_generation(
+    schema_dir: Path,
+    schema_text: str,
+    config: CodegenConfig,
+    verbose: bool,
+    schema_files: Optional[List[SchemaFile]] = None,
+) -> GenerationResult:
+    """Render straight into stdout or the output files, bypassing the caches.
+
+    Type blocks are rendered as the templates consume them, so peak memory
+    does not grow with the size of the generated modules.
+    """
+    schema_info = load_schema_info(schema_text, config, schema_files)
+    file_chunks = render_file_chunks(config, schema_info)
+
+    if config.stdout:
+        with phase("stream stdout"):
+            write_stdout(dict(file_chunks)[flat_module_path(config)])
+        return GenerationResult(success=True, package_name=config.package)
+
+    output_path = get_output_path(config, schema_dir)
+    create_package_structure(output_path, config, verbose)
+    manifest = output_path / manifest_path(config)
+    previous = read_manifest(manifest)
+    files = []
+    written = []
+    for relative_path, chunks in file_chunks:
+        with phase(f"stream {relative_path}"):
+            if write_chunks(output_path / relative_path, chunks):
+                written.append(output_path / relative_path)
+        files.append(relative_path)
+    remove_stale_files(output_path, previous, files, config, verbose)
+    compile_bytecode(output_path, files, written, config, verbose)
+
+    if verbose:
+        print(f"Streamed package files to {output_path}")
+
+    return GenerationResult(
+        success=True,
+        package_name=config.package,
+        output_path=output_path,
+        changed_types=changed_since(previous, read_manifest(manifest)),
+        files=files,
+    )
+
+
 def create_package_structure(
     output_path: Path, config: CodegenConfig, verbose: bool = False
 ):
@@ -308,123 +739,236 @@ def generate_package_files(
     verbose: bool = False,
 ):
     """Generate the package files using templates."""
+    write_files(output_path, render_files(config, schema_info))
 
-    # Process types and gather template data
-    (
-        types_data,
-        needs_computable_import,
-        needs_expandable_import,
-        imports_needed,
-    ) = collect_types(schema_info, config, for_stdout=False)
+    if verbose:
+        print(f"Generated package files in {output_path}")
 
-    if config.flat_output:
-        # Generate everything in a single file
-        generate_flat_output(
-            output_path,
-            config,
+
+def render_files(config: CodegenConfig, schema_info: SchemaInfo) -> Dict[str, str]:
+    """Render every output file, keyed by path relative to the output directory."""
+    files = {}
+    for path, chunks in render_file_chunks(config, schema_info):
+        with phase(f"render {path}"):
+            files[path] = "".join(chunks)
+    return files
+
+
+def render_file_chunks(
+    config: CodegenConfig, schema_info: SchemaInfo
+) -> Iterator[Tuple[str, Iterator[str]]]:
+    """Yield each output path with a lazy iterator over its rendered text.
+
+    Consume each iterator before advancing to the next path.
+    """
+    # Process types and gather template data
+    with phase("collect_types"):
+        (
             types_data,
-            schema_info,
             needs_computable_import,
             needs_expandable_import,
             imports_needed,
-            verbose,
-        )
+        ) = collect_types(schema_info, config, for_stdout=config.stdout)
+
+    with phase("fingerprint_types"):
+        fingerprints = type_fingerprints(types_data, config)
+    with phase("render_type_blocks"):
+        blocks_for = type_block_source(types_data, fingerprints, config)
+    context = {
+        "types": types_data,
+        "type_blocks": blocks_for(types_data),
+        "needs_computable_import": needs_computable_import,
+        "needs_expandable_import": needs_expandable_import,
+        "enums": schema_info.enums,
+        "additional_imports": sorted(imports_needed),
+    }
+
+    paths = []
+    for path, chunks in module_chunks(config, context, blocks_for, schema_info):
+        paths.append(path)
+        yield path, chunks
+    paths.append(manifest_path(config))
+    manifest = {"files": paths, "types": fingerprints}
+    yield paths[-1], iter([json.dumps(manifest, indent=2) + "\n"])
+
+
+def module_chunks(
+    config: CodegenConfig,
+    context: Dict[str, Any],
+    blocks_for: Callable[[List[TypeInfo]], Iterable[str]],
+    schema_info: SchemaInfo,
+) -> Iterator[Tuple[str, Iterator[str]]]:
+    """Yield each generated module's path with a lazy iterator over its text."""
+    env = get_template_env(config)
+    if config.flat_output:
+        # Generate everything in a single file
+        yield flat_module_path(config), env.get_template("flat.py.j2").generate(context)
     else:
-        # Generate package structure
-        generate_package_output(
-            output_path,
-            config,
-            types_data,
-            schema_info,
-            needs_computable_import,
-            needs_expandable_import,
-            imports_needed,
-            verbose,
+        if config.sharded_models:
+            yield from sharded_model_chunks(
+                env, context, blocks_for, schema_info, config
+            )
+        else:
+            yield "gen/models.py", env.get_template("models.py.j2").generate(context)
+        yield (
+            "gen/auto.py",
+            env.get_template("auto.py.j2").generate(package_name=config.package),
         )
 
 
-def render_flat(
-    types_data,
-    schema_info,
-    needs_computable_import,
-    needs_expandable_import,
-    imports_needed,
-) -> str:
-    """Render flat output using the shared template."""
-    env = get_template_env()
-    template = env.get_template("flat.py.j2")
-    return template.render(
-        types=types_data,
-        needs_computable_import=needs_computable_import,
-        needs_expandable_import=needs_expandable_import,
-        enums=schema_info.enums,
-        additional_imports=list(imports_needed),
+def type_block_source(
+    types_data: List[TypeInfo], fingerprints: Dict[str, str], config: CodegenConfig
+) -> Callable[[List[TypeInfo]], Iterable[str]]:
+    """Return a function giving the rendered blocks of some types, in order.
+
+    Streaming renders each block on demand; otherwise every block is rendered
+    (or fetched from the fragment cache) up front.
+    """
+    if config.stream:
+        render_type = get_render_type_macro(config)
+        return lambda types: (str(render_type(t)) for t in types)
+
+    blocks = dict(
+        zip(
+            (t.name for t in types_data),
+            render_type_blocks(types_data, fingerprints, config),
+        )
     )
+    return lambda types: [blocks[t.name] for t in types]
 
 
-def generate_flat_output(
-    output_path: Path,
+def flat_module_path(config: CodegenConfig) -> str:
+    """Path of the single module generated by flat output."""
+    return f"{config.package}.py"
+
+
+def sharded_model_chunks(
+    env: "Environment",
+    context: Dict[str, Any],
+    blocks_for: Callable[[List[TypeInfo]], Iterable[str]],
+    schema_info: SchemaInfo,
     config: CodegenConfig,
-    types_data,
-    schema_info,
-    needs_computable_import,
-    needs_expandable_import,
-    imports_needed,
-    verbose: bool,
-):
-    """Generate a single file output."""
-    content = render_flat(
-        types_data,
-        schema_info,
-        needs_computable_import,
-        needs_expandable_import,
-        imports_needed,
+) -> Iterator[Tuple[str, Iterator[str]]]:
+    """Render gen/models/ as a package of shards behind a lazy __init__."""
+    types_by_name = {t.name: t for t in context["types"]}
+    enums_by_name = {e.name: e for e in context["enums"]}
+    shards = plan_shards(list(enums_by_name) + list(types_by_name), schema_info)
+
+    template = env.get_template("models.py.j2")
+    for shard in shards:
+        types = [types_by_name[n] for n in shard.names if n in types_by_name]
+        bases = {base for t in types for base in t.base_classes}
+        yield (
+            f"gen/models/{shard.module}.py",
+            template.generate(
+                context,
+                types=types,
+                type_blocks=blocks_for(types),
+                enums=[enums_by_name[n] for n in shard.names if n in enums_by_name],
+                needs_computable_import="Computable" in bases,
+                needs_expandable_import="Expandable" in bases,
+                auto_module="..auto",
+                model_imports=shard.imports,
+            ),
+        )
+    yield (
+        "gen/models/__init__.py",
+        env.get_template("models_init.py.j2").generate(
+            package_name=config.package, shards=shards
+        ),
     )
 
-    output_file = output_path / f"{config.package}.py"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w") as f:
-        f.write(content)
 
-    if verbose:
-        print(f"Generated flat file: {output_file}")
+def write_files(output_path: Path, files: Dict[str, str]) -> List[Path]:
+    """Write files under output_path, leaving those already up to date untouched."""
+    written = []
+    for relative_path, content in files.items():
+        with phase(f"write {relative_path}"):
+            if write_chunks(output_path / relative_path, [content]):
+                written.append(output_path / relative_path)
+    return written
 
 
-def generate_package_output(
+def remove_stale_files(
     output_path: Path,
+    previous: Dict[str, Any],
+    files: List[str],
     config: CodegenConfig,
-    types_data,
-    schema_info,
-    needs_computable_import,
-    needs_expandable_import,
-    imports_needed,
-    verbose: bool,
+    verbose: bool = False,
+) -> List[Path]:
+    """Delete the files the previous run wrote and this one did not.
+
+    Switching sharded_models also removes the other models layout even when
+    the previous manifest is missing, since gen/models/__init__.py would
+    shadow gen/models.py. Directories left empty are removed. Returns the
+    files deleted.
+    """
+    stale = set(previous.get("files", [])) - set(files)
+    if not config.flat_output:
+        stale |= {"gen/models.py", "gen/models/__init__.py"} - set(files)
+
+    removed = []
+    for relative_path in sorted(stale):
+        # Never follow a manifest out of the output directory
+        if Path(relative_path).is_absolute() or ".." in Path(relative_path).parts:
+            continue
+        path = output_path / relative_path
+        if not path.is_file():
+            continue
+        path.unlink()
+        removed.append(path)
+        if path.suffix == ".py":
+            Path(importlib.util.cache_from_source(str(path))).unlink(missing_ok=True)
+        for directory in (path.parent / "__pycache__", path.parent):
+            _remove_empty_dirs(directory, output_path)
+
+    if verbose and removed:
+        print(f"Removed {len(removed)} stale files from {output_path}")
+    return removed
+
+
+def _remove_empty_dirs(directory: Path, stop: Path) -> None:
+    """Remove directory and its parents, below stop, while they are empty."""
+    while directory != stop and stop in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:  # missing or not empty
+            return
+        directory = directory.parent
+
+
+def compile_bytecode(
+    output_path: Path,
+    files: List[str],
+    written: List[Path],
+    config: CodegenConfig,
+    verbose: bool = False,
 ):
-    """Generate package structure output."""
-    env = get_template_env()
-
-    # Generate files using templates
-
-    # 1. models.py
-    models_template = env.get_template("models.py.j2")
-    models_content = models_template.render(
-        types=types_data,
-        needs_computable_import=needs_computable_import,
-        needs_expandable_import=needs_expandable_import,
-        enums=schema_info.enums,
-        additional_imports=list(imports_needed),
-    )
-    with open(output_path / "gen" / "models.py", "w") as f:
-        f.write(models_content)
+    """Byte-compile the generated modules, if config.bytecode asks for it."""
+    if not config.bytecode:
+        return
+    from .bytecode import compile_modules
 
-    # 2. auto.py
-    auto_template = env.get_template("auto.py.j2")
-    auto_content = auto_template.render(package_name=config.package)
-    with open(output_path / "gen" / "auto.py", "w") as f:
-        f.write(auto_content)
+    modules = [output_path / f for f in files if f.endswith(".py")]
+    with phase("compile_bytecode"):
+        compiled = compile_modules(modules, config.bytecode, set(written), config.jobs)
 
     if verbose:
-        print(f"Generated package files in {output_path}")
+        print(f"Compiled {len(compiled)} of {len(modules)} modules to bytecode")
+
+
+def write_chunks(path: Path, chunks: Iterable[str]) -> bool:
+    """Stream chunks into path via a temp file; return False if path was current."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        f.writelines(chunks)
+
+    if path.exists() and filecmp.cmp(tmp_path, path, shallow=False):
+        tmp_path.unlink()
+        return False
+    os.replace(tmp_path, path)
+    return True
 
 
 def get_python_type(
@@ -448,30 +992,25 @@ def get_python_type(
 def generate_stdout_output(
     config: CodegenConfig, schema_info: SchemaInfo, verbose: bool = False
 ):
-    """Generate output to stdout instead of files."""
-    import sys
-
-    if config.flat_output:
-        # Process types and generate flat output to stdout
-        (
-            types_data,
-            needs_computable_import,
-            needs_expandable_import,
-            imports_needed,
-        ) = collect_types(schema_info, config, for_stdout=True)
+    """Generate output to stdout instead of files, printing as it renders."""
+    require_flat_for_stdout(config)
+    config = config.model_copy(update={"stream": True})
+    write_stdout(
+        dict(render_file_chunks(config, schema_info))[flat_module_path(config)]
+    )
 
-        content = render_flat(
-            types_data,
-            schema_info,
-            needs_computable_import,
-            needs_expandable_import,
-            imports_needed,
-        )
-        print(content)
 
-    else:
+def require_flat_for_stdout(config: CodegenConfig):
+    """Exit unless config uses flat output, the only layout stdout supports."""
+    if not config.flat_output:
         print(
             "# Package structure output not supported for stdout mode", file=sys.stderr
         )
         print("# Use flat_output: true for stdout mode", file=sys.stderr)
         sys.exit(1)
+
+
+def write_stdout(chunks: Iterable[str]):
+    """Write chunks to stdout as they arrive, ending with a newline like print."""
+    sys.stdout.writelines(chunks)
+    sys.stdout.write("\n")
@@ -0,0 +1,97 @@
+"""Slice large files by line number through a cached line-offset index.
+
+The index (the byte offset of every line start) is built in one streaming pass
+and cached in memory and on disk, keyed by the file's path, mtime and size.
+Both the index and the file are then read through mmap, so a slice costs the
+same however large the file is.
+"""
+
+import mmap
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+from typing import List, Literal, Optional, Sequence, Tuple
+
+from .cache import DiskCache, content_hash
+
+LineRange = Tuple[int, int]  # 1-based, inclusive
+
+
+def parse_line_ranges(line_ranges: str) -> List[LineRange]:
+    """Parse a spec like "1-10,15-20,25" into (start, end) pairs."""
+    ranges = []
+    for range_spec in (r.strip() for r in line_ranges.split(",")):
+        try:
+            if "-" in range_spec:
+                start, end = map(int, range_spec.split("-"))
+            else:
+                start = end = int(range_spec)
+        except ValueError:
+            raise ValueError(f"Invalid line range '{range_spec}' in '{line_ranges}'")
+        if not 1 <= start <= end:
+            raise ValueError(f"Invalid line range '{range_spec}' in '{line_ranges}'")
+        ranges.append((start, end))
+    return ranges
+
+
+def merge_line_ranges(ranges: List[LineRange]) -> List[LineRange]:
+    """Sort ranges and merge those that overlap or touch."""
+    merged: List[LineRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def read_line_ranges(
+    path: Path, ranges: List[LineRange], cache: Optional[DiskCache] = None
+) -> str:
+    """Text of the given line ranges, in order; raises ValueError past the end."""
+    offsets = line_offsets(path, cache)
+    line_count = len(offsets) - 1
+    for start, end in ranges:
+        if end > line_count:
+            raise ValueError(
+                f"Line range {start}-{end} is past the end of {path} "
+                f"({line_count} lines)"
+            )
+    if not ranges:
+        return ""
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return b"".join(m[offsets[s - 1] : offsets[e]] for s, e in ranges).decode()
+
+
+def line_offsets(path: Path, cache: Optional[DiskCache] = None) -> Sequence[int]:
+    """Offsets of each line start, plus the file size as a final entry."""
+    stat = path.stat()
+    return _line_offsets(path.resolve(), stat.st_mtime_ns, stat.st_size, cache)
+
+
+@lru_cache(maxsize=8)
+def _line_offsets(
+    path: Path, mtime_ns: int, size: int, cache: Optional[DiskCache]
+) -> Sequence[int]:
+    typecode: Literal["I", "Q"] = "I" if size < 2**32 else "Q"
+    key = content_hash(str(path), str(mtime_ns), str(size), typecode)
+    cached = cache.get_path(key) if cache else None
+    if cached is not None:
+        try:
+            with open(cached, "rb") as f:
+                # Mapped, not read: loading the index costs the same at any size
+                return memoryview(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                ).cast(typecode)
+        except (FileNotFoundError, ValueError):
+            pass  # evicted meanwhile, or empty; rebuild
+
+    # Line lengths summed in C, streaming, so the file is never held in memory
+    offsets = array(typecode, [0])
+    with open(path, "rb") as f:
+        offsets.extend(accumulate(map(len, f)))
+    if cache:
+        cache.put(key, offsets.tobytes())
+    return offsets
@@ -1,69 +1,179 @@
-"""GraphQL schema parsing with directive extraction."""
+"""GraphQL schema parsing with directive extraction.
 
+The parsed IR is plain slotted dataclasses with interned names: large schemas
+build hundreds of thousands of them, and they are only ever produced by this
+module, so they skip pydantic validation.
+
+graphql-core is imported only when a schema is actually parsed, so loading
+SchemaInfo from the parse cache never pays for it.
+"""
+
+import dataclasses
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Any
-from pydantic import BaseModel
-from graphql import (
-    build_schema,
-    GraphQLSchema,
-    GraphQLObjectType,
-    GraphQLInterfaceType,
-    GraphQLUnionType,
-    GraphQLEnumType,
-    GraphQLDirective,
-)
-from graphql.type.definition import (
-    GraphQLType,
-    GraphQLScalarType,
-    GraphQLList,
-    GraphQLNonNull,
-)
-
-
-class DirectiveInfo(BaseModel):
+from sys import intern
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .cache import DiskCache
+from .config import open_cache
+from .timings import phase
+
+if TYPE_CHECKING:
+    from graphql import GraphQLDirective, GraphQLSchema
+    from graphql.type.definition import GraphQLType
+
+
+NO_DIRECTIVES: FrozenSet[str] = frozenset()
+
+
+def directive_names(directives: List["DirectiveInfo"]) -> FrozenSet[str]:
+    return frozenset(d.name for d in directives) if directives else NO_DIRECTIVES
+
+
+@dataclasses.dataclass(slots=True)
+class DirectiveInfo:
     """Information about a directive applied to a field or type."""
 
     name: str
     args: Dict[str, Any]
 
 
-class FieldInfo(BaseModel):
+@dataclasses.dataclass(slots=True)
+class FieldInfo:
     """Information about a GraphQL field."""
 
     name: str
     type_name: str
     is_list: bool = False
     is_required: bool = False
-    directives: List[DirectiveInfo] = []
+    directives: List[DirectiveInfo] = dataclasses.field(default_factory=list)
+    # Names of the directives above, derived once at construction
+    directive_names: FrozenSet[str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.directive_names = directive_names(self.directives)
+
+    @property
+    def has_compute(self) -> bool:
+        return "compute" in self.directive_names
 
+    @property
+    def has_expand(self) -> bool:
+        return "expand" in self.directive_names
 
-class TypeInfo(BaseModel):
+
+@dataclasses.dataclass(slots=True)
+class TypeInfo:
     """Information about a GraphQL type."""
 
     name: str
-    fields: List[FieldInfo] = []
-    directives: List[DirectiveInfo] = []
+    fields: List[FieldInfo] = dataclasses.field(default_factory=list)
+    directives: List[DirectiveInfo] = dataclasses.field(default_factory=list)
     kind: str = "object"  # "object", "interface", "union"
-    interfaces: List[str] = []  # For object types that implement interfaces
-    union_types: List[str] = []  # For union types
+    # For object types that implement interfaces
+    interfaces: List[str] = dataclasses.field(default_factory=list)
+    # For union types
+    union_types: List[str] = dataclasses.field(default_factory=list)
+    # Directive names on the type itself, and on any of its fields
+    directive_names: FrozenSet[str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    field_directive_names: FrozenSet[str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.directive_names = directive_names(self.directives)
+        names = [f.directive_names for f in self.fields if f.directive_names]
+        self.field_directive_names = (
+            NO_DIRECTIVES.union(*names) if names else NO_DIRECTIVES
+        )
+
+    @property
+    def has_compute(self) -> bool:
+        """A field carries @compute, so the type mixes in Computable."""
+        return "compute" in self.field_directive_names
+
+    @property
+    def has_expand(self) -> bool:
+        """The type or a field carries @expand, so it mixes in Expandable."""
+        return (
+            "expand" in self.directive_names or "expand" in self.field_directive_names
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class EnumInfo:
+    """Information about a GraphQL enum."""
+
+    name: str
+    values: List[str] = dataclasses.field(default_factory=list)
 
 
-class EnumInfo(BaseModel):
-    """Information about a GraphQL enum."""
+@dataclasses.dataclass
+class SchemaInfo:
+    """Parsed GraphQL schema information.
+
+    Name indexes are built on first access; treat the lists as read-only after.
+    """
+
+    types: List[TypeInfo] = dataclasses.field(default_factory=list)
+    scalars: List[str] = dataclasses.field(default_factory=list)
+    enums: List[EnumInfo] = dataclasses.field(default_factory=list)
+
+    @cached_property
+    def types_by_name(self) -> Dict[str, TypeInfo]:
+        return {t.name: t for t in self.types}
+
+    @cached_property
+    def enums_by_name(self) -> Dict[str, EnumInfo]:
+        return {e.name: e for e in self.enums}
+
+    @cached_property
+    def inherited_field_names(self) -> Dict[str, FrozenSet[str]]:
+        """Type name -> names of fields declared by the interfaces it implements."""
+        memo: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+        result = {}
+        for t in self.types:
+            key = tuple(t.interfaces)
+            if key not in memo:
+                memo[key] = frozenset(
+                    f.name
+                    for interface_name in key
+                    if interface_name in self.types_by_name
+                    for f in self.types_by_name[interface_name].fields
+                )
+            result[t.name] = memo[key]
+        return result
+
+
+@dataclasses.dataclass(slots=True)
+class DefinitionInfo:
+    """One type definition or extension, as written in one SDL document."""
 
     name: str
-    values: List[str] = []
+    kind: str  # "scalar", "enum", "input", "union", "interface" or "object"
+    is_extension: bool = False
+    fields: List[FieldInfo] = dataclasses.field(default_factory=list)
+    directives: List[DirectiveInfo] = dataclasses.field(default_factory=list)
+    # Enum values, union members or implemented interfaces
+    names: List[str] = dataclasses.field(default_factory=list)
+    # Named types its fields and their arguments refer to, in document order
+    uses: List[str] = dataclasses.field(default_factory=list)
 
 
-class SchemaInfo(BaseModel):
-    """Parsed GraphQL schema information."""
+@dataclasses.dataclass(slots=True)
+class SchemaFragment:
+    """The definitions of one SDL document, before merging with others."""
 
-    types: List[TypeInfo] = []
-    scalars: List[str] = []
-    enums: List[EnumInfo] = []
+    definitions: List[DefinitionInfo] = dataclasses.field(default_factory=list)
+    # Named types the arguments of directive definitions refer to
+    directive_uses: List[str] = dataclasses.field(default_factory=list)
 
 
-def parse_schema_file(schema_path: Path) -> GraphQLSchema:
+def parse_schema_file(schema_path: Path) -> "GraphQLSchema":
     """Parse GraphQL schema from file."""
     if not schema_path.exists():
         raise FileNotFoundError(f"Schema file not found: {schema_path}")
@@ -71,14 +181,42 @@ def parse_schema_file(schema_path: Path) -> GraphQLSchema:
     with open(schema_path, "r") as f:
         schema_text = f.read()
 
+    return parse_schema_text(schema_text)
+
+
+def parse_schema_text(schema_text: str) -> "GraphQLSchema":
+    """Parse GraphQL schema from SDL text."""
+    from graphql import build_schema
+
     try:
-        return build_schema(schema_text)
+        with phase("build_schema"):
+            return build_schema(schema_text)
     except Exception as e:
         raise ValueError(f"Failed to parse GraphQL schema: {e}")
 
 
-def extract_type_name(graphql_type: GraphQLType) -> tuple[str, bool, bool]:
+def parse_schema(schema_text: str, validate: bool = True) -> SchemaInfo:
+    """Parse SDL text into SchemaInfo, optionally skipping validation."""
+    if validate:
+        schema = parse_schema_text(schema_text)
+        with phase("parse_schema_info"):
+            return parse_schema_info(schema)
+
+    from .fast_parse import parse_schema_document
+
+    with phase("fast_parse"):
+        return parse_schema_document(schema_text)
+
+
+def validate_schema_text(schema_text: str) -> None:
+    """Raise ValueError unless schema_text passes build_schema's SDL validation."""
+    parse_schema_text(schema_text)
+
+
+def extract_type_name(graphql_type: "GraphQLType") -> tuple[str, bool, bool]:
     """Extract type name, list flag, and required flag from GraphQL type."""
+    from graphql import GraphQLList, GraphQLNonNull
+
     is_required = False
     is_list = False
 
@@ -98,10 +236,12 @@ def extract_type_name(graphql_type: GraphQLType) -> tuple[str, bool, bool]:
 
     # Get name from GraphQL type - check if it has name attribute
     name = getattr(graphql_type, "name", str(graphql_type))
-    return name, is_list, is_required
+    return intern(name), is_list, is_required
 
 
-def extract_directive_info(directives: List[GraphQLDirective]) -> List[DirectiveInfo]:
+def extract_directive_info(
+    directives: List["GraphQLDirective"],
+) -> List[DirectiveInfo]:
     """Extract directive information from GraphQL directives."""
     directive_infos = []
 
@@ -121,8 +261,16 @@ def extract_directive_info(directives: List[GraphQLDirective]) -> List[Directive
     return directive_infos
 
 
-def parse_schema_info(schema: GraphQLSchema) -> SchemaInfo:
+def parse_schema_info(schema: "GraphQLSchema") -> SchemaInfo:
     """Extract structured information from GraphQL schema."""
+    from graphql import (
+        GraphQLEnumType,
+        GraphQLInterfaceType,
+        GraphQLObjectType,
+        GraphQLScalarType,
+        GraphQLUnionType,
+    )
+
     types = []
     scalars = []
     enums = []
@@ -141,131 +289,21 @@ def parse_schema_info(schema: GraphQLSchema) -> SchemaInfo:
                 enum_values = list(graphql_type.values.keys())
             enums.append(EnumInfo(name=type_name, values=enum_values))
 
-        elif isinstance(graphql_type, GraphQLObjectType):
-            fields = []
-
-            for field_name, field in graphql_type.fields.items():
-                field_type_name, is_list, is_required = extract_type_name(field.type)
-
-                # Extract directives from field AST node if available
-                field_directives = []
-                if (
-                    hasattr(field, "ast_node")
-                    and field.ast_node
-                    and field.ast_node.directives
-                ):
-                    for directive_node in field.ast_node.directives:
-                        args = {}
-                        if directive_node.arguments:
-                            for arg in directive_node.arguments:
-                                # Handle string values
-                                if hasattr(arg.value, "value"):
-                                    args[arg.name.value] = arg.value.value
-                                else:
-                                    args[arg.name.value] = str(arg.value)
-                        field_directives.append(
-                            DirectiveInfo(name=directive_node.name.value, args=args)
-                        )
-
-                fields.append(
-                    FieldInfo(
-                        name=field_name,
-                        type_name=field_type_name,
-                        is_list=is_list,
-                        is_required=is_required,
-                        directives=field_directives,
-                    )
-                )
-
-            # Extract type-level directives
-            type_directives = []
-            if (
-                hasattr(graphql_type, "ast_node")
-                and graphql_type.ast_node
-                and graphql_type.ast_node.directives
-            ):
-                for directive_node in graphql_type.ast_node.directives:
-                    args = {}
-                    if directive_node.arguments:
-                        for arg in directive_node.arguments:
-                            if hasattr(arg.value, "value"):
-                                args[arg.name.value] = arg.value.value
-                            else:
-                                args[arg.name.value] = str(arg.value)
-                    type_directives.append(
-                        DirectiveInfo(name=directive_node.name.value, args=args)
-                    )
-
-            # Extract interfaces that this object implements
-            interfaces = []
-            if hasattr(graphql_type, "interfaces"):
-                interfaces = [iface.name for iface in graphql_type.interfaces]
-
-            types.append(
-                TypeInfo(
-                    name=type_name,
-                    fields=fields,
-                    directives=type_directives,
-                    kind="object",
-                    interfaces=interfaces,
-                )
-            )
-
-        elif isinstance(graphql_type, GraphQLInterfaceType):
+        elif isinstance(graphql_type, (GraphQLObjectType, GraphQLInterfaceType)):
             fields = []
-
             for field_name, field in graphql_type.fields.items():
                 field_type_name, is_list, is_required = extract_type_name(field.type)
-
-                # Extract directives from field AST node if available
-                field_directives = []
-                if (
-                    hasattr(field, "ast_node")
-                    and field.ast_node
-                    and field.ast_node.directives
-                ):
-                    for directive_node in field.ast_node.directives:
-                        args = {}
-                        if directive_node.arguments:
-                            for arg in directive_node.arguments:
-                                if hasattr(arg.value, "value"):
-                                    args[arg.name.value] = arg.value.value
-                                else:
-                                    args[arg.name.value] = str(arg.value)
-                        field_directives.append(
-                            DirectiveInfo(name=directive_node.name.value, args=args)
-                        )
-
                 fields.append(
                     FieldInfo(
-                        name=field_name,
+                        name=intern(field_name),
                         type_name=field_type_name,
                         is_list=is_list,
                         is_required=is_required,
-                        directives=field_directives,
+                        directives=directives_from_ast(field.ast_node),
                     )
                 )
 
-            # Extract type-level directives
-            type_directives = []
-            if (
-                hasattr(graphql_type, "ast_node")
-                and graphql_type.ast_node
-                and graphql_type.ast_node.directives
-            ):
-                for directive_node in graphql_type.ast_node.directives:
-                    args = {}
-                    if directive_node.arguments:
-                        for arg in directive_node.arguments:
-                            if hasattr(arg.value, "value"):
-                                args[arg.name.value] = arg.value.value
-                            else:
-                                args[arg.name.value] = str(arg.value)
-                    type_directives.append(
-                        DirectiveInfo(name=directive_node.name.value, args=args)
-                    )
-
-            # Extract interfaces that this interface implements
+            # Extract interfaces that this object or interface implements
             interfaces = []
             if hasattr(graphql_type, "interfaces"):
                 interfaces = [iface.name for iface in graphql_type.interfaces]
@@ -274,8 +312,12 @@ def parse_schema_info(schema: GraphQLSchema) -> SchemaInfo:
                 TypeInfo(
                     name=type_name,
                     fields=fields,
-                    directives=type_directives,
-                    kind="interface",
+                    directives=directives_from_ast(graphql_type.ast_node),
+                    kind=(
+                        "interface"
+                        if isinstance(graphql_type, GraphQLInterfaceType)
+                        else "object"
+                    ),
                     interfaces=interfaces,
                 )
             )
@@ -286,30 +328,11 @@ def parse_schema_info(schema: GraphQLSchema) -> SchemaInfo:
             if hasattr(graphql_type, "types"):
                 union_types = [member.name for member in graphql_type.types]
 
-            # Extract type-level directives
-            type_directives = []
-            if (
-                hasattr(graphql_type, "ast_node")
-                and graphql_type.ast_node
-                and graphql_type.ast_node.directives
-            ):
-                for directive_node in graphql_type.ast_node.directives:
-                    args = {}
-                    if directive_node.arguments:
-                        for arg in directive_node.arguments:
-                            if hasattr(arg.value, "value"):
-                                args[arg.name.value] = arg.value.value
-                            else:
-                                args[arg.name.value] = str(arg.value)
-                    type_directives.append(
-                        DirectiveInfo(name=directive_node.name.value, args=args)
-                    )
-
             types.append(
                 TypeInfo(
                     name=type_name,
                     fields=[],  # Unions don't have fields
-                    directives=type_directives,
+                    directives=directives_from_ast(graphql_type.ast_node),
                     kind="union",
                     union_types=union_types,
                 )
@@ -318,6 +341,21 @@ def parse_schema_info(schema: GraphQLSchema) -> SchemaInfo:
     return SchemaInfo(types=types, scalars=scalars, enums=enums)
 
 
+def directives_from_ast(node: Any) -> List[DirectiveInfo]:
+    """DirectiveInfo for each directive applied on an SDL node (None: no node)."""
+    infos = []
+    for directive_node in getattr(node, "directives", None) or ():
+        args = {}
+        for arg in directive_node.arguments or ():
+            # Scalar values keep their value; lists and objects their node repr
+            if hasattr(arg.value, "value"):
+                args[arg.name.value] = arg.value.value
+            else:
+                args[arg.name.value] = str(arg.value)
+        infos.append(DirectiveInfo(name=intern(directive_node.name.value), args=args))
+    return infos
+
+
 def load_and_parse_schema(schema_dir: Path) -> SchemaInfo:
     """Load schema file and parse into structured information."""
     schema_path = schema_dir / "schema.graphql"
@@ -325,48 +363,61 @@ def load_and_parse_schema(schema_dir: Path) -> SchemaInfo:
     return parse_schema_info(schema)
 
 
-def load_and_parse_schema_with_config(schema_dir: Path, config) -> SchemaInfo:
-    """Load schema with potential line extraction based on config."""
+def load_schema_text(schema_dir: Path, config) -> str:
+    """Read the SDL selected by config as one document.
+
+    That is the schema_files joined together, a base_schema slice, or
+    schema.graphql.
+    """
+    if config.schema_files:
+        from .schema_files import join_schema_files, read_schema_files
+
+        return join_schema_files(read_schema_files(schema_dir, config.schema_files))
     if config.base_schema and config.schema_lines:
         # Extract lines from base schema
         base_schema_path = Path(config.base_schema)
         if not base_schema_path.is_absolute():
             # Make path relative to current working directory, not schema_dir
             base_schema_path = Path.cwd() / base_schema_path
-        schema_content = extract_schema_lines(base_schema_path, config.schema_lines)
-        schema = build_schema(schema_content)
-    else:
-        # Use regular schema file
-        schema_path = schema_dir / "schema.graphql"
-        schema = parse_schema_file(schema_path)
+        return extract_schema_lines(
+            base_schema_path, config.schema_lines, open_cache(config, "lines")
+        )
 
-    return parse_schema_info(schema)
+    schema_path = schema_dir / "schema.graphql"
+    if not schema_path.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    return schema_path.read_text()
+
+
+def load_and_parse_schema_with_config(schema_dir: Path, config) -> SchemaInfo:
+    """Load schema with potential line extraction based on config."""
+    from .schema_cache import parse_schema_cached
 
+    schema_text = load_schema_text(schema_dir, config)
+    return parse_schema_cached(
+        schema_text, not config.fast_parse, open_cache(config, "schema")
+    )
 
-def extract_schema_lines(schema_path: Path, line_ranges: str) -> str:
+
+def extract_schema_lines(
+    schema_path: Path, line_ranges: str, cache: Optional[DiskCache] = None
+) -> str:
     """Extract specific lines from a schema file based on line ranges.
 
+    Overlapping or unordered ranges are merged and read in file order.
+
     Args:
         schema_path: Path to the schema file
         line_ranges: String like "1-10,15-20,25" specifying which lines to include
+        cache: Where to keep the file's line index between processes
 
     Returns:
         Extracted schema content as string
+
+    Raises:
+        ValueError: if a range is malformed or past the end of the file
     """
-    with open(schema_path, "r") as f:
-        lines = f.readlines()
-
-    ranges = line_ranges.split(",")
-
-    selected_lines = []
-    for range_spec in (r.strip() for r in ranges):
-        if "-" in range_spec:
-            start, end = map(int, range_spec.split("-"))
-            # Convert to 0-based indexing
-            selected_lines.extend(lines[start - 1 : end])
-        else:
-            # Single line
-            line_num = int(range_spec)
-            selected_lines.append(lines[line_num - 1])
-
-    return "".join(selected_lines)
+    from .line_index import merge_line_ranges, parse_line_ranges, read_line_ranges
+
+    ranges = merge_line_ranges(parse_line_ranges(line_ranges))
+    return read_line_ranges(schema_path, ranges, cache)
@@ -0,0 +1,214 @@
+"""Persistent cache of parsed SchemaInfo, loaded without importing graphql-core.
+
+Entries are marshal-encoded tuples. Keys cover the codegen code (its version
+and sources), the encoding version and the marshal format, so an upgrade
+never reads an entry written by another release.
+"""
+
+import marshal
+from typing import Any, List, Optional
+
+from .cache import DiskCache, code_version, content_hash
+from .timings import phase
+from .parser import (
+    DefinitionInfo,
+    DirectiveInfo,
+    EnumInfo,
+    FieldInfo,
+    SchemaFragment,
+    SchemaInfo,
+    TypeInfo,
+    parse_schema,
+    validate_schema_text,
+)
+
+# Bump whenever the layout of encode_schema_info or encode_fragment changes
+FORMAT_VERSION = 1
+
+
+def parse_schema_cached(
+    schema_text: str, validate: bool, cache: Optional[DiskCache]
+) -> SchemaInfo:
+    """parse_schema, reusing the entry stored for identical schema text.
+
+    The text is what a base_schema slice produced, so the slice spec is
+    covered by it.
+    """
+    if cache is None:
+        return parse_schema(schema_text, validate)
+
+    key = schema_cache_key(schema_text, validate)
+    with phase("load_cached_schema"):
+        data = cache.get(key)
+        schema_info = decode_schema_info(data) if data is not None else None
+    if schema_info is None:
+        schema_info = parse_schema(schema_text, validate)
+        try:
+            cache.put(key, encode_schema_info(schema_info))
+        except ValueError:
+            pass  # a directive argument marshal cannot encode; parse each time
+    return schema_info
+
+
+def validate_schema_cached(schema_text: str, cache: Optional[DiskCache]) -> None:
+    """validate_schema_text, skipped for text that passed before.
+
+    Only passing texts are recorded, so an invalid schema raises every time.
+    """
+    if cache is None:
+        validate_schema_text(schema_text)
+        return
+
+    key = content_hash(code_version(), "schema-valid", schema_text)
+    if cache.get(key) is not None:
+        return
+    validate_schema_text(schema_text)
+    cache.put(key, b"")
+
+
+def schema_cache_key(schema_text: str, validate: bool) -> str:
+    return content_hash(
+        code_version(),
+        f"schema-ir-{FORMAT_VERSION}-marshal-{marshal.version}",
+        "validate" if validate else "fast",
+        schema_text,
+    )
+
+
+def fragment_cache_key(schema_text: str) -> str:
+    """Key of one schema file's SchemaFragment."""
+    return content_hash(
+        code_version(),
+        f"schema-fragment-{FORMAT_VERSION}-marshal-{marshal.version}",
+        schema_text,
+    )
+
+
+def encode_schema_info(schema_info: SchemaInfo) -> bytes:
+    """Pack SchemaInfo into nested tuples; raises ValueError if unencodable."""
+    return marshal.dumps(
+        (
+            FORMAT_VERSION,
+            [
+                (
+                    t.name,
+                    t.kind,
+                    _encode_fields(t.fields),
+                    _encode_directives(t.directives),
+                    t.interfaces,
+                    t.union_types,
+                )
+                for t in schema_info.types
+            ],
+            schema_info.scalars,
+            [(e.name, e.values) for e in schema_info.enums],
+        )
+    )
+
+
+def decode_schema_info(data: bytes) -> Optional[SchemaInfo]:
+    """Unpack encode_schema_info's output, or None for a foreign or bad entry."""
+    try:
+        version, types, scalars, enums = marshal.loads(data)
+    except (EOFError, TypeError, ValueError):
+        return None
+    if version != FORMAT_VERSION:
+        return None
+
+    return SchemaInfo(
+        types=[
+            TypeInfo(
+                name=name,
+                kind=kind,
+                fields=_decode_fields(fields),
+                directives=_decode_directives(directives),
+                interfaces=interfaces,
+                union_types=union_types,
+            )
+            for name, kind, fields, directives, interfaces, union_types in types
+        ],
+        scalars=scalars,
+        enums=[EnumInfo(name=n, values=v) for n, v in enums],
+    )
+
+
+def encode_fragment(fragment: SchemaFragment) -> bytes:
+    """Pack one file's SchemaFragment; raises ValueError if unencodable."""
+    return marshal.dumps(
+        (
+            FORMAT_VERSION,
+            [
+                (
+                    d.name,
+                    d.kind,
+                    d.is_extension,
+                    _encode_fields(d.fields),
+                    _encode_directives(d.directives),
+                    d.names,
+                    d.uses,
+                )
+                for d in fragment.definitions
+            ],
+            fragment.directive_uses,
+        )
+    )
+
+
+def decode_fragment(data: bytes) -> Optional[SchemaFragment]:
+    """Unpack encode_fragment's output, or None for a foreign or bad entry."""
+    try:
+        version, definitions, directive_uses = marshal.loads(data)
+    except (EOFError, TypeError, ValueError):
+        return None
+    if version != FORMAT_VERSION:
+        return None
+
+    return SchemaFragment(
+        definitions=[
+            DefinitionInfo(
+                name=name,
+                kind=kind,
+                is_extension=is_extension,
+                fields=_decode_fields(fields),
+                directives=_decode_directives(directives),
+                names=names,
+                uses=uses,
+            )
+            for name, kind, is_extension, fields, directives, names, uses in definitions
+        ],
+        directive_uses=directive_uses,
+    )
+
+
+def _encode_fields(fields: List[FieldInfo]) -> List[Any]:
+    return [
+        (
+            f.name,
+            f.type_name,
+            f.is_list,
+            f.is_required,
+            _encode_directives(f.directives),
+        )
+        for f in fields
+    ]
+
+
+def _decode_fields(encoded: List[Any]) -> List[FieldInfo]:
+    return [
+        FieldInfo(
+            name=name,
+            type_name=type_name,
+            is_list=is_list,
+            is_required=is_required,
+            directives=_decode_directives(directives),
+        )
+        for name, type_name, is_list, is_required, directives in encoded
+    ]
+
+
+def _encode_directives(directives: List[DirectiveInfo]) -> List[Any]:
+    return [(d.name, d.args) for d in directives]
+
+
+def _decode_directives(encoded: List[Any]) -> List[DirectiveInfo]:
+    return [DirectiveInfo(name=n, args=a) for n, a in encoded]
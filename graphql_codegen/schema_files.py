@@ -0,0 +1,119 @@
+"""Schemas split over many SDL files, parsed file by file and merged.
+
+Each file becomes a SchemaFragment, cached by its content, so editing one
+file re-parses only that file. Files missing from the cache are parsed in
+parallel when config.jobs allows. Fragments merge in path order, with
+`extend type` applying across files.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .cache import DiskCache
+from .parser import SchemaFragment, SchemaInfo
+from .schema_cache import decode_fragment, encode_fragment, fragment_cache_key
+
+SchemaFile = Tuple[str, str]  # (path relative to the schema directory, SDL)
+
+
+def find_schema_files(schema_dir: Path, pattern: str) -> List[Path]:
+    """Files selected by pattern, relative to schema_dir, in path order.
+
+    A directory selects every *.graphql file below it; anything else is a
+    glob such as "types/**/*.graphql".
+    """
+    base = schema_dir / pattern
+    candidates = base.rglob("*.graphql") if base.is_dir() else schema_dir.glob(pattern)
+    files = sorted(path for path in candidates if path.is_file())
+    if not files:
+        raise FileNotFoundError(f"No schema files match '{pattern}' in {schema_dir}")
+    return files
+
+
+def schema_files_root(schema_dir: Path, pattern: str) -> Path:
+    """Directory holding every file pattern can select, to watch for new ones."""
+    root = schema_dir
+    for part in Path(pattern).parts:
+        if any(c in part for c in "*?["):
+            break
+        root = root / part
+    return root if root.is_dir() else root.parent
+
+
+def read_schema_files(schema_dir: Path, pattern: str) -> List[SchemaFile]:
+    return [
+        (os.path.relpath(path, schema_dir), path.read_text())
+        for path in find_schema_files(schema_dir, pattern)
+    ]
+
+
+def join_schema_files(files: List[SchemaFile]) -> str:
+    """The files as one SDL document, each preceded by a comment naming it."""
+    return "".join(f"# {name}\n{text}\n" for name, text in files)
+
+
+def parse_schema_files(
+    files: List[SchemaFile], cache: Optional[DiskCache], jobs: int = 1
+) -> SchemaInfo:
+    """Merge the fragments of files, parsing only those not in the cache.
+
+    Raises:
+        ValueError: naming the file, if one has a syntax error; or if a type
+            is defined in two files
+    """
+    from .fast_parse import merge_fragments
+
+    keys = [fragment_cache_key(text) for _, text in files]
+    fragments: List[Optional[SchemaFragment]] = [None] * len(files)
+    if cache:
+        for i, data in enumerate(cache.get(key) for key in keys):
+            fragments[i] = decode_fragment(data) if data is not None else None
+    pending = [i for i, fragment in enumerate(fragments) if fragment is None]
+
+    workers = min(jobs or os.cpu_count() or 1, len(pending))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            encoded = list(pool.map(_parse_encoded, [files[i] for i in pending]))
+    else:
+        encoded = [None] * len(pending)
+
+    fresh = {}
+    for i, data in zip(pending, encoded):
+        fragment = decode_fragment(data) if data is not None else None
+        if fragment is None:  # parsed serially, or not encodable
+            fragment = _parse(files[i])
+            try:
+                data = encode_fragment(fragment)
+            except ValueError:
+                data = None  # a directive argument marshal cannot encode
+        fragments[i] = fragment
+        if data is not None:
+            fresh[keys[i]] = data
+    if cache and fresh:
+        cache.put_many(fresh)
+
+    return merge_fragments(
+        [(name, f) for (name, _), f in zip(files, fragments) if f is not None]
+    )
+
+
+def _parse(schema_file: SchemaFile) -> SchemaFragment:
+    from .fast_parse import parse_fragment
+
+    name, text = schema_file
+    try:
+        return parse_fragment(text)
+    except ValueError as e:
+        raise ValueError(f"{name}: {e}")
+
+
+def _parse_encoded(schema_file: SchemaFile) -> Optional[bytes]:
+    """Parse in a worker; the encoding is cheaper to send back than objects."""
+    fragment = _parse(schema_file)
+    try:
+        return encode_fragment(fragment)
+    except ValueError:
+        return None
@@ -0,0 +1,96 @@
+"""Long-lived generation server over a Unix socket, and its client.
+
+The protocol is one JSON object per line: a client connects, sends one request
+line and reads one response line. Requests run one at a time in the server
+process, so its parsed schemas, templates and rendered blocks stay warm.
+"""
+
+import errno
+import json
+import os
+import socket
+import socketserver
+import stat
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from . import __version__
+from .cache import default_cache_dir
+
+Handler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def default_socket_path() -> Path:
+    """$GRAPHQL_CODEGEN_SOCKET, else server.sock in the cache directory."""
+    env_path = os.environ.get("GRAPHQL_CODEGEN_SOCKET")
+    return Path(env_path) if env_path else default_cache_dir() / "server.sock"
+
+
+def serve(socket_path: Path, handle: Handler) -> None:
+    """Answer requests on socket_path until interrupted.
+
+    Requests from a different codegen version are refused, so clients fall
+    back to generating locally.
+
+    Raises:
+        OSError: if a server already listens on socket_path, or something
+            other than a socket is there
+    """
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                request = json.loads(self.rfile.readline())
+                if request.get("version") != __version__:
+                    response = {"error": f"server runs version {__version__}"}
+                elif request.get("ping"):
+                    response = {"pong": True}
+                else:
+                    response = handle(request)
+            except Exception as e:
+                response = {"error": str(e)}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    remove_stale_socket(socket_path)
+    with socketserver.UnixStreamServer(str(socket_path), RequestHandler) as server:
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def remove_stale_socket(socket_path: Path) -> None:
+    """Unlink a socket left behind by a server that died.
+
+    Only a socket that refuses connections is removed; a live server, whatever
+    its version, keeps its socket.
+    """
+    try:
+        if not stat.S_ISSOCK(socket_path.lstat().st_mode):
+            raise OSError(errno.EEXIST, f"{socket_path} exists and is not a socket")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+    except FileNotFoundError:
+        return
+    except ConnectionRefusedError:
+        socket_path.unlink()
+        return
+    raise OSError(errno.EADDRINUSE, f"A server is already listening on {socket_path}")
+
+
+def forward(socket_path: Path, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send one request; None if no server is listening or it refused."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps({"version": __version__, **request}).encode())
+            sock.sendall(b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    response = json.loads(line)
+    return None if "error" in response else response
@@ -0,0 +1,120 @@
+"""Split generated models into lazily imported shard modules.
+
+Shards are the strongly connected components of the type reference graph, so
+imports between shards form a DAG: each shard imports its dependencies up front,
+and importing one type loads only the types it can reach.
+"""
+
+from typing import Dict, Iterator, List
+
+from pydantic import BaseModel
+
+from .parser import SchemaInfo
+
+
+class Shard(BaseModel):
+    """One generated module under gen/models/."""
+
+    module: str  # module name, without the package prefix
+    names: List[str]  # types, unions and enums defined here, in schema order
+    imports: Dict[str, List[str]] = {}  # shard module -> names imported from it
+
+
+def plan_shards(names: List[str], schema_info: SchemaInfo) -> List[Shard]:
+    """Group generated names (in schema order) into shards."""
+    position = {name: i for i, name in enumerate(names)}
+    graph = {name: _references(name, schema_info, position) for name in names}
+
+    components = sorted(
+        (sorted(c, key=position.__getitem__) for c in strongly_connected(graph)),
+        key=lambda c: position[c[0]],
+    )
+    module_of = {name: f"_{c[0]}" for c in components for name in c}
+
+    shards = []
+    for component in components:
+        module = module_of[component[0]]
+        needed = {
+            dependency
+            for name in component
+            for reference in graph[name]
+            for dependency in _with_union_members(reference, graph, schema_info)
+            if module_of[dependency] != module
+        }
+        imports: Dict[str, List[str]] = {}
+        for dependency in sorted(needed, key=position.__getitem__):
+            imports.setdefault(module_of[dependency], []).append(dependency)
+        shards.append(
+            Shard(
+                module=module,
+                names=component,
+                imports=dict(sorted(imports.items(), key=lambda i: position[i[1][0]])),
+            )
+        )
+    return shards
+
+
+def _references(
+    name: str, schema_info: SchemaInfo, position: Dict[str, int]
+) -> List[str]:
+    """Generated names that name's definition refers to."""
+    type_info = schema_info.types_by_name.get(name)
+    if type_info is None:  # enum
+        return []
+    references = [f.type_name for f in type_info.fields]
+    references += type_info.interfaces + type_info.union_types
+    return list(dict.fromkeys(r for r in references if r in position))
+
+
+def _with_union_members(
+    name: str, graph: Dict[str, List[str]], schema_info: SchemaInfo
+) -> Iterator[str]:
+    """name plus, for unions, every member the string annotations refer to."""
+    yield name
+    type_info = schema_info.types_by_name.get(name)
+    if type_info is not None and type_info.kind == "union":
+        for member in graph[name]:
+            yield from _with_union_members(member, graph, schema_info)
+
+
+def strongly_connected(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """Tarjan's algorithm, iterative so deep schemas cannot hit the recursion limit."""
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    components = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph[child])))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
@@ -0,0 +1,56 @@
+"""Restrict a schema to the types reachable from a set of root types.
+
+A type reaches the types of its fields, the interfaces it implements and, for
+unions, its members. Enums and scalars are kept when something reached uses
+them. Implementations of a reached interface are not pulled in; name them as
+roots when they are needed.
+"""
+
+from typing import Iterable, List, Set
+
+from .parser import SchemaInfo, TypeInfo
+
+
+def select_roots(schema_info: SchemaInfo, roots: Iterable[str]) -> SchemaInfo:
+    """The part of schema_info that roots reach, in schema order.
+
+    Raises:
+        ValueError: if a root names no type or enum in the schema
+    """
+    reached = reachable_names(schema_info, roots)
+    return SchemaInfo(
+        types=[t for t in schema_info.types if t.name in reached],
+        scalars=[s for s in schema_info.scalars if s in reached],
+        enums=[e for e in schema_info.enums if e.name in reached],
+    )
+
+
+def reachable_names(schema_info: SchemaInfo, roots: Iterable[str]) -> Set[str]:
+    """Names of the types, enums and scalars in the transitive closure of roots."""
+    types_by_name = schema_info.types_by_name
+    roots = list(roots)
+    unknown = [
+        root
+        for root in roots
+        if root not in types_by_name and root not in schema_info.enums_by_name
+    ]
+    if unknown:
+        raise ValueError(f"Unknown root types: {', '.join(unknown)}")
+
+    reached = set(roots)
+    pending: List[str] = list(reached)
+    while pending:
+        type_info = types_by_name.get(pending.pop())
+        if type_info is None:  # enum or scalar
+            continue
+        for name in _references(type_info):
+            if name not in reached:
+                reached.add(name)
+                pending.append(name)
+    return reached
+
+
+def _references(type_info: TypeInfo) -> Iterable[str]:
+    yield from (f.type_name for f in type_info.fields)
+    yield from type_info.interfaces
+    yield from type_info.union_types
@@ -1 +1,86 @@
-"""Templates for code generation."""
+"""Templates for code generation.
+
+Jinja2 is imported only to build an environment, so hashing the templates
+for a cache lookup stays cheap.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from ..cache import code_version, content_hash
+from ..config import CodegenConfig, cache_root
+
+if TYPE_CHECKING:
+    from jinja2 import BaseLoader, Environment
+
+TEMPLATE_DIR = Path(__file__).parent
+
+
+def template_search_path(config: Optional[CodegenConfig] = None) -> Tuple[str, ...]:
+    """The configured templates directory, if any, ahead of the bundled one."""
+    if config is not None and config.templates:
+        return (str(Path(config.templates).resolve()), str(TEMPLATE_DIR))
+    return (str(TEMPLATE_DIR),)
+
+
+def get_template_env(config: Optional[CodegenConfig] = None) -> "Environment":
+    """Get the process-wide Jinja2 environment for config's templates.
+
+    Bundled templates load from the modules precompiled into the wheel. Other
+    templates are kept in memory per search path and, when caching is enabled,
+    as bytecode on disk; Jinja recompiles a template whose source changed.
+    """
+    root = cache_root(config) if config is not None else None
+    bytecode_dir = str(root / "jinja") if root else None
+    return _load_template_env(template_search_path(config), bytecode_dir)
+
+
+@lru_cache(maxsize=None)
+def _load_template_env(
+    search_path: Tuple[str, ...], bytecode_dir: Optional[str]
+) -> "Environment":
+    from jinja2 import (
+        ChoiceLoader,
+        Environment,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+    )
+
+    from .precompile import add_filters
+
+    bytecode_cache = None
+    if bytecode_dir:
+        Path(bytecode_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+    # User templates come first and shadow bundled templates of the same name
+    loaders: List["BaseLoader"] = [FileSystemLoader(p) for p in search_path[:-1]]
+    loaders.append(_bundled_loader())
+    env = Environment(loader=ChoiceLoader(loaders), bytecode_cache=bytecode_cache)
+    add_filters(env)
+    return env
+
+
+def _bundled_loader() -> "BaseLoader":
+    """Precompiled bundled templates when present and current, else their sources."""
+    from jinja2 import FileSystemLoader, ModuleLoader
+
+    from .precompile import COMPILED_DIR, sources_hash
+
+    try:
+        from .compiled import SOURCES_HASH  # type: ignore[import-not-found]
+    except ImportError:
+        return FileSystemLoader(TEMPLATE_DIR)
+    if SOURCES_HASH != sources_hash():
+        return FileSystemLoader(TEMPLATE_DIR)
+    return ModuleLoader(COMPILED_DIR)
+
+
+def templates_hash(config: Optional[CodegenConfig] = None) -> str:
+    """Hash the codegen code and the template sources in use."""
+    sources = [
+        path.read_bytes()
+        for directory in template_search_path(config)
+        for path in sorted(Path(directory).glob("*.j2"))
+    ]
+    return content_hash(code_version(), *sources)
@@ -0,0 +1,3 @@
+"""Precompiled templates - DO NOT EDIT."""
+
+SOURCES_HASH = "1715d7f30f4e5ff294494bf786d296af8da7f9d83b278b8bb6a1d7ed59b29ac1"
@@ -0,0 +1,32 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'models_init.py.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_package_name = resolve('package_name')
+    l_0_shards = resolve('shards')
+    pass
+    yield '"""Generated models for '
+    yield str((undefined(name='package_name') if l_0_package_name is missing else l_0_package_name))
+    yield ', imported one shard at a time - DO NOT EDIT."""\n\nfrom importlib import import_module\nfrom typing import Any, List\n\n_SHARDS = {'
+    for l_1_shard in (undefined(name='shards') if l_0_shards is missing else l_0_shards):
+        _loop_vars = {}
+        pass
+        for l_2_name in environment.getattr(l_1_shard, 'names'):
+            _loop_vars = {}
+            pass
+            yield '\n    "'
+            yield str(l_2_name)
+            yield '": ".'
+            yield str(environment.getattr(l_1_shard, 'module'))
+            yield '",'
+        l_2_name = missing
+    l_1_shard = missing
+    yield '\n}\n\n__all__ = list(_SHARDS)\n\n\ndef __getattr__(name: str) -> Any:\n    if name not in _SHARDS:\n        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")\n    value = getattr(import_module(_SHARDS[name], __name__), name)\n    globals()[name] = value\n    return value\n\n\ndef __dir__() -> List[str]:\n    return __all__'
+
+blocks = {}
+debug_info = '1=14&7=16&8=19&9=23'
\ No newline at end of file
@@ -0,0 +1,91 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'models.py.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_additional_imports = resolve('additional_imports')
+    l_0_needs_computable_import = resolve('needs_computable_import')
+    l_0_needs_expandable_import = resolve('needs_expandable_import')
+    l_0_import_list = resolve('import_list')
+    l_0_auto_module = resolve('auto_module')
+    l_0_model_imports = resolve('model_imports')
+    l_0_enums = resolve('enums')
+    l_0_type_blocks = resolve('type_blocks')
+    l_0_types = resolve('types')
+    l_0_render_enums = l_0_render_unions = l_0_render_model_rebuilds = missing
+    try:
+        t_1 = environment.filters['default']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'default' found.")
+    try:
+        t_2 = environment.filters['join']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'join' found.")
+    pass
+    included_template = environment.get_template('macros.j2', 'models.py.j2')._get_default_module(context)
+    l_0_render_enums = getattr(included_template, 'render_enums', missing)
+    if l_0_render_enums is missing:
+        l_0_render_enums = undefined(f"the template {included_template.__name__!r} (imported on line 1 in 'models.py.j2') does not export the requested name 'render_enums'", name='render_enums')
+    l_0_render_unions = getattr(included_template, 'render_unions', missing)
+    if l_0_render_unions is missing:
+        l_0_render_unions = undefined(f"the template {included_template.__name__!r} (imported on line 1 in 'models.py.j2') does not export the requested name 'render_unions'", name='render_unions')
+    l_0_render_model_rebuilds = getattr(included_template, 'render_model_rebuilds', missing)
+    if l_0_render_model_rebuilds is missing:
+        l_0_render_model_rebuilds = undefined(f"the template {included_template.__name__!r} (imported on line 1 in 'models.py.j2') does not export the requested name 'render_model_rebuilds'", name='render_model_rebuilds')
+    context.vars.update({'render_enums': l_0_render_enums, 'render_unions': l_0_render_unions, 'render_model_rebuilds': l_0_render_model_rebuilds})
+    context.exported_vars.difference_update(('render_enums', 'render_unions', 'render_model_rebuilds'))
+    yield '\nfrom __future__ import annotations\nfrom typing import List, Optional, Any, Dict, Union\nfrom pydantic import BaseModel, Field\nfrom enum import Enum'
+    if (undefined(name='additional_imports') if l_0_additional_imports is missing else l_0_additional_imports):
+        pass
+        for l_1_import_line in (undefined(name='additional_imports') if l_0_additional_imports is missing else l_0_additional_imports):
+            _loop_vars = {}
+            pass
+            yield '\n'
+            yield str(l_1_import_line)
+        l_1_import_line = missing
+    if ((undefined(name='needs_computable_import') if l_0_needs_computable_import is missing else l_0_needs_computable_import) or (undefined(name='needs_expandable_import') if l_0_needs_expandable_import is missing else l_0_needs_expandable_import)):
+        pass
+        l_0_import_list = []
+        context.vars['import_list'] = l_0_import_list
+        context.exported_vars.add('import_list')
+        if (undefined(name='needs_computable_import') if l_0_needs_computable_import is missing else l_0_needs_computable_import):
+            pass
+            yield str((context.call(environment.getattr((undefined(name='import_list') if l_0_import_list is missing else l_0_import_list), 'append'), 'Computable') or ''))
+        if (undefined(name='needs_expandable_import') if l_0_needs_expandable_import is missing else l_0_needs_expandable_import):
+            pass
+            yield str((context.call(environment.getattr((undefined(name='import_list') if l_0_import_list is missing else l_0_import_list), 'append'), 'Expandable') or ''))
+        yield '\nfrom '
+        yield str(t_1((undefined(name='auto_module') if l_0_auto_module is missing else l_0_auto_module), '.auto'))
+        yield ' import '
+        yield str(t_2(context.eval_ctx, (undefined(name='import_list') if l_0_import_list is missing else l_0_import_list), ', '))
+    for (l_1_module, l_1_names) in context.call(environment.getattr(((undefined(name='model_imports') if l_0_model_imports is missing else l_0_model_imports) or {}), 'items')):
+        _loop_vars = {}
+        pass
+        yield '\nfrom .'
+        yield str(l_1_module)
+        yield ' import '
+        yield str(t_2(context.eval_ctx, l_1_names, ', '))
+    l_1_module = l_1_names = missing
+    yield '\n\n'
+    yield str(context.call((undefined(name='render_enums') if l_0_render_enums is missing else l_0_render_enums), (undefined(name='enums') if l_0_enums is missing else l_0_enums)))
+    yield '\n\n'
+    for l_1_block in (undefined(name='type_blocks') if l_0_type_blocks is missing else l_0_type_blocks):
+        _loop_vars = {}
+        pass
+        yield str(l_1_block)
+    l_1_block = missing
+    yield '\n\n'
+    yield str(context.call((undefined(name='render_unions') if l_0_render_unions is missing else l_0_render_unions), (undefined(name='types') if l_0_types is missing else l_0_types)))
+    yield '\n\n'
+    yield str(context.call((undefined(name='render_model_rebuilds') if l_0_render_model_rebuilds is missing else l_0_render_model_rebuilds), (undefined(name='types') if l_0_types is missing else l_0_types)))
+
+blocks = {}
+debug_info = '1=33&6=46&7=48&8=52&11=54&12=56&13=59&14=62&15=66&17=69&18=73&21=78&23=80&25=86&27=88'
\ No newline at end of file
@@ -0,0 +1,17 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'auto.py.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_package_name = resolve('package_name')
+    pass
+    yield '"""Auto-generated helpers for '
+    yield str((undefined(name='package_name') if l_0_package_name is missing else l_0_package_name))
+    yield ' - DO NOT EDIT."""\n\nimport json\nfrom typing import Any, Callable, Dict\n\n_COMPUTE: Dict[str, Callable[[Any, str, dict], Any]] = {}\n_EXPAND_CUSTOM: Dict[str, Callable[[Any, dict], Any]] = {}\n\n# Export registration functions for user convenience\n__all__ = ["register_compute_fn", "register_expand_fn", "Computable", "Expandable"]\n\nclass Computable:\n    """Mixin for types with @compute fields."""\n    def compute(self, field_name: str) -> Any:\n        """Compute value for field with @compute directive."""\n        if not hasattr(self.__class__, "model_fields"):\n            raise TypeError(f"{self.__class__.__name__} is not a Pydantic model, cannot use Computable.")\n\n        fld = self.__class__.model_fields.get(field_name)\n        if not fld:\n            raise ValueError(f"Field \'{field_name}\' not found in model {self.__class__.__name__}.")\n\n        meta = fld.json_schema_extra or {}\n        compute_meta = meta.get("compute")\n\n        if not compute_meta or not isinstance(compute_meta, dict):\n            raise ValueError(\n                f"Field \'{field_name}\' in model {self.__class__.__name__} has no valid @compute metadata."\n            )\n\n        fn_name = compute_meta.get("fn")\n        if not fn_name:\n            raise ValueError(f"Compute metadata for \'{field_name}\' is missing \'fn\'.")\n\n        return run_compute(self, field_name, compute_meta)\n\nclass Expandable:\n    """Mixin for types with @expand directive."""\n    def expand(self) -> Any:\n        """Expand this node into primitive components."""\n        if not hasattr(self.__class__, "model_fields"):\n             raise TypeError(f"{self.__class__.__name__} is not a Pydantic model, cannot use Expandable.")\n\n        expansion_data_source = getattr(self, "__expansion__", None)\n\n        if expansion_data_source is None:\n            if "result" in self.__class__.model_fields:\n                result_field_info = self.__class__.model_fields["result"]\n                meta_on_result_field = result_field_info.json_schema_extra or {}\n                expand_meta_on_field = meta_on_result_field.get("expand")\n                if expand_meta_on_field and isinstance(expand_meta_on_field, dict) and "into" in expand_meta_on_field:\n                    into_value = expand_meta_on_field["into"]\n                    if isinstance(into_value, dict):\n                        # \'into\' is already a dict - use directly\n                        expansion_data_source = into_value\n                    else:\n                        # \'into\' is still a string - parse it (backward compatibility)\n                        try:\n                            expansion_data_source = json.loads(into_value)\n                        except json.JSONDecodeError as e:\n                            raise ValueError(\n                                f"Failed to parse \'into\' JSON for field \'result\' in {self.__class__.__name__}: {e}\\n"\n                                f"Content: {into_value[:100] if isinstance(into_value, str) else str(into_value)[:100]}..."\n                            )\n                else:\n                     raise ValueError(\n                        f"Type {self.__class__.__name__} is Expandable but has no __expansion__ attribute "\n                        f"and its \'result\' field lacks valid @expand metadata."\n                    )\n            else:\n                 raise ValueError(\n                    f"Type {self.__class__.__name__} is Expandable but has no __expansion__ attribute or \'result\' field to source expansion data."\n                )\n\n        if not isinstance(expansion_data_source, dict):\n            raise ValueError(\n                f"Resolved expansion data for {self.__class__.__name__} must be a dictionary. Got: {type(expansion_data_source)}"\n            )\n\n        return run_expand(self, expansion_data_source)\n\ndef register_compute_fn(name: str):\n    def _wrap(fn):\n        _COMPUTE[name] = fn\n        return fn\n    return _wrap\n\ndef run_compute(inst, field_name: str, meta: dict):\n    fn_name = meta.get("fn")\n    if not fn_name or fn_name not in _COMPUTE:\n        raise ValueError(f"Compute function \'{fn_name}\' not registered for field \'{field_name}\'.")\n    return _COMPUTE[fn_name](inst, field_name, meta)\n\ndef register_expand_fn(name: str):\n    def _wrap(fn):\n        _EXPAND_CUSTOM[name] = fn\n        return fn\n    return _wrap\n\ndef run_expand(inst, expansion_dict_resolved: dict):\n    if "fn" in expansion_dict_resolved:\n        fn_name = expansion_dict_resolved["fn"]\n        if fn_name not in _EXPAND_CUSTOM:\n            raise ValueError(f"Custom expand function \'{fn_name}\' not registered.")\n        return _EXPAND_CUSTOM[fn_name](inst, expansion_dict_resolved)\n\n    # For default expansion, we need to detect the target class\n    # Look for the \'result\' field to get its type annotation\n    if hasattr(inst.__class__, \'model_fields\') and \'result\' in inst.__class__.model_fields:\n        from typing import get_type_hints\n        from importlib import import_module\n        try:\n            # Get the module namespace to resolve forward references\n            mod = import_module(inst.__class__.__module__)\n            ns = vars(mod)  # globalns/locals for hints\n            type_hints = get_type_hints(inst.__class__, ns, ns)\n            target_cls = type_hints.get(\'result\')\n            if target_cls:\n                return _default_expand(inst, expansion_dict_resolved, target_cls=target_cls)\n        except (ImportError, NameError, AttributeError) as e:\n            # Fallback if type hints can\'t be resolved\n            pass\n\n    # Fallback: if we can\'t determine target class, raise an error\n    raise ValueError(\n        f"Cannot determine target class for expansion of {inst.__class__.__name__}. "\n        f"Make sure the expanded field has a proper type annotation."\n    )\n\ndef _default_expand(instance: Any, expansion_template: Dict[str, Any], *, target_cls) -> Any:\n    """\n    Generic Pydantic model-based expansion engine.\n    Replaces placeholders like "$field_name" with instance attribute values.\n    Recursively builds Pydantic model instances instead of raw dictionaries.\n\n    Args:\n        instance: The model instance from which to pull placeholder values\n        expansion_template: The dictionary template guiding the expansion\n        target_cls: The Pydantic model class to instantiate\n\n    Returns:\n        Fully instantiated Pydantic model of type target_cls\n    """\n    from typing import get_args, get_origin\n    from pydantic import BaseModel, ValidationError\n\n    def _substitute_value(value, field_annotation):\n        """Recursively substitute values based on type annotation."""\n        # 1. Placeholder substitution\n        if isinstance(value, str) and value.startswith("$"):\n            attr_name = value[1:]\n            if hasattr(instance, attr_name):\n                return getattr(instance, attr_name)\n            else:\n                raise ValueError(f"Placeholder {value!r} not found on {instance.__class__.__name__}")\n\n        # 2. Recurse based on annotation\n        origin = get_origin(field_annotation) or field_annotation\n\n        # Handle List types\n        if isinstance(value, list) and origin is list:\n            args = get_args(field_annotation)\n            if args:\n                elem_type = args[0]\n                return [_substitute_value(v, elem_type) for v in value]\n            else:\n                return value\n\n        # Handle nested Pydantic models\n        if isinstance(value, dict) and isinstance(origin, type) and issubclass(origin, BaseModel):\n            return _build_model(value, origin)\n\n        # Primitive value - return as-is\n        return value\n\n    def _build_model(src_dict: dict, model_cls):\n        """Build a Pydantic model from a dictionary using field annotations."""\n        if not hasattr(model_cls, \'model_fields\'):\n            raise ValueError(f"{model_cls.__name__} is not a Pydantic model")\n\n        data = {}\n        \n        for field_name, field_info in model_cls.model_fields.items():\n            if field_name in src_dict:\n                field_annotation = field_info.annotation\n                data[field_name] = _substitute_value(src_dict[field_name], field_annotation)\n            # If field is missing and not computed, let Pydantic handle the error\n            # If field is missing and computed, it will use default=None and be computed later\n\n        # Create instance with available fields (computed fields will be None by default)\n        try:\n            instance = model_cls(**data)\n        except Exception as e:\n            raise ValueError(f"@expand could not build {model_cls.__name__}: {e}") from e\n        \n        # Now compute any computed fields that are None\n        for field_name, field_info in model_cls.model_fields.items():\n            if getattr(instance, field_name, None) is None:\n                meta = field_info.json_schema_extra or {}\n                compute_meta = meta.get("compute")\n                if compute_meta and isinstance(compute_meta, dict):\n                    try:\n                        computed_value = instance.compute(field_name)\n                        setattr(instance, field_name, computed_value)\n                    except Exception as e:\n                        raise ValueError(\n                            f"Failed to compute field \'{field_name}\' for {model_cls.__name__}. "\n                            f"Make sure the compute function \'{compute_meta.get(\'fn\')}\' is registered."\n                        ) from e\n        \n        return instance\n\n    return _build_model(expansion_template, target_cls)'
+
+blocks = {}
+debug_info = '1=13'
\ No newline at end of file
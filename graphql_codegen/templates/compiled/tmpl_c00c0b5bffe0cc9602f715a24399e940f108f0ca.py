@@ -0,0 +1,199 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'macros.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_render_enums = l_0_render_type = l_0_render_types = l_0_render_unions = l_0_render_model_rebuilds = missing
+    try:
+        t_1 = environment.filters['join']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'join' found.")
+    try:
+        t_2 = environment.filters['repr']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'repr' found.")
+    pass
+    def macro(l_1_enums):
+        t_3 = []
+        if l_1_enums is missing:
+            l_1_enums = undefined("parameter 'enums' was not provided", name='enums')
+        pass
+        for l_2_enum_info in l_1_enums:
+            _loop_vars = {}
+            pass
+            t_3.extend((
+                '\n\nclass ',
+                str(environment.getattr(l_2_enum_info, 'name')),
+                '(str, Enum):\n    """Generated from GraphQL enum ',
+                str(environment.getattr(l_2_enum_info, 'name')),
+                '."""',
+            ))
+            for l_3_value in environment.getattr(l_2_enum_info, 'values'):
+                _loop_vars = {}
+                pass
+                t_3.extend((
+                    '\n    ',
+                    str(l_3_value),
+                    ' = "',
+                    str(l_3_value),
+                    '"',
+                ))
+            l_3_value = missing
+        l_2_enum_info = missing
+        return concat(t_3)
+    context.exported_vars.add('render_enums')
+    context.vars['render_enums'] = l_0_render_enums = Macro(environment, macro, 'render_enums', ('enums',), False, False, False, context.eval_ctx.autoescape)
+    def macro(l_1_type_info):
+        t_4 = []
+        if l_1_type_info is missing:
+            l_1_type_info = undefined("parameter 'type_info' was not provided", name='type_info')
+        pass
+        if (environment.getattr(l_1_type_info, 'kind') != 'union'):
+            pass
+            t_4.extend((
+                '\n\nclass ',
+                str(environment.getattr(l_1_type_info, 'name')),
+                '(',
+                str(t_1(context.eval_ctx, environment.getattr(l_1_type_info, 'base_classes'), ', ')),
+                '):\n    """Generated from GraphQL ',
+                str(environment.getattr(l_1_type_info, 'kind')),
+                ' ',
+                str(environment.getattr(l_1_type_info, 'name')),
+                '."""',
+            ))
+            for l_2_field in environment.getattr(l_1_type_info, 'fields'):
+                _loop_vars = {}
+                pass
+                t_4.extend((
+                    '\n    ',
+                    str(environment.getattr(l_2_field, 'name')),
+                    ': ',
+                    str(environment.getattr(l_2_field, 'python_type')),
+                    ' = Field(',
+                ))
+                if context.call(environment.getattr(environment.getattr(l_2_field, 'python_type'), 'startswith'), 'Optional[', _loop_vars=_loop_vars):
+                    pass
+                    t_4.append(
+                        'default=None',
+                    )
+                elif (environment.getattr(l_2_field, 'json_schema_extra') and context.call(environment.getattr(environment.getattr(l_2_field, 'json_schema_extra'), 'get'), 'compute', _loop_vars=_loop_vars)):
+                    pass
+                    t_4.append(
+                        'default=None',
+                    )
+                else:
+                    pass
+                    t_4.append(
+                        '...',
+                    )
+                if environment.getattr(l_2_field, 'json_schema_extra'):
+                    pass
+                    t_4.extend((
+                        ', json_schema_extra=',
+                        str(t_2(environment.getattr(l_2_field, 'json_schema_extra'))),
+                    ))
+                t_4.append(
+                    ')',
+                )
+            l_2_field = missing
+            if environment.getattr(l_1_type_info, 'expansion_spec'):
+                pass
+                t_4.extend((
+                    '\n',
+                    str(environment.getattr(l_1_type_info, 'expansion_spec')),
+                ))
+            t_4.append(
+                '\n    model_config = {"protected_namespaces": ()}  # Pydantic v2 config',
+            )
+        return concat(t_4)
+    context.exported_vars.add('render_type')
+    context.vars['render_type'] = l_0_render_type = Macro(environment, macro, 'render_type', ('type_info',), False, False, False, context.eval_ctx.autoescape)
+    def macro(l_1_types):
+        t_5 = []
+        if l_1_types is missing:
+            l_1_types = undefined("parameter 'types' was not provided", name='types')
+        pass
+        for l_2_type_info in l_1_types:
+            _loop_vars = {}
+            pass
+            t_5.append(
+                str(context.call((undefined(name='render_type') if l_0_render_type is missing else l_0_render_type), l_2_type_info, _loop_vars=_loop_vars)),
+            )
+        l_2_type_info = missing
+        return concat(t_5)
+    context.exported_vars.add('render_types')
+    context.vars['render_types'] = l_0_render_types = Macro(environment, macro, 'render_types', ('types',), False, False, False, context.eval_ctx.autoescape)
+    def macro(l_1_types):
+        t_6 = []
+        if l_1_types is missing:
+            l_1_types = undefined("parameter 'types' was not provided", name='types')
+        pass
+        t_6.append(
+            '# Union type aliases',
+        )
+        l_2_loop = missing
+        for l_2_type_info, l_2_loop in LoopContext(l_1_types, undefined):
+            _loop_vars = {}
+            pass
+            if (environment.getattr(l_2_type_info, 'kind') == 'union'):
+                pass
+                t_6.extend((
+                    '\n',
+                    str(environment.getattr(l_2_type_info, 'name')),
+                    ' = Union[',
+                ))
+                l_3_loop = missing
+                for l_3_union_type, l_3_loop in LoopContext(environment.getattr(l_2_type_info, 'union_types'), undefined):
+                    _loop_vars = {}
+                    pass
+                    t_6.extend((
+                        '"',
+                        str(l_3_union_type),
+                        '"',
+                    ))
+                    if (not environment.getattr(l_3_loop, 'last')):
+                        pass
+                        t_6.append(
+                            ', ',
+                        )
+                l_3_loop = l_3_union_type = missing
+                t_6.append(
+                    ']',
+                )
+        l_2_loop = l_2_type_info = missing
+        return concat(t_6)
+    context.exported_vars.add('render_unions')
+    context.vars['render_unions'] = l_0_render_unions = Macro(environment, macro, 'render_unions', ('types',), False, False, False, context.eval_ctx.autoescape)
+    def macro(l_1_types):
+        t_7 = []
+        if l_1_types is missing:
+            l_1_types = undefined("parameter 'types' was not provided", name='types')
+        pass
+        t_7.append(
+            '# Rebuild models to resolve forward references and inheritance',
+        )
+        for l_2_type_info in l_1_types:
+            _loop_vars = {}
+            pass
+            if (environment.getattr(l_2_type_info, 'kind') != 'union'):
+                pass
+                t_7.extend((
+                    '\n',
+                    str(environment.getattr(l_2_type_info, 'name')),
+                    '.model_rebuild()',
+                ))
+        l_2_type_info = missing
+        return concat(t_7)
+    context.exported_vars.add('render_model_rebuilds')
+    context.vars['render_model_rebuilds'] = l_0_render_model_rebuilds = Macro(environment, macro, 'render_model_rebuilds', ('types',), False, False, False, context.eval_ctx.autoescape)
+
+blocks = {}
+debug_info = '3=24&4=29&6=34&7=36&8=39&9=44&14=54&15=59&17=63&18=67&19=72&20=77&22=107&23=111&30=119&31=124&34=134&36=143&37=146&38=150&43=175&45=183&46=186&47=190'
\ No newline at end of file
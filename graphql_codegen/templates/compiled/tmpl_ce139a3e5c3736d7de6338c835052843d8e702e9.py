@@ -0,0 +1,66 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'flat.py.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_additional_imports = resolve('additional_imports')
+    l_0_needs_computable_import = resolve('needs_computable_import')
+    l_0_needs_expandable_import = resolve('needs_expandable_import')
+    l_0_enums = resolve('enums')
+    l_0_type_blocks = resolve('type_blocks')
+    l_0_types = resolve('types')
+    l_0_render_enums = l_0_render_unions = l_0_render_model_rebuilds = missing
+    pass
+    included_template = environment.get_template('macros.j2', 'flat.py.j2')._get_default_module(context)
+    l_0_render_enums = getattr(included_template, 'render_enums', missing)
+    if l_0_render_enums is missing:
+        l_0_render_enums = undefined(f"the template {included_template.__name__!r} (imported on line 1 in 'flat.py.j2') does not export the requested name 'render_enums'", name='render_enums')
+    l_0_render_unions = getattr(included_template, 'render_unions', missing)
+    if l_0_render_unions is missing:
+        l_0_render_unions = undefined(f"the template {included_template.__name__!r} (imported on line 1 in 'flat.py.j2') does not export the requested name 'render_unions'", name='render_unions')
+    l_0_render_model_rebuilds = getattr(included_template, 'render_model_rebuilds', missing)
+    if l_0_render_model_rebuilds is missing:
+        l_0_render_model_rebuilds = undefined(f"the template {included_template.__name__!r} (imported on line 1 in 'flat.py.j2') does not export the requested name 'render_model_rebuilds'", name='render_model_rebuilds')
+    context.vars.update({'render_enums': l_0_render_enums, 'render_unions': l_0_render_unions, 'render_model_rebuilds': l_0_render_model_rebuilds})
+    context.exported_vars.difference_update(('render_enums', 'render_unions', 'render_model_rebuilds'))
+    yield '\nfrom __future__ import annotations\nfrom typing import List, Optional, Any, Dict, Union\nfrom pydantic import BaseModel, Field\nfrom enum import Enum'
+    if (undefined(name='additional_imports') if l_0_additional_imports is missing else l_0_additional_imports):
+        pass
+        for l_1_import_line in (undefined(name='additional_imports') if l_0_additional_imports is missing else l_0_additional_imports):
+            _loop_vars = {}
+            pass
+            yield '\n'
+            yield str(l_1_import_line)
+        l_1_import_line = missing
+    yield '\nimport json\n\n# Auto-generated helpers - inline for flat output\n_COMPUTE: Dict[str, Any] = {}\n_EXPAND_CUSTOM: Dict[str, Any] = {}\n\n'
+    if ((undefined(name='needs_computable_import') if l_0_needs_computable_import is missing else l_0_needs_computable_import) or (undefined(name='needs_expandable_import') if l_0_needs_expandable_import is missing else l_0_needs_expandable_import)):
+        pass
+        yield '\n# Import mixins from auto module equivalent\n'
+        if (undefined(name='needs_computable_import') if l_0_needs_computable_import is missing else l_0_needs_computable_import):
+            pass
+            yield '\nclass Computable:\n    """Mixin for types with @compute fields."""\n    def compute(self, field_name: str) -> Any:\n        """Compute value for field with @compute directive."""\n        if not hasattr(self.__class__, "model_fields"):\n            raise TypeError(f"{self.__class__.__name__} is not a Pydantic model, cannot use Computable.")\n        fld = self.__class__.model_fields.get(field_name)\n        if not fld:\n            raise ValueError(f"Field \'{field_name}\' not found in model {self.__class__.__name__}.")\n        meta = fld.json_schema_extra or {}\n        compute_meta = meta.get("compute")\n        if not compute_meta or not isinstance(compute_meta, dict):\n            raise ValueError(f"Field \'{field_name}\' in model {self.__class__.__name__} has no valid @compute metadata.")\n        fn_name = compute_meta.get("fn")\n        if not fn_name:\n            raise ValueError(f"Compute metadata for \'{field_name}\' is missing \'fn\'.")\n        return _COMPUTE[fn_name](self, field_name, compute_meta)\n'
+        yield '\n\n'
+        if (undefined(name='needs_expandable_import') if l_0_needs_expandable_import is missing else l_0_needs_expandable_import):
+            pass
+            yield '\nclass Expandable:\n    """Mixin for types with @expand directive."""\n    def expand(self) -> Any:\n        """Expand this node into primitive components."""\n        # Simplified expand implementation for flat output\n        return self\n'
+        yield '\n'
+    yield '\n\n# Registration functions\ndef register_compute_fn(name: str):\n    def _wrap(fn):\n        _COMPUTE[name] = fn\n        return fn\n    return _wrap\n\ndef register_expand_fn(name: str):\n    def _wrap(fn):\n        _EXPAND_CUSTOM[name] = fn\n        return fn\n    return _wrap\n\n'
+    yield str(context.call((undefined(name='render_enums') if l_0_render_enums is missing else l_0_render_enums), (undefined(name='enums') if l_0_enums is missing else l_0_enums)))
+    yield '\n\n'
+    for l_1_block in (undefined(name='type_blocks') if l_0_type_blocks is missing else l_0_type_blocks):
+        _loop_vars = {}
+        pass
+        yield str(l_1_block)
+    l_1_block = missing
+    yield '\n\n'
+    yield str(context.call((undefined(name='render_unions') if l_0_render_unions is missing else l_0_render_unions), (undefined(name='types') if l_0_types is missing else l_0_types)))
+    yield '\n\n'
+    yield str(context.call((undefined(name='render_model_rebuilds') if l_0_render_model_rebuilds is missing else l_0_render_model_rebuilds), (undefined(name='types') if l_0_types is missing else l_0_types)))
+    yield ' '
+
+blocks = {}
+debug_info = '1=18&6=31&7=33&8=37&17=40&19=43&39=47&62=52&64=54&66=60&68=62'
\ No newline at end of file
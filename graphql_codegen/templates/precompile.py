@@ -0,0 +1,48 @@
+"""Precompile the bundled templates into modules for jinja2.ModuleLoader.
+
+The modules in compiled/ ship in the wheel. Re-run after editing a template
+(CI fails when they are stale); it imports nothing but Jinja2:
+    python graphql_codegen/templates/precompile.py
+"""
+
+import hashlib
+from pathlib import Path
+
+import jinja2
+from jinja2 import Environment, FileSystemLoader
+
+TEMPLATE_DIR = Path(__file__).parent
+COMPILED_DIR = TEMPLATE_DIR / "compiled"
+
+
+def add_filters(env: Environment) -> None:
+    """Filters the templates use; needed both to compile and to render."""
+    env.filters["repr"] = repr
+
+
+def sources_hash(directory: Path = TEMPLATE_DIR) -> str:
+    """Hash of the template sources and Jinja release series they compile for."""
+    digest = hashlib.sha256()
+    digest.update(".".join(jinja2.__version__.split(".")[:2]).encode())
+    for path in sorted(directory.glob("*.j2")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def compile_bundled_templates(target: Path = COMPILED_DIR) -> None:
+    """Write one module per bundled template, plus the hash they came from."""
+    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+    add_filters(env)
+    target.mkdir(exist_ok=True)
+    for stale in target.glob("tmpl_*.py"):
+        stale.unlink()
+    env.compile_templates(str(target), extensions=["j2"], zip=None, ignore_errors=False)
+    (target / "__init__.py").write_text(
+        '"""Precompiled templates - DO NOT EDIT."""\n\n'
+        f'SOURCES_HASH = "{sources_hash()}"\n'
+    )
+
+
+if __name__ == "__main__":
+    compile_bundled_templates()
@@ -0,0 +1,143 @@
+"""Wall and CPU time, and optionally memory, of each generation phase.
+
+Phases are timed only inside a recording(), so instrumented code costs
+nothing measurable outside one. CPU time is this process's; work done in
+render worker processes shows up as wall time only.
+
+A recording(memory=True) also traces each phase's allocations with
+tracemalloc. That slows phases down severalfold, so it is opt-in. Tracing
+runs only inside phases, so imports and glue code between them stay fast.
+"""
+
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+# Frames kept per allocation, enough to find the codegen caller of a library
+TRACE_FRAMES = 32
+TOP_SITES = 5
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class AllocationSite(BaseModel):
+    """A codegen source line and the memory its phase left allocated there."""
+
+    site: str  # path relative to the package's parent, with line number
+    kib: float
+    count: int
+
+
+class PhaseMemory(BaseModel):
+    """Memory allocated by one phase, in KiB."""
+
+    peak_kib: float  # most the phase had allocated at once
+    retained_kib: float  # what it allocated that is still alive at its end
+    top_sites: List[AllocationSite] = []
+
+
+class PhaseTiming(BaseModel):
+    """Time spent in one phase, in milliseconds."""
+
+    name: str
+    wall_ms: float
+    cpu_ms: float
+    memory: Optional[PhaseMemory] = None
+
+
+_phases: ContextVar[Optional[List[PhaseTiming]]] = ContextVar(
+    "codegen_phases", default=None
+)
+_trace_memory: ContextVar[bool] = ContextVar("codegen_trace_memory", default=False)
+
+
+@contextmanager
+def recording(memory: bool = False) -> Iterator[List[PhaseTiming]]:
+    """Collect the phases timed inside the block, in the order they finish.
+
+    Nested recordings share the outermost one's list and memory setting, so
+    a caller can time its own phases around a generation and get one report.
+    """
+    phases = _phases.get()
+    if phases is not None:
+        yield phases
+        return
+    phases = []
+    token = _phases.set(phases)
+    memory_token = _trace_memory.set(memory)
+    try:
+        yield phases
+    finally:
+        _trace_memory.reset(memory_token)
+        _phases.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time the block as one phase of the current recording, if any."""
+    phases = _phases.get()
+    if phases is None:
+        yield
+        return
+    trace_memory = _trace_memory.get()
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(TRACE_FRAMES)
+    elif trace_memory:
+        # Each phase traces only its own allocations, which keeps snapshots
+        # small; a nested phase therefore hides the outer phase's earlier ones
+        tracemalloc.clear_traces()
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall_ms = (time.perf_counter() - wall) * 1000
+        cpu_ms = (time.process_time() - cpu) * 1000
+        phases.append(
+            PhaseTiming(
+                name=name,
+                wall_ms=wall_ms,
+                cpu_ms=cpu_ms,
+                memory=_phase_memory() if trace_memory else None,
+            )
+        )
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _phase_memory() -> PhaseMemory:
+    size, peak = tracemalloc.get_traced_memory()
+    return PhaseMemory(
+        peak_kib=peak / 1024,
+        retained_kib=size / 1024,
+        top_sites=_top_sites(tracemalloc.take_snapshot().statistics("traceback")),
+    )
+
+
+def _top_sites(statistics: List[tracemalloc.Statistic]) -> List[AllocationSite]:
+    """Group live allocations by the innermost codegen frame that made them."""
+    sites: Dict[str, List[int]] = {}
+    for statistic in statistics:
+        frame = next(
+            (
+                f
+                for f in reversed(statistic.traceback)
+                if f.filename.startswith(PACKAGE_DIR)
+            ),
+            None,
+        )
+        if frame is None or frame.filename == __file__:
+            continue
+        relative = os.path.relpath(frame.filename, os.path.dirname(PACKAGE_DIR))
+        totals = sites.setdefault(f"{relative}:{frame.lineno}", [0, 0])
+        totals[0] += statistic.size
+        totals[1] += statistic.count
+    top = sorted(sites.items(), key=lambda item: -item[1][0])[:TOP_SITES]
+    return [
+        AllocationSite(site=site, kib=size / 1024, count=count)
+        for site, (size, count) in top
+    ]
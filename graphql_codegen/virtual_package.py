@@ -0,0 +1,102 @@
+"""Import a generated package straight from the file map of generate_from_sdl.
+
+    files = generate_from_sdl(sdl, config)
+    with load_package(files, config.package) as package:
+        models = importlib.import_module(f"{config.package}.gen.models")
+
+Each directory in the map is a package (with an empty __init__ unless the
+map has one) and each .py file a module, under the given package name.
+Tracebacks show the generated source lines.
+"""
+
+import importlib
+import importlib.abc
+import importlib.util
+import linecache
+import sys
+from contextlib import contextmanager
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Dict, Iterator, Optional, Sequence
+
+
+class VirtualPackageFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Finds and loads the modules of one package from a map of file texts."""
+
+    def __init__(self, package: str, files: Dict[str, str]):
+        self.package = package
+        self.files = files
+        self.directories = {
+            "/".join(parts[:i])
+            for parts in (path.split("/") for path in files)
+            for i in range(len(parts))
+        }
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]] = None,
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        if fullname != self.package and not fullname.startswith(self.package + "."):
+            return None
+        relative = fullname[len(self.package) + 1 :].replace(".", "/")
+        if relative in self.directories:
+            spec = importlib.util.spec_from_loader(fullname, self, is_package=True)
+        elif f"{relative}.py" in self.files:
+            spec = importlib.util.spec_from_loader(fullname, self)
+        else:
+            return None
+        if spec is not None:
+            spec.origin = self.filename(fullname)
+            spec.has_location = True
+        return spec
+
+    def exec_module(self, module: ModuleType) -> None:
+        source = self.get_source(module.__name__)
+        filename = self.filename(module.__name__)
+        # Let tracebacks and inspect find the generated lines
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(keepends=True),
+            filename,
+        )
+        exec(compile(source, filename, "exec"), module.__dict__)
+
+    def get_source(self, fullname: str) -> str:
+        relative = fullname[len(self.package) + 1 :].replace(".", "/")
+        if relative in self.directories:
+            return self.files.get(f"{relative}/__init__.py".lstrip("/"), "")
+        return self.files[f"{relative}.py"]
+
+    def filename(self, fullname: str) -> str:
+        """A made-up path for fullname, unique to this package's file map."""
+        relative = fullname[len(self.package) + 1 :].replace(".", "/")
+        if relative in self.directories:
+            relative = f"{relative}/__init__".lstrip("/")
+        return f"<{self.package}:{id(self.files):x}>/{relative}.py"
+
+
+@contextmanager
+def load_package(files: Dict[str, str], package: str) -> Iterator[ModuleType]:
+    """Import package from files for the duration of the block.
+
+    Afterwards the package's modules are removed from sys.modules again, so
+    the next map can be loaded under the same name.
+
+    Raises:
+        ImportError: if a module of that name is already imported
+    """
+    if package in sys.modules:
+        raise ImportError(f"Module '{package}' is already imported")
+    finder = VirtualPackageFinder(package, files)
+    sys.meta_path.insert(0, finder)
+    try:
+        yield importlib.import_module(package)
+    finally:
+        sys.meta_path.remove(finder)
+        for name in [n for n in sys.modules if n.partition(".")[0] == package]:
+            del sys.modules[name]
+        for name in [n for n in linecache.cache if n.startswith(f"<{package}:")]:
+            del linecache.cache[name]
@@ -0,0 +1,76 @@
+"""Poll a schema directory's inputs and regenerate when they change."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .config import CodegenConfig
+from .schema_files import schema_files_root
+
+Snapshot = Dict[Path, Tuple[int, int]]
+
+
+def watched_paths(schema_dir: Path, config: CodegenConfig) -> List[Path]:
+    """Files and directories whose contents feed a generation."""
+    paths = [schema_dir / "codegen.yaml", schema_dir / "schema.graphql"]
+    if config.schema_files:
+        paths.append(schema_files_root(schema_dir, config.schema_files))
+    if config.base_schema:
+        paths.append(Path(config.base_schema))
+    if config.templates:
+        paths.append(Path(config.templates))
+    return paths
+
+
+def snapshot(paths: List[Path]) -> Snapshot:
+    """(mtime_ns, size) of every existing file under paths."""
+    stats: Snapshot = {}
+    for path in paths:
+        files = sorted(path.rglob("*")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                stat = file.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if not file.is_dir():
+                stats[file] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def watch(
+    get_paths: Callable[[], List[Path]],
+    on_change: Callable[[], None],
+    interval: float = 0.1,
+    debounce: float = 0.2,
+    stop: Optional[threading.Event] = None,
+) -> None:
+    """Call on_change once at start and again after each burst of changes.
+
+    A burst ends once the inputs have been stable for debounce seconds, so an
+    editor's save (truncate, write, rename) triggers a single regeneration.
+    get_paths is re-read after every run since the config can move inputs.
+    """
+    stop = stop or threading.Event()
+    paths = get_paths()
+    seen = snapshot(paths)
+    on_change()
+    while not stop.wait(interval):
+        current = snapshot(paths)
+        if current == seen:
+            continue
+        settled_at = time.monotonic() + debounce
+        while time.monotonic() < settled_at:
+            if stop.wait(interval):
+                return
+            latest = snapshot(paths)
+            if latest != current:
+                current = latest
+                settled_at = time.monotonic() + debounce
+        # Compare against the inputs this run saw, so saves during it count
+        seen = current
+        on_change()
+        new_paths = get_paths()
+        if new_paths != paths:
+            paths = new_paths
+            seen = snapshot(paths)
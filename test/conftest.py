@@ -0,0 +1,42 @@
+"""Shared fixtures: a cache private to each test, and copies of the inputs."""
+
+import shutil
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+INPUTS = Path(__file__).parent / "inputs"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point every codegen cache at the test's own directory, never ~/.cache."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("GRAPHQL_CODEGEN_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture
+def inputs() -> Path:
+    """The input schema directories; copy one before changing it."""
+    return INPUTS
+
+
+@pytest.fixture
+def copy_input(tmp_path: Path) -> Callable[..., Path]:
+    """Copy an input directory into tmp_path, by default as tmp_path/schema.
+
+    Generated packages then land in tmp_path/<package>.
+    """
+
+    def copy(name: str, destination: str = "schema") -> Path:
+        return Path(shutil.copytree(INPUTS / name, tmp_path / destination))
+
+    return copy
+
+
+@pytest.fixture
+def schema_dir(copy_input: Callable[..., Path]) -> Path:
+    """A copy of the smoothies input."""
+    return copy_input("smoothies")
@@ -0,0 +1,19 @@
+"""Tests for batch generation of several schema directories."""
+
+from graphql_codegen.generator import generate_many
+
+
+def test_failing_target_does_not_stop_the_batch(tmp_path, copy_input):
+    dirs = [copy_input(name, f"{name}_schema") for name in ["smoothies", "userpost"]]
+    broken = tmp_path / "broken_schema"
+    broken.mkdir()
+    dirs.insert(1, broken)
+
+    batch = generate_many(dirs, workers=2)
+
+    assert [t.schema_dir for t in batch.targets] == dirs
+    assert [t.result.success for t in batch.targets] == [True, False, True]
+    assert "codegen.yaml not found" in batch.targets[1].result.error
+    assert not batch.success
+    assert (tmp_path / "smoothies" / "gen" / "models.py").exists()
+    assert (tmp_path / "userpost" / "gen" / "models.py").exists()
@@ -0,0 +1,57 @@
+"""Tests for byte-compiling generated modules after writing them."""
+
+import importlib.util
+from pathlib import Path
+
+from graphql_codegen.bytecode import FLAGS
+from graphql_codegen.config import load_config
+from graphql_codegen.generator import generate_from_directory, generation_key
+
+
+def pyc_flags(module: Path) -> int:
+    pyc = Path(importlib.util.cache_from_source(str(module)))
+    return int.from_bytes(pyc.read_bytes()[4:8], "little")
+
+
+def test_generated_modules_are_compiled_in_the_requested_mode(schema_dir):
+    config = load_config(schema_dir)
+    config.bytecode = "unchecked-hash"
+
+    result = generate_from_directory(schema_dir, override_config=config)
+    assert result.success, result.error
+    assert result.output_path is not None
+    models = result.output_path / "gen" / "models.py"
+    for module in (models, result.output_path / "gen" / "auto.py"):
+        assert pyc_flags(module) == FLAGS["unchecked-hash"]
+    assert "compile_bytecode" in [p.name for p in result.timings]
+
+    # An unchanged module keeps its .pyc, unless the mode changes
+    pyc = Path(importlib.util.cache_from_source(str(models)))
+    written_ns = pyc.stat().st_mtime_ns
+    generate_from_directory(schema_dir, override_config=config)
+    assert pyc.stat().st_mtime_ns == written_ns
+    config.bytecode = "timestamp"
+    generate_from_directory(schema_dir, override_config=config)
+    assert pyc_flags(models) == FLAGS["timestamp"]
+
+
+def test_shards_compile_in_parallel(schema_dir):
+    config = load_config(schema_dir)
+    config.bytecode = "checked-hash"
+    config.sharded_models = True
+    config.jobs = 2
+
+    result = generate_from_directory(schema_dir, override_config=config)
+    assert result.success, result.error
+    assert result.output_path is not None
+    modules = [f for f in result.files if f.endswith(".py")]
+    assert len(modules) > 2
+    for module in modules:
+        assert pyc_flags(result.output_path / module) == FLAGS["checked-hash"]
+
+
+def test_bytecode_mode_does_not_change_the_generation_key(schema_dir):
+    config = load_config(schema_dir)
+    key = generation_key("type A { a: String }", config)
+    config.bytecode = "unchecked-hash"
+    assert generation_key("type A { a: String }", config) == key
@@ -0,0 +1,66 @@
+"""Tests for the persistent generation cache."""
+
+from graphql_codegen import templates
+from graphql_codegen.cache import DiskCache
+from graphql_codegen.config import load_config
+from graphql_codegen.generator import generate_from_directory, generation_key
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.get("a") == b"12345"  # refresh "a" so "b" is the oldest
+
+    cache.put("c", b"12345")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"12345"
+    assert cache.get("c") == b"12345"
+
+
+def test_disk_cache_lists_entries_only_to_evict(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path, max_bytes=10)
+    cache.put("a", b"123")  # the first write counts what is already there
+    evictions = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, "evict", lambda: evictions.append(1) or evict())
+
+    cache.put("b", b"123")
+    cache.put("c", b"123")
+    assert evictions == []
+    cache.put("d", b"123")
+    assert evictions == [1]
+    assert cache.get("a") is None and cache.get("d") == b"123"
+
+    cache.put("e", b"1")  # the count restarts from what eviction left
+    assert evictions == [1]
+
+
+def test_unchanged_generation_is_up_to_date(tmp_path, schema_dir):
+    models = tmp_path / "smoothies" / "gen" / "models.py"
+
+    first = generate_from_directory(schema_dir)
+    second = generate_from_directory(schema_dir)
+    assert first.success and not first.up_to_date
+    assert second.success and second.up_to_date
+
+    # A deleted output is restored from the cache
+    models.unlink()
+    restored = generate_from_directory(schema_dir)
+    assert not restored.up_to_date
+    assert models.exists()
+
+    schema = schema_dir / "schema.graphql"
+    schema.write_text(schema.read_text() + "\ntype Extra {\n  a: String\n}\n")
+    changed = generate_from_directory(schema_dir)
+    assert changed.success and not changed.up_to_date
+    assert "class Extra" in models.read_text()
+
+
+def test_generation_key_covers_the_codegen_sources(monkeypatch, schema_dir):
+    config = load_config(schema_dir)
+    key = generation_key("type A { a: String }", config)
+
+    monkeypatch.setattr(templates, "code_version", lambda: "edited sources")
+    assert generation_key("type A { a: String }", config) != key
@@ -0,0 +1,79 @@
+"""Tests for the --depfile and --manifest build-system outputs."""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from graphql_codegen.cli import main
+from graphql_codegen.depfile import depfile_text
+from graphql_codegen.templates import TEMPLATE_DIR
+
+
+def read_depfile(path: Path):
+    """The targets and inputs of a one-rule depfile."""
+    target, *inputs = path.read_text().rstrip("\n").split(" \\\n")
+    return target.rstrip(":").split(" "), [line.strip() for line in inputs]
+
+
+def test_depfile_and_manifest(tmp_path, monkeypatch, schema_dir):
+    monkeypatch.chdir(tmp_path)
+    Path("templates").mkdir()
+    shutil.copy(TEMPLATE_DIR / "macros.j2", "templates")
+    with open("schema/codegen.yaml", "a") as f:
+        f.write(f"templates: {tmp_path / 'templates'}\n")
+
+    args = ["schema", "--no-server", "--depfile", "out.d", "--manifest", "out.json"]
+    result = CliRunner().invoke(main, args)
+    assert result.exit_code == 0, result.output
+
+    manifest = json.loads(Path("out.json").read_text())
+    assert manifest["package"] == "smoothies"
+    assert set(manifest["files"]) == {
+        "gen/.codegen-manifest.json",
+        "gen/auto.py",
+        "gen/models.py",
+    }
+    for relative, digest in manifest["files"].items():
+        content = (Path(manifest["output_path"]) / relative).read_bytes()
+        assert hashlib.sha256(content).hexdigest() == digest
+
+    targets, inputs = read_depfile(Path("out.d"))
+    assert targets == ["out.json"]
+    assert inputs[:3] == [
+        "schema/codegen.yaml",
+        "schema/schema.graphql",
+        "templates/macros.j2",
+    ]
+    assert str(TEMPLATE_DIR / "models.py.j2") in inputs
+
+    # Without a manifest the generated files are the targets, and they are
+    # touched when an input changed without changing them
+    edited = Path("schema/codegen.yaml").stat().st_mtime_ns
+    earlier = edited // 10**9 - 60
+    os.utime("smoothies/gen/models.py", (earlier, earlier))
+    result = CliRunner().invoke(main, ["schema", "--no-server", "--depfile", "out.d"])
+    assert result.exit_code == 0, result.output
+    targets, _ = read_depfile(Path("out.d"))
+    assert "smoothies/gen/models.py" in targets
+    for target in targets:
+        assert Path(target).stat().st_mtime_ns >= edited
+
+
+def test_depfile_escapes_make_syntax(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    text = depfile_text([Path("out.json")], [Path("my schema/$x#1.graphql")])
+    assert text == "out.json: \\\n  my\\ schema/$$x\\#1.graphql\n"
+
+
+def test_build_files_need_a_single_directory_written_to_disk(inputs):
+    smoothies, userpost = str(inputs / "smoothies"), str(inputs / "userpost")
+    for args in (
+        [smoothies, "--stdout", "--depfile", "out.d"],
+        [smoothies, userpost, "--manifest", "m.json"],
+    ):
+        result = CliRunner().invoke(main, args)
+        assert result.exit_code == 2
@@ -0,0 +1,64 @@
+"""Tests for the validation-free fast parse path."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import SchemaShape, make_synthetic_schema
+from graphql_codegen.parser import parse_schema, validate_schema_text
+
+INPUTS = Path(__file__).parent / "inputs"
+
+EDGE_CASES = """
+directive @tag(name: String, level: Int) repeatable on OBJECT | FIELD_DEFINITION | UNION
+schema { query: Query }
+extend type Thing @tag(level: 3) { extra(limit: Int): [[Float!]]! }
+type Query { things(filter: ThingFilter, first: Int = 10): [Thing!]! node: Node }
+input ThingFilter { name: String, nested: [ThingFilter!], id: ID }
+interface Node { id: ID! }
+type Thing implements Node @tag(name: "t") { id: ID! kind: Kind meta: Meta }
+extend type Thing implements Extra
+interface Extra { extra(limit: Int): [[Float!]]! }
+enum Kind { A B }
+extend enum Kind { C }
+union Meta @tag(level: 1) = Thing | Other
+type Other { flag: Boolean @deprecated(reason: "unused") }
+extend union Meta = Query
+scalar JSON
+"""
+
+
+@pytest.mark.parametrize(
+    "schema_text",
+    [
+        (INPUTS / "smoothies" / "schema.graphql").read_text(),
+        (INPUTS / "userpost" / "schema.graphql").read_text(),
+        make_synthetic_schema(SchemaShape(types=200)),
+        EDGE_CASES,
+    ],
+    ids=["smoothies", "userpost", "synthetic", "edge-cases"],
+)
+def test_fast_parse_matches_build_schema(schema_text):
+    assert parse_schema(schema_text, validate=False) == parse_schema(schema_text)
+
+
+def test_fast_parse_skips_validation():
+    schema_text = "type A { b: Missing }"
+
+    assert parse_schema(schema_text, validate=False).types[0].fields[0].type_name == (
+        "Missing"
+    )
+    with pytest.raises(ValueError, match="Unknown type 'Missing'"):
+        validate_schema_text(schema_text)
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_directive_flags(validate):
+    schema_text = (INPUTS / "smoothies" / "schema.graphql").read_text()
+    types = parse_schema(schema_text, validate).types_by_name
+
+    assert types["IngredientAmount"].has_compute
+    assert not types["IngredientAmount"].has_expand
+    assert types["BananaStrawberrySmoothie"].has_expand
+    assert types["BananaStrawberrySmoothie"].field_directive_names == {"expand"}
+    assert not types["Fruit"].has_compute and not types["Fruit"].has_expand
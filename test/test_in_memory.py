@@ -0,0 +1,58 @@
+"""Tests for generate_from_sdl and importing its file map with load_package."""
+
+import importlib
+import inspect
+import sys
+
+import pytest
+
+from graphql_codegen import generate_from_sdl, load_package
+from graphql_codegen.config import load_config
+from graphql_codegen.generator import generate_from_directory
+
+
+def test_files_match_what_generate_from_directory_writes(schema_dir, cache_dir):
+    config = load_config(schema_dir)
+    files = generate_from_sdl((schema_dir / "schema.graphql").read_text(), config)
+    assert not cache_dir.exists()
+
+    result = generate_from_directory(schema_dir, override_config=config)
+    assert result.success, result.error
+    assert result.output_path is not None
+    assert set(files) == set(result.files)
+    for relative, text in files.items():
+        assert (result.output_path / relative).read_text() == text
+
+    # Opting in reads the results the directory run cached
+    sdl = (schema_dir / "schema.graphql").read_text()
+    assert (cache_dir / "results").is_dir()
+    assert generate_from_sdl(sdl, config, cache=True) == files
+
+
+def test_load_package_imports_from_the_map(schema_dir):
+    sdl = (schema_dir / "schema.graphql").read_text()
+    config = load_config(schema_dir)
+    config.package = "smoothies_virtual"
+    files = generate_from_sdl(sdl, config)
+
+    with load_package(files, "smoothies_virtual") as package:
+        assert package.__name__ == "smoothies_virtual"
+        models = importlib.import_module("smoothies_virtual.gen.models")
+        smoothie = models.Smoothie(name="Green", size="SMALL", parts=[])
+        assert smoothie.size is models.Size.SMALL
+        assert "class Smoothie(BaseModel):" in inspect.getsource(models.Smoothie)
+    assert not [name for name in sys.modules if name.startswith("smoothies_virtual")]
+
+    # The same name can load another map afterwards
+    config.flat_output = True
+    flat = generate_from_sdl(sdl, config)
+    with load_package(flat, "smoothies_virtual"):
+        module = importlib.import_module("smoothies_virtual.smoothies_virtual")
+        assert module.Size.LARGE.value == "LARGE"
+
+
+def test_invalid_sdl_raises(inputs):
+    with pytest.raises(ValueError, match="Failed to parse"):
+        generate_from_sdl(
+            "type Query { broken: Missing }", load_config(inputs / "smoothies")
+        )
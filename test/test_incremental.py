@@ -0,0 +1,22 @@
+"""Tests for per-type incremental regeneration."""
+
+import json
+
+from graphql_codegen.generator import MANIFEST_NAME, generate_from_directory
+
+
+def test_only_changed_types_and_dependents_rerender(tmp_path, schema_dir):
+    first = generate_from_directory(schema_dir)
+    manifest = tmp_path / "smoothies" / "gen" / MANIFEST_NAME
+    assert "Smoothie" in json.loads(manifest.read_text())["types"]
+    assert "Smoothie" in first.changed_types
+
+    # Changing an interface re-renders it and the types implementing it
+    schema = schema_dir / "schema.graphql"
+    schema.write_text(
+        schema.read_text().replace(
+            "interface Ingredient {\n", "interface Ingredient {\n  origin: String\n"
+        )
+    )
+    second = generate_from_directory(schema_dir)
+    assert sorted(second.changed_types) == ["Addon", "Fruit", "Ingredient"]
@@ -0,0 +1,40 @@
+"""Tests for schema_lines slicing through the line index."""
+
+import os
+
+import pytest
+
+from graphql_codegen.cache import DiskCache
+from graphql_codegen.line_index import _line_offsets
+from graphql_codegen.parser import extract_schema_lines
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    path = tmp_path / "schema.graphql"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 11)))
+    return path
+
+
+def test_ranges_are_merged_in_file_order(schema_file):
+    assert extract_schema_lines(schema_file, "9-10, 2-3,1,3-4") == (
+        "line 1\nline 2\nline 3\nline 4\nline 9\nline 10\n"
+    )
+
+
+@pytest.mark.parametrize("spec", ["0", "4-2", "x", "1-", "10-11"])
+def test_invalid_ranges_are_rejected(schema_file, spec):
+    with pytest.raises(ValueError):
+        extract_schema_lines(schema_file, spec)
+
+
+def test_index_is_reused_from_disk_and_rebuilt_on_change(schema_file, tmp_path):
+    cache = DiskCache(tmp_path / "cache", 2**20)
+    assert extract_schema_lines(schema_file, "2", cache) == "line 2\n"
+
+    _line_offsets.cache_clear()  # as in a fresh process
+    assert extract_schema_lines(schema_file, "10", cache) == "line 10\n"
+
+    schema_file.write_text("first\nsecond\n")
+    os.utime(schema_file, ns=(1, 1))
+    assert extract_schema_lines(schema_file, "2", cache) == "second\n"
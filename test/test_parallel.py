@@ -0,0 +1,39 @@
+"""Tests for parallel rendering."""
+
+from graphql_codegen import generator
+from graphql_codegen.config import CodegenConfig
+from graphql_codegen.generator import render_files
+
+from .test_scaling import make_schema_info
+
+
+def parallel_config() -> CodegenConfig:
+    return CodegenConfig(
+        package="parallel",
+        runtime_package="parallel.runtime",
+        codegen_version="0.1",
+        cache=False,
+    )
+
+
+def test_parallel_render_is_byte_identical(monkeypatch):
+    monkeypatch.setattr(generator, "MIN_BLOCKS_PER_WORKER", 10)
+    schema_info = make_schema_info(200)
+    config = parallel_config()
+
+    serial = render_files(config, schema_info)
+    config.jobs = 2
+    parallel = render_files(config, schema_info)
+
+    assert parallel == serial
+
+
+def test_few_pending_blocks_render_in_process(monkeypatch):
+    def no_pool(*args):
+        raise AssertionError("started workers for a small render")
+
+    monkeypatch.setattr(generator, "render_types_in_parallel", no_pool)
+    config = parallel_config()
+    for jobs in (0, 4):
+        config.jobs = jobs
+        render_files(config, make_schema_info(200))
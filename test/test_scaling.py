@@ -0,0 +1,78 @@
+"""Scaling test: collecting types must stay linear in schema size."""
+
+from graphql_codegen.config import CodegenConfig
+from graphql_codegen.generator import collect_types
+from graphql_codegen.parser import FieldInfo, SchemaInfo, TypeInfo
+
+
+def make_schema_info(type_count: int) -> SchemaInfo:
+    """Chain of object types implementing one of ten interfaces."""
+    interfaces = [
+        TypeInfo(
+            name=f"Node{i}",
+            kind="interface",
+            fields=[FieldInfo(name="id", type_name="ID", is_required=True)],
+        )
+        for i in range(10)
+    ]
+    objects = [
+        TypeInfo(
+            name=f"Type{i}",
+            interfaces=[f"Node{i % 10}"],
+            fields=[
+                FieldInfo(name="id", type_name="ID", is_required=True),
+                FieldInfo(name="label", type_name="String"),
+                FieldInfo(name="next", type_name=f"Type{(i + 1) % type_count}"),
+            ],
+        )
+        for i in range(type_count)
+    ]
+    return SchemaInfo(types=interfaces + objects, scalars=["ID", "String"])
+
+
+class CountingList(list):
+    """A list that counts how often it is iterated."""
+
+    iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+def scans_of_types(type_count: int, config: CodegenConfig) -> int:
+    """How many times collect_types iterates over every type of the schema."""
+    schema_info = make_schema_info(type_count)
+    schema_info.types = types = CountingList(schema_info.types)
+    collect_types(schema_info, config, for_stdout=True)
+    return types.iterations
+
+
+def test_collect_types_scans_the_types_a_fixed_number_of_times():
+    config = CodegenConfig(
+        package="scaling",
+        runtime_package="scaling.runtime",
+        codegen_version="0.1",
+        scalars={"ID": "str", "String": "str"},
+    )
+    scans = {size: scans_of_types(size, config) for size in (10, 100, 1_000)}
+
+    # A scan per interface or per field lookup would grow with the size
+    assert len(set(scans.values())) == 1, scans
+    assert scans[10] <= 3, scans
+
+
+def test_schema_indexes():
+    schema_info = make_schema_info(100)
+
+    assert schema_info.types_by_name["Type3"].interfaces == ["Node3"]
+    assert schema_info.inherited_field_names["Type3"] == {"id"}
+    assert schema_info.enums_by_name == {}
+
+
+def test_ir_instances_are_slotted():
+    schema_info = make_schema_info(1)
+
+    # Per-instance dicts would roughly double the IR's memory on large schemas
+    for node in [schema_info.types[0], schema_info.types[0].fields[0]]:
+        assert not hasattr(node, "__dict__")
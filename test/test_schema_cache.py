@@ -0,0 +1,59 @@
+"""Tests for the persistent SchemaInfo parse cache."""
+
+import marshal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import SchemaShape, make_synthetic_schema
+from graphql_codegen.cache import DiskCache
+from graphql_codegen.parser import parse_schema
+from graphql_codegen.schema_cache import (
+    decode_schema_info,
+    encode_schema_info,
+    parse_schema_cached,
+)
+
+INPUTS = Path(__file__).parent / "inputs"
+
+
+@pytest.mark.parametrize(
+    "schema_text",
+    [
+        (INPUTS / "userpost" / "schema.graphql").read_text(),
+        make_synthetic_schema(SchemaShape(types=100)),
+    ],
+    ids=["userpost", "synthetic"],
+)
+def test_encoding_round_trips(schema_text):
+    schema_info = parse_schema(schema_text)
+
+    assert decode_schema_info(encode_schema_info(schema_info)) == schema_info
+
+
+def test_entries_from_another_format_version_are_ignored():
+    assert decode_schema_info(marshal.dumps((0, [], [], []))) is None
+    assert decode_schema_info(b"not marshal") is None
+
+
+def test_cache_hit_does_not_import_graphql(tmp_path):
+    schema_text = (INPUTS / "smoothies" / "schema.graphql").read_text()
+    parse_schema_cached(schema_text, True, DiskCache(tmp_path, 2**20))
+
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from graphql_codegen.cache import DiskCache\n"
+        "from graphql_codegen.schema_cache import parse_schema_cached\n"
+        f"text = Path({str(INPUTS / 'smoothies' / 'schema.graphql')!r}).read_text()\n"
+        f"info = parse_schema_cached(text, True, DiskCache(Path({str(tmp_path)!r}), 2**20))\n"
+        "assert info.types, info\n"
+        "print('graphql' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,140 @@
+"""Tests for schemas split over several SDL files."""
+
+from pathlib import Path
+
+import pytest
+
+from graphql_codegen import fast_parse, schema_cache
+from graphql_codegen.cache import DiskCache
+from graphql_codegen.config import load_config
+from graphql_codegen.generator import generate_from_directory
+from graphql_codegen.parser import parse_schema
+from graphql_codegen.schema_files import (
+    join_schema_files,
+    parse_schema_files,
+    read_schema_files,
+)
+
+EXTENSION = "extend type Smoothie { notes: [String!] }\n"
+
+
+@pytest.fixture
+def split_smoothies(inputs):
+    """Write the smoothies schema into a directory as three files.
+
+    The last of them extends a type defined in the second.
+    """
+    base, main = (
+        (inputs / "smoothies" / "schema.graphql").read_text().split("# Main Types")
+    )
+
+    def split(schema_dir: Path) -> None:
+        types = schema_dir / "types"
+        (types / "main").mkdir(parents=True)
+        (types / "base.graphql").write_text(base)
+        (types / "main" / "smoothies.graphql").write_text(main)
+        (types / "main" / "zz_extensions.graphql").write_text(EXTENSION)
+
+    return split
+
+
+@pytest.mark.parametrize("pattern", ["types", "types/**/*.graphql"])
+def test_files_merge_like_one_document(tmp_path, pattern, split_smoothies):
+    split_smoothies(tmp_path)
+    files = read_schema_files(tmp_path, pattern)
+    assert [name for name, _ in files] == [
+        "types/base.graphql",
+        "types/main/smoothies.graphql",
+        "types/main/zz_extensions.graphql",
+    ]
+
+    joined = parse_schema(join_schema_files(files))
+    assert parse_schema_files(files, None) == joined
+    assert parse_schema_files(files, None, jobs=2) == joined
+    assert joined.types_by_name["Smoothie"].fields[-1].name == "notes"
+
+
+def test_only_changed_files_are_parsed_again(tmp_path, monkeypatch, split_smoothies):
+    split_smoothies(tmp_path)
+    cache = DiskCache(tmp_path / "cache", 2**20)
+    parsed = []
+    parse_fragment = fast_parse.parse_fragment
+    monkeypatch.setattr(
+        fast_parse,
+        "parse_fragment",
+        lambda text: parsed.append(text) or parse_fragment(text),
+    )
+
+    first = parse_schema_files(read_schema_files(tmp_path, "types"), cache)
+    assert len(parsed) == 3
+    extension = tmp_path / "types" / "main" / "zz_extensions.graphql"
+    extension.write_text(EXTENSION.replace("notes", "remarks"))
+    second = parse_schema_files(read_schema_files(tmp_path, "types"), cache)
+
+    assert parsed[3:] == [extension.read_text()]
+    assert first.types_by_name["Smoothie"].fields[-1].name == "notes"
+    assert second.types_by_name["Smoothie"].fields[-1].name == "remarks"
+
+
+def test_errors_name_the_files(tmp_path, split_smoothies):
+    split_smoothies(tmp_path)
+    (tmp_path / "types" / "dup.graphql").write_text("enum Size { TINY }\n")
+    with pytest.raises(ValueError, match="'Size' is defined in both types/base"):
+        parse_schema_files(read_schema_files(tmp_path, "types"), None)
+
+    (tmp_path / "types" / "dup.graphql").write_text("type {")
+    with pytest.raises(ValueError, match="types/dup.graphql: Failed to parse"):
+        parse_schema_files(read_schema_files(tmp_path, "types"), None)
+
+
+def test_duplicates_are_reported_by_file_before_validation(schema_dir, split_smoothies):
+    (schema_dir / "schema.graphql").unlink()
+    split_smoothies(schema_dir)
+    (schema_dir / "types" / "dup.graphql").write_text("enum Size { TINY }\n")
+    config = load_config(schema_dir)
+    config.schema_files = "types"
+
+    for fast_parse_mode in (False, True):
+        config.fast_parse = fast_parse_mode
+        result = generate_from_directory(schema_dir, override_config=config)
+        assert not result.success
+        assert "'Size' is defined in both types/base" in str(result.error)
+
+
+def test_validation_is_cached_by_content(schema_dir, split_smoothies, monkeypatch):
+    (schema_dir / "schema.graphql").unlink()
+    split_smoothies(schema_dir)
+    config = load_config(schema_dir)
+    config.schema_files = "types"
+    validated = []
+    validate = schema_cache.validate_schema_text
+    monkeypatch.setattr(
+        schema_cache,
+        "validate_schema_text",
+        lambda text: validated.append(text) or validate(text),
+    )
+
+    # A new package misses the results cache but not the schema cache
+    for package in ("smoothies_a", "smoothies_b"):
+        config.package = package
+        assert generate_from_directory(schema_dir, override_config=config).success
+    assert len(validated) == 1
+
+    extension = schema_dir / "types" / "main" / "zz_extensions.graphql"
+    extension.write_text(EXTENSION.replace("notes", "remarks"))
+    assert generate_from_directory(schema_dir, override_config=config).success
+    assert len(validated) == 2
+
+
+def test_generation_from_schema_files(tmp_path, schema_dir, split_smoothies):
+    (schema_dir / "schema.graphql").unlink()
+    split_smoothies(schema_dir)
+    config = load_config(schema_dir)
+    config.package = "smoothies_split"
+    config.schema_files = "types"
+
+    result = generate_from_directory(schema_dir, override_config=config)
+    assert result.success, result.error
+    models = (tmp_path / "smoothies_split" / "gen" / "models.py").read_text()
+    smoothie = models.split("class Smoothie(BaseModel):")[1].split("class ")[0]
+    assert "notes:" in smoothie
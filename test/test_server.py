@@ -0,0 +1,99 @@
+"""Tests for the generation server and client forwarding."""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from graphql_codegen import cli
+from graphql_codegen.cli import main
+from graphql_codegen.server import forward, remove_stale_socket
+
+
+def test_cli_forwards_to_running_server(
+    tmp_path, monkeypatch, schema_dir, cache_dir, copy_input
+):
+    socket_path = tmp_path / "codegen.sock"
+    monkeypatch.setenv("GRAPHQL_CODEGEN_SOCKET", str(socket_path))
+    server_cache_dir = tmp_path / "server_cache"
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "graphql_codegen.cli", "serve"],
+        stdout=subprocess.DEVNULL,
+        env={**os.environ, "GRAPHQL_CODEGEN_CACHE_DIR": str(server_cache_dir)},
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while forward(socket_path, {"ping": True}) is None:
+            assert time.monotonic() < deadline, "server did not start"
+            time.sleep(0.05)
+
+        response = forward(
+            socket_path,
+            {
+                "schema_dir": str(schema_dir),
+                "verbose": False,
+                "overrides": {"default_cache_dir": str(cache_dir)},
+            },
+        )
+        assert response is not None and response["exit_code"] == 0
+        assert response["result"]["files"] == [
+            "gen/models.py",
+            "gen/auto.py",
+            "gen/.codegen-manifest.json",
+        ]
+        assert (tmp_path / "smoothies" / "gen" / "models.py").exists()
+
+        # From here on, only the server can generate
+        local_runs = []
+        monkeypatch.setattr(cli, "run_generation", lambda *a, **k: local_runs.append(a))
+        monkeypatch.chdir(tmp_path)
+
+        # Relative paths and the cache are the client's, not the server's
+        result = CliRunner().invoke(main, ["schema", "--depfile", "out.d"])
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "out.d").read_text().startswith("smoothies/gen/models.py ")
+        assert (cache_dir / "results").is_dir()
+        assert not (server_cache_dir / "results").exists()
+
+        # The CLI replays the server's output and exit code
+        broken = copy_input("smoothies", "broken")
+        (broken / "schema.graphql").write_text("type {")
+        result = CliRunner().invoke(main, ["broken"])
+        assert result.exit_code == 1
+        assert "Failed to parse" in result.output
+
+        # Streaming runs are not forwarded, so their output is not buffered
+        for flag in ("--stdout", "--stream"):
+            CliRunner().invoke(main, ["schema", flag])
+        assert len(local_runs) == 2
+
+        # A second server leaves the live one's socket alone
+        with pytest.raises(OSError, match="already listening"):
+            remove_stale_socket(socket_path)
+        assert forward(socket_path, {"ping": True}) is not None
+    finally:
+        server.send_signal(signal.SIGINT)
+        server.wait(timeout=10)
+
+    assert not socket_path.exists()
+    assert forward(socket_path, {"ping": True}) is None
+
+
+def test_stale_socket_is_removed(tmp_path):
+    socket_path = tmp_path / "codegen.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(socket_path))  # bound but never listening, as after a crash
+    remove_stale_socket(socket_path)
+    assert not socket_path.exists()
+    remove_stale_socket(socket_path)
+
+    socket_path.write_text("not a socket")
+    with pytest.raises(OSError, match="not a socket"):
+        remove_stale_socket(socket_path)
+    assert socket_path.exists()
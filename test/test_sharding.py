@@ -0,0 +1,60 @@
+"""Tests for the sharded, lazily imported models layout."""
+
+import importlib
+import sys
+
+from graphql_codegen.config import load_config
+from graphql_codegen.generator import generate_from_directory
+
+
+def loaded_shards() -> set:
+    return {m for m in sys.modules if m.startswith("userpost_sharded.gen.models.")}
+
+
+def test_sharded_models_import_lazily(tmp_path, monkeypatch, copy_input):
+    schema_dir = copy_input("userpost")
+    config = load_config(schema_dir)
+    config.package = "userpost_sharded"
+    config.sharded_models = True
+    config.cache = False
+    assert generate_from_directory(schema_dir, override_config=config).success
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    models = importlib.import_module("userpost_sharded.gen.models")
+
+    assert models.Role.ADMIN == "ADMIN"
+    assert loaded_shards() == {"userpost_sharded.gen.models._Role"}
+
+    # A type loads its own shard plus the shards it depends on
+    user = models.User(id="1", username="ada", role="ADMIN")
+    text_post = models.TextPost(id="2", title="t", author=user, content="c")
+    user.favouritePost = text_post
+    assert "userpost_sharded.gen.models._SearchResult" not in loaded_shards()
+    assert models.User.model_validate(user.model_dump(exclude={"favouritePost"}))
+
+
+def test_switching_layouts_removes_the_previous_one(tmp_path, monkeypatch, copy_input):
+    schema_dir = copy_input("userpost")
+    config = load_config(schema_dir)
+    config.package = "userpost_switched"
+    config.cache = False
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    for sharded in (True, False, True, False):
+        config.sharded_models = sharded
+        result = generate_from_directory(schema_dir, override_config=config)
+        assert result.success, result.error
+        assert result.output_path is not None
+        on_disk = {
+            str(path.relative_to(result.output_path))
+            for path in (result.output_path / "gen").rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        }
+        assert on_disk == set(result.files)
+
+        for name in [m for m in sys.modules if m.startswith("userpost_switched")]:
+            monkeypatch.delitem(sys.modules, name)
+        importlib.invalidate_caches()
+        models = importlib.import_module("userpost_switched.gen.models")
+        assert hasattr(models, "__path__") is sharded
+        assert models.Role.ADMIN == "ADMIN"
@@ -0,0 +1,55 @@
+"""Import-time regression tests for CLI startup, based on `python -X importtime`.
+
+Timings vary by machine, so rather than timing anything these pin which heavy
+dependencies each kind of invocation imports at all.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+from graphql_codegen import __version__
+
+HEAVY = {"graphql", "jinja2", "pydantic", "yaml"}
+MAIN = "from graphql_codegen.cli import main; main()"
+
+
+def import_times(*args: str, **kwargs) -> Dict[str, float]:
+    """Run the CLI with args under -X importtime; cumulative ms per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", MAIN, *args],
+        capture_output=True,
+        text=True,
+        **kwargs,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def test_help_and_version_import_no_heavy_dependencies():
+    for args in (["--help"], ["--version"], ["generate", "--help"]):
+        times = import_times(*args)
+        assert not HEAVY & set(times), args
+        assert "graphql_codegen.generator" not in times
+
+    version = subprocess.run(
+        [sys.executable, "-c", MAIN, "--version"],
+        capture_output=True,
+        text=True,
+    )
+    assert version.stdout == f"graphql-codegen, version {__version__}\n"
+
+
+def test_cached_run_skips_parsing_and_templates(tmp_path, schema_dir):
+    args = ["generate", str(schema_dir), "--no-server"]
+
+    first = import_times(*args, cwd=tmp_path)
+    assert {"graphql", "jinja2"} <= set(first)
+    cached = import_times(*args, cwd=tmp_path)
+    assert not {"graphql", "jinja2"} & set(cached)
@@ -0,0 +1,26 @@
+"""Tests for streaming rendering."""
+
+from graphql_codegen.config import CodegenConfig
+from graphql_codegen.generator import render_file_chunks, render_files
+
+from .test_scaling import make_schema_info
+
+
+def test_streamed_chunks_match_rendered_files():
+    schema_info = make_schema_info(50)
+    config = CodegenConfig(
+        package="streamed",
+        runtime_package="streamed.runtime",
+        codegen_version="0.1",
+        cache=False,
+        sharded_models=True,
+    )
+    rendered = render_files(config, schema_info)
+
+    config.stream = True
+    streamed = {
+        path: "".join(chunks)
+        for path, chunks in render_file_chunks(config, schema_info)
+    }
+
+    assert streamed == rendered
@@ -0,0 +1,50 @@
+"""Tests for generating only the types reachable from config roots."""
+
+import pytest
+
+from graphql_codegen.config import load_config
+from graphql_codegen.generator import generate_from_directory
+from graphql_codegen.parser import parse_schema
+from graphql_codegen.subset import reachable_names
+
+
+@pytest.fixture
+def smoothies_info(inputs):
+    return parse_schema((inputs / "smoothies" / "schema.graphql").read_text())
+
+
+def test_closure_follows_fields_interfaces_unions_and_enums(smoothies_info):
+    reached = reachable_names(smoothies_info, ["Smoothie"])
+    assert reached == {
+        "Smoothie",
+        "Size",
+        "String",
+        "Float",
+        "IngredientAmount",
+        "Blendable",
+        "Fruit",
+        "Addon",
+        "Ingredient",
+    }
+    assert "NutritionalInfo" not in reached
+
+
+def test_unknown_root_is_an_error(smoothies_info):
+    with pytest.raises(ValueError, match="Missing"):
+        reachable_names(smoothies_info, ["Smoothie", "Missing"])
+
+
+def test_generation_with_roots(tmp_path, schema_dir):
+    config = load_config(schema_dir)
+    config.package = "smoothies_subset"
+    config.roots = ["Fruit"]
+    config.cache = False
+    config.flat_output = True
+    result = generate_from_directory(schema_dir, override_config=config)
+    assert result.success, result.error
+
+    models = (tmp_path / "smoothies_subset" / "smoothies_subset.py").read_text()
+    assert "class Fruit(Ingredient" in models
+    assert "class Ingredient(" in models
+    assert "Smoothie" not in models
+    assert "Addon" not in models
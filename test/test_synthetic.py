@@ -0,0 +1,37 @@
+"""Tests for the synthetic schema generator and the scaling benchmark."""
+
+import json
+
+from benchmarks import scaling
+from benchmarks.synthetic import SchemaShape, make_synthetic_schema
+from graphql_codegen.parser import parse_schema
+
+
+def test_synthetic_schema_is_seeded_and_valid():
+    shape = SchemaShape(types=60, interface_depth=3, directive_density=0.5, seed=7)
+    text = make_synthetic_schema(shape)
+    assert text == make_synthetic_schema(shape)
+    assert text != make_synthetic_schema(SchemaShape(types=60, seed=8))
+
+    schema_info = parse_schema(text)  # validates
+    assert schema_info == parse_schema(text, validate=False)
+    objects = [t for t in schema_info.types if t.kind == "object"]
+    assert len(objects) == 60
+    assert [t.kind for t in schema_info.types].count("union") == 1
+    assert objects[0].interfaces == ["Iface0_2", "Iface0_1", "Iface0_0"]
+    assert any(t.has_compute for t in objects) and any(t.has_expand for t in objects)
+
+
+def test_scaling_benchmark_writes_comparable_results(tmp_path, capsys):
+    first = tmp_path / "first.json"
+    scaling.main(["--sizes", "20", "40", "--repeat", "1", "--output", str(first)])
+    report = json.loads(first.read_text())
+    assert [row["types"] for row in report["rows"]] == [20, 40]
+    assert set(report["rows"][0]) >= {"parse", "collect", "render", "write", "total"}
+    assert report["rows"][0]["peak_mib"] > 0
+
+    scaling.main(
+        ["--sizes", "20", "--repeat", "1", "--output", str(tmp_path / "second.json")]
+        + ["--compare", str(first)]
+    )
+    assert "total" in capsys.readouterr().out.split("vs ")[-1]
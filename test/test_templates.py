@@ -0,0 +1,74 @@
+"""Tests for the shared template environment."""
+
+from graphql_codegen.config import load_config
+from graphql_codegen.generator import generate_from_directory
+from jinja2 import Environment, FileSystemLoader, ModuleLoader
+
+from graphql_codegen.templates import get_template_env
+from graphql_codegen.templates.precompile import (
+    TEMPLATE_DIR,
+    add_filters,
+    compile_bundled_templates,
+)
+
+
+def test_environment_is_shared_and_bytecode_cached(tmp_path, schema_dir):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "hello.j2").write_text("hello {{ name }}")
+    config = load_config(schema_dir)
+    config.templates = str(templates)
+
+    env = get_template_env(config)
+    assert env.get_template("hello.j2").render(name="x") == "hello x"
+
+    assert get_template_env(config) is env
+    assert list((tmp_path / "cache" / "jinja").iterdir())
+
+
+def test_precompiled_templates_render_like_sources(tmp_path):
+    compile_bundled_templates(tmp_path)
+    compiled = Environment(loader=ModuleLoader(tmp_path))
+    source = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+
+    for env in (compiled, source):
+        add_filters(env)
+    assert compiled.get_template("auto.py.j2").render(package_name="p") == (
+        source.get_template("auto.py.j2").render(package_name="p")
+    )
+
+
+def test_custom_templates_override_bundled_ones(tmp_path, schema_dir):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "auto.py.j2").write_text("# custom helpers for {{ package_name }}\n")
+    config = load_config(schema_dir)
+    config.templates = str(templates)
+
+    assert generate_from_directory(schema_dir, override_config=config).success
+    auto = tmp_path / "smoothies" / "gen" / "auto.py"
+    assert auto.read_text() == "# custom helpers for smoothies"
+
+
+def test_overrides_calling_render_types_still_render(tmp_path, schema_dir):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    bundled = (TEMPLATE_DIR / "models.py.j2").read_text()
+    # models.py.j2 as it was before types were rendered block by block
+    (templates / "models.py.j2").write_text(
+        bundled.replace(
+            "import render_enums,", "import render_enums, render_types,"
+        ).replace(
+            "{% for block in type_blocks %}{{ block }}{% endfor %}",
+            "{{ render_types(types) }}",
+        )
+    )
+    assert "{{ render_types(types) }}" in (templates / "models.py.j2").read_text()
+    config = load_config(schema_dir)
+    assert generate_from_directory(schema_dir, override_config=config).success
+    models = tmp_path / "smoothies" / "gen" / "models.py"
+    expected = models.read_text()
+
+    config.templates = str(templates)
+    assert generate_from_directory(schema_dir, override_config=config).success
+    assert models.read_text() == expected
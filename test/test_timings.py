@@ -0,0 +1,70 @@
+"""Tests for per-phase timings and memory, and the CLI options reporting them."""
+
+import json
+import pstats
+import tracemalloc
+
+from click.testing import CliRunner
+
+from graphql_codegen.cli import main
+from graphql_codegen.generator import generate_from_directory
+from graphql_codegen.timings import phase, recording
+
+
+def test_result_lists_phase_timings(schema_dir):
+    result = generate_from_directory(schema_dir)
+    names = [p.name for p in result.timings]
+    assert names[:3] == ["load_config", "read_schema", "lookup_results"]
+    for expected in [
+        "build_schema",
+        "parse_schema_info",
+        "collect_types",
+        "render gen/models.py",
+        "write gen/models.py",
+    ]:
+        assert expected in names
+    assert all(p.wall_ms >= 0 and p.cpu_ms >= 0 for p in result.timings)
+
+    # A cache hit skips parsing and rendering
+    names = [p.name for p in generate_from_directory(schema_dir).timings]
+    assert "build_schema" not in names and "write gen/models.py" in names
+
+
+def test_phases_outside_a_recording_are_not_kept():
+    with phase("ignored"):
+        pass
+    with recording() as outer:
+        with phase("outer"):
+            with recording() as inner:
+                with phase("inner"):
+                    pass
+    assert inner is outer
+    assert [p.name for p in outer] == ["inner", "outer"]
+
+
+def test_cli_timings_and_profile(tmp_path, schema_dir):
+    profile_path = tmp_path / "out.prof"
+
+    result = CliRunner().invoke(
+        main,
+        [str(schema_dir), "--no-server", "--timings", "--profile", str(profile_path)],
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(result.stderr)
+    assert report["package"] == "smoothies" and report["success"]
+    assert report["phases"][0]["name"] == "load_config"
+    assert report["wall_ms"] >= report["phases"][0]["wall_ms"]
+    assert pstats.Stats(str(profile_path)).total_calls > 0
+
+
+def test_memory_recording_attributes_allocations(schema_dir):
+    with recording(memory=True):
+        result = generate_from_directory(schema_dir)
+    assert not tracemalloc.is_tracing()
+    by_name = {p.name: p.memory for p in result.timings}
+    assert all(memory is not None for memory in by_name.values())
+
+    parse = by_name["build_schema"]
+    assert parse.peak_kib >= parse.retained_kib > 0
+    assert parse.top_sites[0].site.startswith("graphql_codegen/parser.py:")
@@ -0,0 +1,49 @@
+"""Tests for watch mode."""
+
+import threading
+import time
+
+from click.testing import CliRunner
+
+from graphql_codegen.cli import main
+from graphql_codegen.watch import watch
+
+
+def test_burst_of_changes_regenerates_once(tmp_path):
+    schema = tmp_path / "schema.graphql"
+    schema.write_text("type A { id: ID! }")
+    runs = []
+    stop = threading.Event()
+    watcher = threading.Thread(
+        target=watch,
+        args=(lambda: [schema], lambda: runs.append(schema.read_text())),
+        kwargs=dict(interval=0.01, debounce=0.2, stop=stop),
+    )
+    watcher.start()
+    try:
+        for i in range(5):
+            time.sleep(0.02)
+            schema.write_text(f"type A {{ id: ID! n{i}: Int }}")
+        deadline = time.monotonic() + 5
+        while len(runs) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.3)
+    finally:
+        stop.set()
+        watcher.join()
+
+    assert runs == ["type A { id: ID! }", "type A { id: ID! n4: Int }"]
+
+
+def test_schema_dir_without_subcommand_generates(tmp_path):
+    (tmp_path / "codegen.yaml").write_text(
+        "package: plain\nruntime_package: plain.runtime\ncodegen_version: '0.1'\n"
+    )
+    (tmp_path / "schema.graphql").write_text("type A { id: ID! }")
+
+    result = CliRunner().invoke(
+        main, [str(tmp_path), "--stdout", "--flat", "--no-cache", "--no-server"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "class A(BaseModel):" in result.output